@@ -1,18 +1,36 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import time
 import random
 import os
-from questions import QUESTIONS
+import uuid
+import audio_store
+import question_bank
+from interview_phrases import welcome_message, next_question_message, INTERVIEWER_VOICES
+from speech_pipeline import SpeechPipeline, audio_mime, audio_queue_html, cancel_futures, presynthesize
+import eval_jobs
+import history_manager
+import question_pool
+import topic_cache
+import tracing
 
 # LLM 모듈 임포트
 try:
-    # evaluate_interview 임포트 추가
-    from llm_manager import generate_dynamic_question, get_ai_response, transcribe_audio, text_to_speech, evaluate_interview
+    from llm_manager import generate_dynamic_question, get_ai_response, get_ai_response_stream, transcribe_audio, text_to_speech
     HAS_LLM = True
 except ImportError as e:
     HAS_LLM = False
     st.error(f"LLM Module Import Error: {e}")
 
+# 오디오 재생: 브라우저의 재생 큐에 추가해서 이전 음성이 끝난 뒤 순서대로 재생
+def play_audio(audio_bytes):
+    html = audio_queue_html(audio_bytes)
+    try:
+        st.html(html, unsafe_allow_javascript=True)
+    except (TypeError, AttributeError):
+        # 구버전 Streamlit: iframe 컴포넌트로 실행 (스크립트는 window.parent 기준으로 동작)
+        components.html(html, height=0)
+
 # 음성 녹음기 라이브러리
 try:
     from streamlit_mic_recorder import mic_recorder
@@ -34,8 +52,7 @@ if "messages" not in st.session_state:
     st.session_state.current_question_index = 0
     
     # 초기: 기출 문제 중 무작위 선택
-    random_key = random.choice(list(QUESTIONS.keys()))
-    st.session_state.current_question = QUESTIONS[random_key]
+    st.session_state.current_question = question_bank.get(question_bank.random_key())
     
     # 성격 무작위 선택 (0, 1, 2 중 하나)
     st.session_state.personality_index = random.randint(0, 2)
@@ -44,8 +61,68 @@ if "messages" not in st.session_state:
 if "personality_index" not in st.session_state:
     st.session_state.personality_index = random.randint(0, 2)
 
+# 단계별 지연 추적용 세션 id (llm_manager 호출이 이 id로 기록됨, 백그라운드 작업은 제출 시점의 id를 사용)
+if "trace_session" not in st.session_state:
+    st.session_state.trace_session = uuid.uuid4().hex[:12]
+tracing.set_session(st.session_state.trace_session)
+# TRACE_METRICS_PORT를 지정한 경우에만 /metrics 엔드포인트 실행 (프로세스당 한 번)
+tracing.start_metrics_server()
+
+# 지난 질문 문답 요약 (q_index -> 요약 문자열 또는 Future)
+if "summaries" not in st.session_state:
+    st.session_state.summaries = {}
+
+# 새로고침 복원: URL에 평가 작업 id가 있으면 저장된 대화와 평가 결과를 불러옴 (다시 채점하지 않음)
+if "eval_job_id" not in st.session_state:
+    st.session_state.eval_job_id = None
+    restored_job = eval_jobs.get(st.query_params.get("eval_job", ""))
+    if restored_job:
+        st.session_state.eval_job_id = restored_job["id"]
+        st.session_state.messages = restored_job["messages"]
+        st.session_state.current_question = restored_job["question"]
+        st.session_state.current_question_index = len(restored_job["question"].get("questions", [])) - 1
+        st.session_state.evaluation = restored_job.get("result")
+
+def start_evaluation():
+    # 평가를 백그라운드 작업 큐에 제출하고 작업 id를 세션과 URL에 기록
+    try:
+        job_id = eval_jobs.submit(api_key, st.session_state.messages, st.session_state.current_question)
+    except eval_jobs.QueueFullError as e:
+        st.error(str(e))
+        return False
+    st.session_state.eval_job_id = job_id
+    st.query_params["eval_job"] = job_id
+    return True
+
 q_data = st.session_state.current_question
 
+# 질문 안내 음성 미리 합성 (st.session_state.question_audio = {"key": (문제, 목소리), "futures": {질문 번호: Future}})
+def question_audio_key():
+    return (q_data.get("title"), tuple(q_data.get("questions", [])), current_voice)
+
+def cancel_question_audio():
+    presynth = st.session_state.pop("question_audio", None)
+    if presynth:
+        cancel_futures(presynth["futures"].values())
+
+def presynthesize_question_audio():
+    # 면접이 시작되면 남은 질문의 안내 멘트를 모두 동시에 합성해 두고, 질문 전환 시 메모리에서 바로 재생
+    # 면접관 성격(목소리)이나 문제가 바뀌면 진행 중인 작업을 취소하고 새 목소리로 다시 합성
+    presynth = st.session_state.get("question_audio")
+    if presynth and presynth["key"] != question_audio_key():
+        cancel_question_audio()
+        presynth = None
+    if presynth is None:
+        presynth = st.session_state.question_audio = {"key": question_audio_key(), "futures": {}}
+    questions = q_data.get("questions", [])
+    pending = {
+        idx: next_question_message(questions[idx])
+        for idx in range(st.session_state.current_question_index + 1, len(questions))
+        if idx not in presynth["futures"]
+    }
+    voice = current_voice
+    presynth["futures"].update(presynthesize(lambda text: text_to_speech(api_key, text, voice=voice, cache=True), pending))
+
 # --- 사이드바: 설정 ---
 with st.sidebar:
     st.header("🤖 면접관 설정")
@@ -55,6 +132,8 @@ with st.sidebar:
         os.environ["OPENAI_API_KEY"] = st.secrets["OPENAI_API_KEY"]
         api_key = st.secrets["OPENAI_API_KEY"]
         st.success("✅ API Key가 설정되었습니다.")
+        # 배포용 키가 있을 때만 AI 문제 풀을 백그라운드에서 채움 (사용자 개인 키로는 하지 않음)
+        question_pool.start_refiller(api_key)
     else:
         api_key = st.text_input("OpenAI API Key:", type="password", placeholder="sk-...")
         if api_key:
@@ -67,11 +146,8 @@ with st.sidebar:
         2: "논리적이고 사실 중심 스타일"
     }
 
-    voice_map = {
-        0: "onyx",
-        1: "shimmer",
-        2: "alloy"
-    }
+    # 목소리 목록은 TTS 사전 합성(tts_cache.py --prewarm)과 공유
+    voice_map = dict(enumerate(INTERVIEWER_VOICES))
     
     selected_p_index = st.radio(
         "면접관 성격:",
@@ -93,8 +169,14 @@ with st.sidebar:
     
     # 세션 상태 초기화 함수
     def reset_session(new_question=None):
+        # 이전 문제의 미리 합성 작업 취소 (새 문제는 목소리가 정해진 뒤 다시 합성)
+        cancel_question_audio()
         st.session_state.messages = []
+        st.session_state.summaries = {}
         st.session_state.evaluation = None # 평가 결과 초기화
+        st.session_state.eval_job_id = None
+        if "eval_job" in st.query_params:
+            del st.query_params["eval_job"]
         st.session_state.current_question_index = 0
         
         # 성격도 다시 랜덤 (원한다면) - UX상 리셋시 모든게 바뀌는게 자연스러움
@@ -104,16 +186,15 @@ with st.sidebar:
             st.session_state.current_question = new_question
         else:
              # 기출 문제 중 무작위 재선택
-            random_key = random.choice(list(QUESTIONS.keys()))
-            st.session_state.current_question = QUESTIONS[random_key]
+            st.session_state.current_question = question_bank.get(question_bank.random_key())
     
     with tab1:
         question_category = st.selectbox(
             "기출 문제 주제:",
-            list(QUESTIONS.keys())
+            question_bank.keys()
         )
         if st.button("기출 문제로 시작"):
-            reset_session(QUESTIONS[question_category])
+            reset_session(question_bank.get(question_category))
             st.rerun()
             
     with tab2:
@@ -139,8 +220,24 @@ with st.sidebar:
                 
             new_topic = st.text_input("생성할 문제 주제:", placeholder=ph_text)
         
+        st.caption("즉시 출제 가능: " + ", ".join(question_pool.POOL_TOPICS[selected_mode]) + " (주제를 비워두면 이 중에서 출제)")
+        cache_stats = topic_cache.stats()
+        if cache_stats["lookups"]:
+            st.caption(f"유사 주제 캐시 적중률: {cache_stats['hit_rate']:.0%} ({cache_stats['hits']}/{cache_stats['lookups']}회, {cache_stats['entries']}개 주제)")
+        
         if st.button("새로운 문제 생성 (AI)"):
-            if not api_key:
+            # 미리 생성해 둔 문제가 있으면 바로 출제
+            pooled_q = question_pool.take(selected_mode, new_topic)
+            if pooled_q:
+                reset_session(pooled_q)
+                st.rerun()
+            elif (cached := topic_cache.lookup(selected_mode, new_topic, exclude=st.session_state.current_question)):
+                # 비슷한 주제로 이전에 생성한 문제 재사용 (지금 풀고 있는 문제는 제외 → 같은 주제로 다시 누르면 새로 생성)
+                cached_q, cached_topic, _ = cached
+                reset_session(cached_q)
+                st.toast(f"비슷한 주제('{cached_topic}')로 출제된 문제를 불러왔습니다.")
+                st.rerun()
+            elif not api_key:
                 st.error("API Key를 먼저 입력해주세요.")
             else:
                 with st.spinner(f"AI가 '{mode_selection}' 유형의 심층 문제를 출제 중입니다..."):
@@ -148,6 +245,7 @@ with st.sidebar:
                     if "error" in generated_q:
                         st.error(f"생성 실패: {generated_q['error']}")
                     else:
+                        topic_cache.store(selected_mode, new_topic, generated_q)
                         reset_session(generated_q)
                         st.rerun()
 
@@ -160,20 +258,30 @@ with st.sidebar:
         elif not api_key:
              st.error("API Key가 필요합니다.")
         else:
-            with st.spinner("면접관이 평가서를 작성하고 있습니다... (약 10초 소요)"):
-                # 평가 로직 실행
-                eval_result = evaluate_interview(
-                    api_key, 
-                    st.session_state.messages, 
-                    st.session_state.current_question
-                )
-                st.session_state.evaluation = eval_result
-                st.rerun() # 리런해서 메인 화면에 뿌림
+            # 평가는 백그라운드 작업으로 실행하고 결과는 메인 화면에서 확인
+            if start_evaluation():
+                st.rerun()
 
     if st.button("🔄 대화 초기화"):
         reset_session()
         st.rerun()
 
+    # 4. 운영자용 디버그 패널 (TRACE_DEBUG_PANEL=1): 이 세션의 단계별 지연/토큰/크기/오류
+    if tracing.TRACE_DEBUG_PANEL:
+        st.markdown("---")
+        with st.expander("🛠️ 단계별 지연 (디버그)"):
+            spans = tracing.session_spans(st.session_state.trace_session)
+            st.caption(f"세션 {st.session_state.trace_session} · 호출 {len(spans)}건")
+            if spans:
+                st.dataframe(tracing.summarize(spans), hide_index=True)
+                # 최근 호출 (최신순)
+                recent = [{k: v for k, v in span.items() if k != "session"} for span in reversed(spans[-20:])]
+                st.dataframe(recent, hide_index=True)
+
+# 면접 진행 중이면 남은 질문 안내 음성을 현재 목소리로 미리 합성 (이미 합성 중이면 건너뜀)
+if HAS_LLM and api_key and not st.session_state.get("evaluation") and not st.session_state.get("eval_job_id"):
+    presynthesize_question_audio()
+
 # --- 메인 화면 ---
 st.title("🩺 의대 면접 시뮬레이션")
 
@@ -202,16 +310,15 @@ with st.expander("📄 제시문 및 문제 보기", expanded=True):
 # [2] 첫인사 (첫 번째 질문 제시)
 if not st.session_state.messages:
     first_q = q_data['questions'][0]
-    welcome_msg = f"반갑습니다. 면접을 시작하겠습니다. 첫 번째 질문입니다.\n\n{first_q}"
-    msg_data = {"role": "assistant", "content": welcome_msg}
+    welcome_msg = welcome_message(first_q)
+    msg_data = {"role": "assistant", "content": welcome_msg, "q_index": 0}
     
     # TTS 생성 (첫 인사도 음성으로)
     if HAS_LLM and api_key:
         try:
-            # 매번 생성하면 느리거나 비용이 드니 세션에 캐싱하면 좋으나,
-            # 여기선 간단히 항상 생성 (또는 이미 생성된 걸 확인 가능하면 좋음)
-            audio_bytes = text_to_speech(api_key, welcome_msg, voice=current_voice)
-            msg_data["audio"] = audio_bytes
+            # 고정 멘트이므로 디스크 캐시 사용 (학생마다 동일)
+            audio_bytes = text_to_speech(api_key, welcome_msg, voice=current_voice, cache=True)
+            msg_data["audio_id"] = audio_store.put(audio_bytes)
         except Exception:
             pass # API 키 오류 등으로 생성 못해도 텍스트는 보여줌
             
@@ -221,13 +328,24 @@ if not st.session_state.messages:
 
 # [3] 대화 표시
 # [3] 대화 표시
+# 음성은 audio_store에 있고 메시지에는 id만 있음. 리런마다 브라우저로 보내는 음성은 가장 최근 것 하나뿐
+# (지난 음성은 '다시 듣기'를 누를 때만 보냄)
+latest_audio_idx = max((i for i, m in enumerate(st.session_state.messages) if "audio_id" in m), default=None)
 for idx, message in enumerate(st.session_state.messages):
     with st.chat_message(message["role"]):
         st.write(message["content"])
-        if "audio" in message:
-            # 가장 최근 메시지만 자동 재생 (autoplay=True)
+        if "audio_id" in message:
+            if idx == latest_audio_idx or st.button("🔊 다시 듣기", key=f"replay_{idx}"):
+                audio_bytes = audio_store.get(message["audio_id"])
+                if audio_bytes:
+                    st.audio(audio_bytes, format=audio_mime(audio_bytes))
+            # 가장 최근 메시지만 자동 재생 (재생 큐에 한 번만 추가해서 리런 시 중복 재생 방지)
             is_last = (idx == len(st.session_state.messages) - 1)
-            st.audio(message["audio"], format="audio/mp3", autoplay=is_last)
+            if is_last and not message.get("played"):
+                audio_bytes = audio_store.get(message["audio_id"])
+                if audio_bytes:
+                    play_audio(audio_bytes)
+                message["played"] = True
 
 # --- 입력 처리 (텍스트 OR 오디오) ---
 # 평가가 완료되었으면 입력창을 숨김 (면접 종료)
@@ -237,7 +355,60 @@ for idx, message in enumerate(st.session_state.messages):
 # Dynamic Container for Input Area or Next Button
 input_container = st.empty()
 
-if not st.session_state.get("evaluation"):
+# 답변 후 다음 질문으로 넘어가기 전 대기 시간 (면접관의 답변을 읽고 들을 시간)
+AUTO_ADVANCE_DELAY = 3
+
+def take_next_question_audio(next_idx, next_msg_text):
+    # 미리 합성된 음성 사용 (아직 합성 중이면 끝날 때까지 대기)
+    presynth = st.session_state.get("question_audio")
+    future = None
+    if presynth and presynth["key"] == question_audio_key():
+        future = presynth["futures"].pop(next_idx, None)
+    if future is not None and not future.cancelled():
+        try:
+            return future.result()
+        except Exception:
+            pass # 미리 합성이 실패하면 지금 합성
+    # 미리 합성된 음성이 없거나 중간에 면접관 성격(목소리)이 바뀐 경우
+    return text_to_speech(api_key, next_msg_text, voice=current_voice, cache=True)
+
+@st.fragment(run_every=1)
+def auto_advance_to_next_question():
+    st.info("⏳ 답변이 완료되었습니다. 잠시 후 다음 질문으로 넘어갑니다...")
+    
+    # Give user time to read/hear the acknowledgement
+    if time.time() - st.session_state.get("ack_time", 0) < AUTO_ADVANCE_DELAY:
+        return
+    # fragment만 다시 실행될 때도 이 세션으로 추적
+    tracing.set_session(st.session_state.trace_session)
+    
+    # 방금 끝난 질문의 문답은 백그라운드에서 요약 (다음 질문부터는 요약만 프롬프트에 포함)
+    finished_idx = st.session_state.current_question_index
+    history_manager.submit_summary(
+        api_key if HAS_LLM else None,
+        st.session_state.summaries,
+        q_data['questions'][finished_idx],
+        finished_idx,
+        st.session_state.messages
+    )
+    
+    st.session_state.current_question_index += 1
+    next_q = q_data['questions'][st.session_state.current_question_index]
+    
+    # 다음 질문 메시지 생성
+    next_msg_text = next_question_message(next_q)
+    msg_data = {"role": "assistant", "content": next_msg_text, "q_index": st.session_state.current_question_index}
+    
+    if HAS_LLM and api_key:
+        try:
+            msg_data["audio_id"] = audio_store.put(take_next_question_audio(st.session_state.current_question_index, next_msg_text))
+        except Exception:
+            pass
+    
+    st.session_state.messages.append(msg_data)
+    st.rerun()
+
+if not st.session_state.get("evaluation") and not st.session_state.get("eval_job_id"):
     # Determine state: Can we move to next question?
     # Logic: If last message is assistant (ack) and we are not at end, show Next Button.
     # Otherwise, show Input.
@@ -261,27 +432,8 @@ if not st.session_state.get("evaluation"):
 
         if show_next_button:
             # [CASE 1] Auto-Advance to Next Question (No Button)
-            st.info("⏳ 답변이 완료되었습니다. 잠시 후 다음 질문으로 넘어갑니다...")
-            
-            # Give user time to read/hear the acknowledgement
-            time.sleep(3)
-            
-            st.session_state.current_question_index += 1
-            next_q = q_data['questions'][st.session_state.current_question_index]
-            
-            # 다음 질문 메시지 생성
-            next_msg_text = f"다음 질문 드리겠습니다.\n\n{next_q}"
-            msg_data = {"role": "assistant", "content": next_msg_text}
-            
-            if HAS_LLM and api_key:
-                try:
-                    audio_bytes = text_to_speech(api_key, next_msg_text, voice=current_voice)
-                    msg_data["audio"] = audio_bytes
-                except Exception:
-                    pass
-            
-            st.session_state.messages.append(msg_data)
-            st.rerun()
+            # 대기는 브라우저 타이머(fragment run_every)로 처리해서 서버 스레드를 잡아두지 않음
+            auto_advance_to_next_question()
         
         else:
             # [CASE 2] Show Input Controls (Audio/Text)
@@ -338,49 +490,97 @@ if prompt:
 # user_input_content가 있을 때만 실행 (평가 완료 시에는 prompt/audio가 None이므로 실행 안 됨)
 if user_input_content:
     # 1. 사용자 메시지 저장
-    st.session_state.messages.append({"role": "user", "content": user_input_content})
+    answered_idx = st.session_state.current_question_index
+    st.session_state.messages.append({"role": "user", "content": user_input_content, "q_index": answered_idx})
     st.chat_message("user").write(user_input_content)
     
+    # 프롬프트에는 지난 질문 요약 + 현재 질문 문답만 보냄 (질문 수가 늘어도 턴당 토큰이 거의 일정)
+    prompt_messages = history_manager.compact_messages(
+        st.session_state.messages,
+        answered_idx,
+        st.session_state.summaries,
+        q_data.get('questions', [])
+    )
+    
     # 2. 봇 응답 로직 결정
     response_content = ""
     response_audio = None
     
     with st.chat_message("assistant"):
-        with st.spinner("면접관이 생각 중입니다..."):
-            if HAS_LLM and api_key:
-                # 마지막 질문 여부 확인
-                is_last = (st.session_state.current_question_index == len(q_data.get('questions', [])) - 1)
-                
-                # 시나리오 분기
-                response_content = get_ai_response(
+        if HAS_LLM and api_key:
+            # 마지막 질문 여부 확인
+            is_last = (st.session_state.current_question_index == len(q_data.get('questions', [])) - 1)
+            
+            # 시나리오 분기
+            # 2-1. 스트리밍 + 문장 단위 TTS 파이프라인
+            #      토큰이 도착하는 대로 표시하고, 문장이 완성될 때마다 바로 TTS를 시작해서 순서대로 재생
+            def synthesize(sentence):
+                return text_to_speech(api_key, sentence, voice=current_voice)
+            
+            audio_area = st.container()
+            pipeline = SpeechPipeline(synthesize)
+            
+            streamed = []
+            
+            def stream_with_audio():
+                for token in pipeline.tee(get_ai_response_stream(
                     api_key, 
-                    st.session_state.messages, 
+                    prompt_messages, 
                     personality, 
                     q_data,
                     is_last_question=is_last
-                )
-                
-                # 2-2. TTS
-                try:
-                    with st.spinner("면접관이 답변을 말하는 중입니다..."):
-                        response_audio = text_to_speech(api_key, response_content, voice=current_voice)
-                except Exception as e:
-                    st.error(f"TTS Error: {e}")
-            else:
-                time.sleep(1)
-                response_content = f"[Mock] API Key가 없습니다. ('{user_input_content}' 수신)"
+                )):
+                    streamed.append(token)
+                    yield token
+                    # 생성 도중 합성이 끝난 문장은 바로 재생 큐로
+                    with audio_area:
+                        for chunk in pipeline.pop_ready():
+                            play_audio(chunk)
             
+            try:
+                response_content = st.write_stream(stream_with_audio())
+            except Exception:
+                # 도중에 끊기면 이미 표시한 텍스트와 합성 중인 문장을 그대로 사용
+                response_content = "".join(streamed)
+                # 마지막 미완성 문장도 화면에 표시된 만큼 읽어줌
+                pipeline.flush()
+            if not response_content:
+                # 토큰을 하나도 받지 못한 경우에만 일반 호출로 대체 (같은 파이프라인으로 문장 단위 병렬 TTS)
+                with st.spinner("면접관이 생각 중입니다..."):
+                    response_content = get_ai_response(
+                        api_key, 
+                        prompt_messages, 
+                        personality, 
+                        q_data,
+                        is_last_question=is_last
+                    )
+                st.write(response_content)
+                for _ in pipeline.tee([response_content]):
+                    pass
+            
+            # 2-2. 남은 문장의 TTS 완료 대기 후 재생
+            with st.spinner("면접관이 답변을 말하는 중입니다..."):
+                remaining = pipeline.drain()
+            with audio_area:
+                for chunk in remaining:
+                    play_audio(chunk)
+            if pipeline.sentences and not pipeline.audio_chunks:
+                st.error("TTS Error: 음성을 생성하지 못했습니다.")
+            response_audio = pipeline.full_audio() or None
+        else:
+            with st.spinner("면접관이 생각 중입니다..."):
+                time.sleep(1)
+            response_content = f"[Mock] API Key가 없습니다. ('{user_input_content}' 수신)"
             # 텍스트 표시
             st.write(response_content)
-            # 오디오 플레이
-            if response_audio:
-                st.audio(response_audio, format="audio/mp3", autoplay=True)
     
-    # 메시지 저장 (오디오 포함)
-    msg_data = {"role": "assistant", "content": response_content}
+    # 메시지 저장 (음성은 audio_store에 두고 id만 저장, 이미 재생 큐로 재생했으므로 played 표시)
+    msg_data = {"role": "assistant", "content": response_content, "q_index": answered_idx}
     if response_audio:
-        msg_data["audio"] = response_audio
+        msg_data["audio_id"] = audio_store.put(response_audio)
+        msg_data["played"] = True
     st.session_state.messages.append(msg_data)
+    st.session_state.ack_time = time.time()
     
     # Force UI update to show "Next Question" button if applicable
     # If not the last question, rerun to update the input container state (Input -> Next Button)
@@ -395,24 +595,37 @@ if user_input_content:
     if current_idx == total_q - 1:
         # 자동 평가 실행
         if HAS_LLM and api_key:
-            with st.spinner("모든 질문이 완료되었습니다. 면접관이 평가서를 작성 중입니다... (약 10초 소요)"):
-                try:
-                    eval_result = evaluate_interview(
-                        api_key, 
-                        st.session_state.messages, 
-                        st.session_state.current_question
-                    )
-                    st.session_state.evaluation = eval_result
-                    
-                    # Force clear the input area immediately so user can't input more
-                    input_container.empty() 
-                    
-                    # DO NOT rerun here to allow audio to finish playing
-                    # st.rerun()
-                except Exception as e:
-                    st.error(f"Evaluation Error: {e}")
+            # 백그라운드 작업 큐에 제출 (진행 상황은 아래 평가 상태 영역에서 확인)
+            if start_evaluation():
+                # Force clear the input area immediately so user can't input more
+                input_container.empty() 
+                
+                # DO NOT rerun here to allow audio to finish playing
+                # st.rerun()
 
 # --- 평가 결과 표시 (대화 아래로 이동) ---
+@st.fragment(run_every=2)
+def evaluation_status():
+    # 백그라운드 평가 작업 상태를 주기적으로 확인 (스크립트 스레드는 대기하지 않음)
+    job = eval_jobs.get(st.session_state.eval_job_id)
+    if job is None or job["status"] in ("error", "lost"):
+        reason = (job and job.get("error")) or "서버가 재시작되어 평가 작업이 중단되었습니다."
+        st.error(f"평가 생성 중 오류가 발생했습니다: {reason}")
+        if st.button("🔁 다시 평가받기") and start_evaluation():
+            st.rerun()
+        return
+    if job["status"] == "done":
+        st.session_state.evaluation = job["result"]
+        st.rerun()
+    
+    position = eval_jobs.queue_position(job["id"])
+    if position:
+        st.info(f"⏳ 평가 대기 중입니다... (대기 순번 {position})")
+    else:
+        st.info("✍️ 면접관이 평가서를 작성 중입니다... (약 10초 소요)")
+    m = eval_jobs.metrics()
+    st.caption(f"평가 작업: 실행 중 {m['running']}/{m['max_workers']} · 대기 {m['queued']}/{m['max_queue']}")
+
 if st.session_state.get("evaluation"):
     st.markdown("---")
     st.info("📊 면접 평가 결과가 도착했습니다!")
@@ -420,3 +633,6 @@ if st.session_state.get("evaluation"):
         st.markdown(st.session_state.evaluation)
     # 닫기 버튼은 굳이 필요 없을 수도 있지만, 재시험 등을 위해 남겨둘 수 있음.
     # 하지만 아래에 배치되므로 '닫기'보다는 그냥 보여주는 게 나음.
+elif st.session_state.get("eval_job_id"):
+    st.markdown("---")
+    evaluation_status()
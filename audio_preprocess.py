@@ -0,0 +1,276 @@
+import io
+import logging
+import os
+import threading
+import wave
+
+import numpy as np
+
+# STT 업로드 전 음성 전처리
+# - 앞뒤 무음 제거, 모노 변환, 16 kHz 리샘플링 (Whisper는 내부적으로 16 kHz 모노를 사용하므로 인식 품질 차이 없음)
+# - soundfile이 설치되어 있으면 FLAC(무손실 압축)으로, 없으면 16-bit WAV로 인코딩
+# - mic_recorder의 WAV(보통 44.1/48 kHz)는 긴 답변일수록 업로드 크기가 몇 배로 줄어듦
+# - 해석할 수 없는 형식이면 원본을 그대로 보냄
+# - 긴 녹음은 말이 끊긴 구간에서 나눠 여러 요청으로 동시에 인식할 수 있게 함 (prepare_upload_chunks, stitch_transcripts)
+
+logger = logging.getLogger(__name__)
+
+AUDIO_PREPROCESS = os.environ.get("AUDIO_PREPROCESS", "1") != "0"
+AUDIO_TARGET_RATE = int(os.environ.get("AUDIO_TARGET_RATE", "16000"))
+# 이 값(dBFS)보다 작은 20ms 구간은 무음으로 봄
+AUDIO_SILENCE_DBFS = float(os.environ.get("AUDIO_SILENCE_DBFS", "-45"))
+# 말소리 앞뒤로 남겨 둘 여유 (첫 음절이 잘리지 않도록)
+AUDIO_PADDING_MS = int(os.environ.get("AUDIO_PADDING_MS", "200"))
+# flac | wav
+AUDIO_UPLOAD_FORMAT = os.environ.get("AUDIO_UPLOAD_FORMAT", "flac")
+
+# 이보다 긴 녹음은 조각으로 나눠 동시에 인식 (0이면 나누지 않음)
+AUDIO_CHUNK_SECONDS = float(os.environ.get("AUDIO_CHUNK_SECONDS", "30"))
+# 조각 경계는 목표 길이 직전 이 구간 안에서 가장 조용한 곳으로 정함
+AUDIO_CHUNK_SEARCH_SECONDS = float(os.environ.get("AUDIO_CHUNK_SEARCH_SECONDS", "5"))
+# 조용한 곳을 찾지 못해 말 중간에서 자를 때 양쪽 조각에 겹쳐 넣는 길이
+AUDIO_CHUNK_OVERLAP_MS = int(os.environ.get("AUDIO_CHUNK_OVERLAP_MS", "500"))
+# 구간 중앙값보다 이만큼(dB) 조용하면 말이 끊긴 곳으로 봄
+AUDIO_CHUNK_GAP_DB = 10.0
+
+FRAME_MS = 20
+PAUSE_FRAMES = 10 # 경계를 찾을 때 보는 쉼의 길이 (200ms)
+
+_lock = threading.Lock()
+_stats = {"calls": 0, "bytes_in": 0, "bytes_out": 0, "seconds_in": 0.0, "seconds_out": 0.0}
+
+def decode_wav(data):
+    # (samples[float32, -1~1, shape=(프레임, 채널)], sample_rate)
+    with wave.open(io.BytesIO(data), "rb") as w:
+        channels, width, rate = w.getnchannels(), w.getsampwidth(), w.getframerate()
+        raw = w.readframes(w.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768
+    elif width == 3:
+        # 24-bit: 3바이트를 4바이트 정수의 상위 3바이트로 옮겨서 변환
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        samples = (b[:, 0].astype(np.int32) << 8 | b[:, 1].astype(np.int32) << 16 | b[:, 2].astype(np.int32) << 24).astype(np.float32) / 2 ** 31
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2 ** 31
+    else:
+        raise ValueError(f"unsupported sample width: {width}")
+    return samples.reshape(-1, channels), rate
+
+_MP3_BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320], # MPEG-1 Layer III
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160], # MPEG-2/2.5 Layer III
+}
+
+def duration_seconds(data):
+    # 음성 길이(초): WAV/FLAC은 헤더로 정확히, mp3는 첫 프레임의 비트레이트로 추정 (알 수 없으면 0)
+    if data[:4] == b"fLaC":
+        info = data[8:26]
+        rate = int.from_bytes(info[10:13], "big") >> 4
+        total = int.from_bytes(info[13:18], "big") & ((1 << 36) - 1)
+        return total / rate if rate else 0.0
+    if data[:4] == b"RIFF":
+        try:
+            with wave.open(io.BytesIO(data), "rb") as w:
+                return w.getnframes() / w.getframerate()
+        except (wave.Error, EOFError):
+            return 0.0
+    start = 0
+    if data[:3] == b"ID3":
+        # ID3v2 태그 크기 (7비트씩 4바이트)
+        start = 10 + sum((b & 0x7F) << (7 * (3 - i)) for i, b in enumerate(data[6:10]))
+    while start + 4 <= len(data):
+        if data[start] == 0xFF and data[start + 1] & 0xE0 == 0xE0:
+            version = 1 if data[start + 1] & 0x18 == 0x18 else 2
+            bitrate = _MP3_BITRATES[version][data[start + 2] >> 4] if data[start + 2] >> 4 < 15 else 0
+            return (len(data) - start) * 8 / (bitrate * 1000) if bitrate else 0.0
+        start += 1
+    return 0.0
+
+def to_mono(samples):
+    if samples.ndim == 1:
+        return samples
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    # mean(axis=1)은 채널 축이 짧으면 느리므로 채널별 열을 더함
+    mono = samples[:, 0].copy()
+    for channel in range(1, samples.shape[1]):
+        mono += samples[:, channel]
+    return mono / samples.shape[1]
+
+def resample(samples, rate, target_rate):
+    if rate == target_rate or len(samples) == 0:
+        return samples
+    if rate % target_rate == 0:
+        # 48 kHz -> 16 kHz처럼 정수배이면 구간 평균으로 한 번에 저역 통과 + 솎아내기
+        factor = rate // target_rate
+        count = len(samples) // factor
+        return samples[:count * factor].reshape(count, factor).mean(axis=1, dtype=np.float32)
+    if rate > target_rate:
+        # 간단한 저역 통과(이동 평균)로 앨리어싱을 줄인 뒤 선형 보간
+        width = int(round(rate / target_rate))
+        if width > 1:
+            samples = np.convolve(samples, np.full(width, 1 / width, dtype=np.float32), mode="same")
+    count = int(len(samples) * target_rate / rate)
+    positions = np.arange(count) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+def frame_levels(samples, rate):
+    # 20ms 구간별 음량(dBFS)
+    frame = max(1, rate * FRAME_MS // 1000)
+    count = len(samples) // frame
+    if count == 0:
+        return np.zeros(0, dtype=np.float32), frame
+    rms = np.sqrt(np.mean(np.square(samples[:count * frame].reshape(count, frame)), axis=1))
+    return 20 * np.log10(rms + 1e-10), frame
+
+def trim_silence(samples, rate):
+    levels, frame = frame_levels(samples, rate)
+    voiced = np.flatnonzero(levels > AUDIO_SILENCE_DBFS)
+    if voiced.size == 0:
+        # 전부 무음이면 그대로 둠 (빈 파일을 보내면 API 오류)
+        return samples
+    padding = AUDIO_PADDING_MS // FRAME_MS
+    start = max(0, voiced[0] - padding) * frame
+    end = min(len(levels), voiced[-1] + 1 + padding) * frame
+    return samples[start:end]
+
+def encode_wav(samples, rate):
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+def encode(samples, rate, fmt=None):
+    # (bytes, 업로드 파일 이름) 반환. FLAC은 soundfile이 있을 때만 사용
+    fmt = fmt or AUDIO_UPLOAD_FORMAT
+    if fmt == "flac":
+        try:
+            import soundfile
+        except ImportError:
+            fmt = "wav"
+        else:
+            buf = io.BytesIO()
+            soundfile.write(buf, samples, rate, format="FLAC", subtype="PCM_16")
+            return buf.getvalue(), "input.flac"
+    return encode_wav(samples, rate), "input.wav"
+
+def _prepared(audio_bytes):
+    samples, rate = decode_wav(audio_bytes)
+    seconds_in = len(samples) / rate
+    # 목표보다 낮은 샘플링 레이트는 올리지 않음 (크기만 커짐)
+    target_rate = min(rate, AUDIO_TARGET_RATE)
+    samples = resample(trim_silence(to_mono(samples), rate), rate, target_rate)
+    return samples, target_rate, seconds_in
+
+def process(audio_bytes, fmt=None):
+    # (bytes, 파일 이름, {"seconds_in", "seconds_out"}) 반환
+    samples, rate, seconds_in = _prepared(audio_bytes)
+    data, name = encode(samples, rate, fmt)
+    return data, name, {"seconds_in": seconds_in, "seconds_out": len(samples) / rate}
+
+def split_points(samples, rate, chunk_seconds=None):
+    # 긴 녹음을 나눌 구간 목록: [(시작, 끝, 앞 조각과 겹치는지), ...] (샘플 위치)
+    # 목표 길이 직전 AUDIO_CHUNK_SEARCH_SECONDS 안에서 가장 조용한 200ms의 가운데를 경계로 사용
+    # 말이 끊긴 곳이 없으면(구간 중앙값보다 충분히 조용하지 않으면) 경계 양쪽을 겹쳐서 자름
+    chunk_seconds = AUDIO_CHUNK_SECONDS if chunk_seconds is None else chunk_seconds
+    levels, frame = frame_levels(samples, rate)
+    chunk_frames = int(chunk_seconds * 1000 / FRAME_MS)
+    search_frames = max(PAUSE_FRAMES, int(AUDIO_CHUNK_SEARCH_SECONDS * 1000 / FRAME_MS))
+    if chunk_frames <= search_frames or len(levels) <= chunk_frames + search_frames:
+        return [(0, len(samples), False)]
+
+    smoothed = np.convolve(levels, np.full(PAUSE_FRAMES, 1 / PAUSE_FRAMES), mode="same")
+    cuts = [] # (경계 프레임, 말 중간에서 잘랐는지)
+    pos = 0
+    # 마지막 조각이 너무 짧아지지 않도록 남은 길이가 목표 + 탐색 구간보다 길 때만 자름
+    while len(levels) - pos > chunk_frames + search_frames:
+        window_start = pos + chunk_frames - search_frames
+        window = smoothed[window_start:pos + chunk_frames]
+        cut = window_start + int(np.argmin(window))
+        forced = window.min() > np.median(levels[pos:pos + chunk_frames]) - AUDIO_CHUNK_GAP_DB
+        cuts.append((cut, forced))
+        pos = cut
+
+    overlap = rate * AUDIO_CHUNK_OVERLAP_MS // 1000
+    bounds = [(0, False)] + [(cut * frame, forced) for cut, forced in cuts] + [(len(samples), False)]
+    chunks = []
+    for (start, forced_start), (end, forced_end) in zip(bounds, bounds[1:]):
+        start = max(0, start - overlap) if forced_start else start
+        end = min(len(samples), end + overlap) if forced_end else end
+        chunks.append((start, end, bool(forced_start)))
+    return chunks
+
+def process_chunks(audio_bytes, fmt=None, chunk_seconds=None):
+    # ([(bytes, 파일 이름, 앞 조각과 겹치는지), ...], {"seconds_in", "seconds_out"}) 반환
+    samples, rate, seconds_in = _prepared(audio_bytes)
+    chunks = []
+    for start, end, overlapped in split_points(samples, rate, chunk_seconds):
+        data, name = encode(samples[start:end], rate, fmt)
+        chunks.append((data, name, overlapped))
+    return chunks, {"seconds_in": seconds_in, "seconds_out": len(samples) / rate}
+
+def prepare_upload(audio_bytes):
+    # transcribe_audio에서 사용: (업로드할 bytes, 파일 이름)
+    if not AUDIO_PREPROCESS:
+        return audio_bytes, "input.wav"
+    try:
+        data, name, info = process(audio_bytes)
+    except (wave.Error, EOFError, ValueError) as e:
+        # WAV가 아니거나(float WAV 등) 읽을 수 없으면 원본 전송
+        logger.info("audio preprocess skipped: %s", e)
+        return audio_bytes, "input.wav"
+    record(len(audio_bytes), len(data), info["seconds_in"], info["seconds_out"])
+    return data, name
+
+def prepare_upload_chunks(audio_bytes):
+    # 긴 녹음용: [(업로드할 bytes, 파일 이름, 앞 조각과 겹치는지), ...]
+    # 전처리를 끄거나 읽을 수 없는 형식이면 원본 한 조각
+    if not AUDIO_PREPROCESS:
+        return [(audio_bytes, "input.wav", False)]
+    try:
+        chunks, info = process_chunks(audio_bytes)
+    except (wave.Error, EOFError, ValueError) as e:
+        logger.info("audio preprocess skipped: %s", e)
+        return [(audio_bytes, "input.wav", False)]
+    record(len(audio_bytes), sum(len(c[0]) for c in chunks), info["seconds_in"], info["seconds_out"])
+    return chunks
+
+def _word_key(word):
+    return word.strip(".,!?~…\"'").lower()
+
+def stitch_transcripts(texts, overlapped, max_words=8):
+    # 조각별 인식 결과를 순서대로 이어 붙임
+    # 겹쳐서 자른 경계는 앞 조각의 끝 단어들과 뒷 조각의 첫 단어들이 같으면 한 번만 남김
+    if len(texts) == 1:
+        return texts[0]
+    result = []
+    for text, overlap in zip(texts, overlapped):
+        words = text.split()
+        if overlap and result:
+            for k in range(min(max_words, len(result), len(words)), 0, -1):
+                if [_word_key(w) for w in result[-k:]] == [_word_key(w) for w in words[:k]]:
+                    words = words[k:]
+                    break
+        result.extend(words)
+    return " ".join(result)
+
+def record(bytes_in, bytes_out, seconds_in, seconds_out):
+    with _lock:
+        _stats["calls"] += 1
+        _stats["bytes_in"] += bytes_in
+        _stats["bytes_out"] += bytes_out
+        _stats["seconds_in"] += seconds_in
+        _stats["seconds_out"] += seconds_out
+    logger.info("audio %d -> %d bytes (%.1fs -> %.1fs)", bytes_in, bytes_out, seconds_in, seconds_out)
+
+def report():
+    with _lock:
+        stats = dict(_stats)
+    stats["ratio"] = stats["bytes_in"] / stats["bytes_out"] if stats["bytes_out"] else 0.0
+    return stats
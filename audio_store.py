@@ -0,0 +1,73 @@
+import collections
+import hashlib
+import os
+import threading
+
+# 면접 음성(TTS 결과) 저장소
+# st.session_state.messages에는 음성 bytes 대신 id만 저장해서 세션 메모리와 리런마다 브라우저로 보내는 양을 줄임
+# - 메모리: 프로세스 전체에서 AUDIO_STORE_MAX_MB까지 보관, 넘으면 가장 오래 사용하지 않은 음성부터 제거 (LRU)
+# - 디스크: AUDIO_STORE_DIR을 지정하면 파일로도 저장해서 메모리에서 밀려난 음성도 다시 읽을 수 있음
+# 내용이 같으면(고정 멘트 등) id가 같으므로 세션이 여러 개여도 한 번만 보관
+
+AUDIO_STORE_MAX_MB = float(os.environ.get("AUDIO_STORE_MAX_MB", "64"))
+AUDIO_STORE_DIR = os.environ.get("AUDIO_STORE_DIR")
+
+_lock = threading.Lock()
+_clips = collections.OrderedDict() # id -> bytes (최근 사용 순)
+_size = 0
+
+def _path(audio_id):
+    return os.path.join(AUDIO_STORE_DIR, audio_id[:2], audio_id + ".bin")
+
+def _remember(audio_id, audio_bytes):
+    global _size
+    with _lock:
+        if audio_id in _clips:
+            _clips.move_to_end(audio_id)
+            return
+        _clips[audio_id] = audio_bytes
+        _size += len(audio_bytes)
+        while _size > AUDIO_STORE_MAX_MB * 1024 * 1024 and len(_clips) > 1:
+            _, evicted = _clips.popitem(last=False)
+            _size -= len(evicted)
+
+def put(audio_bytes):
+    # 저장 후 id 반환
+    audio_id = hashlib.sha256(audio_bytes).hexdigest()[:32]
+    _remember(audio_id, audio_bytes)
+    if AUDIO_STORE_DIR:
+        path = _path(audio_id)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(audio_bytes)
+            os.replace(tmp_path, path)
+    return audio_id
+
+def get(audio_id):
+    # 없으면(메모리에서 밀려났고 디스크에도 없으면) None
+    with _lock:
+        audio_bytes = _clips.get(audio_id)
+        if audio_bytes is not None:
+            _clips.move_to_end(audio_id)
+            return audio_bytes
+    if AUDIO_STORE_DIR:
+        try:
+            with open(_path(audio_id), "rb") as f:
+                audio_bytes = f.read()
+        except FileNotFoundError:
+            return None
+        _remember(audio_id, audio_bytes)
+        return audio_bytes
+    return None
+
+def stats():
+    with _lock:
+        return {"clips": len(_clips), "bytes": _size}
+
+def clear():
+    global _size
+    with _lock:
+        _clips.clear()
+        _size = 0
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import os
+import time
+
+import llm_manager
+import llm_manager_async as llm
+from mock_openai_server import start_server_process
+
+# 비동기 API 부하 테스트: 하나의 이벤트 루프에서 여러 면접 세션을 동시에 실행
+# 세션 1개 = 첫인사 TTS + (STT -> 면접관 답변 -> 답변 TTS -> 다음 질문 TTS) x 질문 수 + 평가
+
+API_KEY = "sk-mock"
+QUESTION = {
+    "title": "부하 테스트용 문제",
+    "context": "[제시문 가] 부하 테스트용 제시문",
+    "questions": ["질문 1", "질문 2", "질문 3"],
+    "key_points": []
+}
+FAKE_WAV = b"RIFF" + b"\x00" * 32000
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+async def timed(stats, stage, coro):
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        stats.setdefault(stage, []).append(time.perf_counter() - start)
+
+async def run_session(stats):
+    messages = []
+    await timed(stats, "tts", llm.text_to_speech(API_KEY, "반갑습니다. 면접을 시작하겠습니다."))
+    for idx, _ in enumerate(QUESTION["questions"]):
+        answer = await timed(stats, "stt", llm.transcribe_audio(API_KEY, FAKE_WAV))
+        messages.append({"role": "user", "content": answer})
+        is_last = idx == len(QUESTION["questions"]) - 1
+        reply = await timed(stats, "chat", llm.get_ai_response(API_KEY, messages, "논리적이고 사실 중심 스타일", QUESTION, is_last))
+        messages.append({"role": "assistant", "content": reply})
+        await timed(stats, "tts", llm.text_to_speech(API_KEY, reply))
+        if not is_last:
+            await timed(stats, "tts", llm.text_to_speech(API_KEY, "다음 질문 드리겠습니다."))
+    await timed(stats, "evaluate", llm.evaluate_interview(API_KEY, messages, QUESTION))
+
+async def run_load(sessions, concurrency):
+    stats = {}
+    session_latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await run_session(stats)
+            session_latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    await llm.close_async_clients()
+    stats["session"] = session_latencies
+    return stats, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="llm_manager_async 부하 테스트 (로컬 모의 서버)")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=200, help="동시에 진행하는 세션 수")
+    parser.add_argument("--connections", type=int, default=200, help="HTTP 커넥션 풀 크기")
+    parser.add_argument("--latency", type=float, default=0.2, help="모의 서버 응답 지연(초)")
+    args = parser.parse_args()
+
+    llm_manager.OPENAI_MAX_CONNECTIONS = args.connections
+    server, base_url = start_server_process(latency=args.latency)
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    try:
+        stats, elapsed = asyncio.run(run_load(args.sessions, args.concurrency))
+    finally:
+        server.terminate()
+
+    requests = sum(len(v) for k, v in stats.items() if k != "session")
+    print(f"sessions={args.sessions} concurrency={args.concurrency} latency={args.latency}s")
+    print(f"elapsed={elapsed:.2f}s  throughput={args.sessions / elapsed:.1f} sessions/s, {requests / elapsed:.1f} req/s")
+    print(f"{'stage':<10}{'count':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}")
+    for stage in ["stt", "chat", "tts", "evaluate", "session"]:
+        values = stats.get(stage, [])
+        print(f"{stage:<10}{len(values):>7}" + "".join(f"{percentile(values, p) * 1000:>10.1f}" for p in (50, 95, 99)))
+
+if __name__ == "__main__":
+    main()
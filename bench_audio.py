@@ -0,0 +1,95 @@
+import argparse
+import io
+import os
+import time
+import wave
+
+import numpy as np
+
+import audio_preprocess
+import llm_manager
+from bench_async import percentile
+
+# STT 업로드 전처리 효과 측정
+# - mic_recorder와 같은 형식(48 kHz, 16-bit WAV)의 합성 녹음으로 전처리 전/후 업로드 크기, 전처리 시간 비교
+# - transcribe_audio 전체 지연: 로컬 대역 서버(mock_openai_server) 실측 + 업로드 대역폭(--uplink-mbps)을 반영한 전송 시간
+# - --real: OPENAI_API_KEY로 실제 Whisper API 지연 측정 (합성음이므로 인식 결과는 의미 없음)
+
+def synthetic_recording(seconds, rate=48000, channels=2, lead=1.5, tail=2.0, seed=0):
+    # 말소리 비슷한 신호: 음절(약 0.2초) 단위로 기본 주파수가 바뀌는 배음 + 잡음, 중간중간 짧은 쉼
+    # 앞뒤로 lead/tail초의 무음(배경 잡음)을 붙임
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    syllable = 0.2
+    f0 = np.repeat(rng.uniform(110, 220, int(seconds / syllable) + 1), int(syllable * rate))[:len(t)]
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    voice = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = np.abs(np.sin(np.pi * t / syllable))
+    # 대략 3초마다 0.4초 쉼
+    envelope[(t % 3.0) > 2.6] = 0
+    speech = 0.3 * voice * envelope + 0.02 * rng.standard_normal(len(t))
+    silence = lambda s: 0.0005 * rng.standard_normal(int(s * rate))
+    mono = np.concatenate([silence(lead), speech, silence(tail)])
+    samples = np.repeat(mono[:, None], channels, axis=1)
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+def stt_latencies(api_key, audio, preprocess, runs, uplink_mbps=None):
+    # transcribe_audio 전체 시간(ms) 목록. uplink_mbps가 있으면 업로드 bytes 만큼의 전송 시간을 더함
+    audio_preprocess.AUDIO_PREPROCESS = preprocess
+    upload_bytes = len(audio_preprocess.prepare_upload(audio)[0])
+    transfer = upload_bytes * 8 / (uplink_mbps * 1e6) if uplink_mbps else 0.0
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        llm_manager.transcribe_audio(api_key, audio)
+        latencies.append((time.perf_counter() - start + transfer) * 1000)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, nargs="+", default=[10, 60, 150], help="녹음 길이(초)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--uplink-mbps", type=float, default=10.0, help="대역 서버 측정에 더할 업로드 대역폭")
+    parser.add_argument("--real", action="store_true", help="실제 API로 측정 (OPENAI_API_KEY 필요)")
+    args = parser.parse_args()
+
+    print(f"{'length':>7} {'raw WAV':>10} {'16k WAV':>10} {'16k FLAC':>10} {'trimmed':>9} {'process':>9}")
+    recordings = {}
+    for seconds in args.seconds:
+        audio = recordings[seconds] = synthetic_recording(seconds)
+        start = time.perf_counter()
+        wav, _, info = audio_preprocess.process(audio, "wav")
+        process_ms = (time.perf_counter() - start) * 1000
+        flac, name, _ = audio_preprocess.process(audio, "flac")
+        flac_size = f"{len(flac) / 1e6:8.2f}MB" if name.endswith(".flac") else "   (no soundfile)"
+        print(f"{seconds:6.0f}s {len(audio) / 1e6:8.2f}MB {len(wav) / 1e6:8.2f}MB {flac_size} "
+              f"{info['seconds_in'] - info['seconds_out']:7.1f}s {process_ms:7.1f}ms")
+
+    if args.real:
+        api_key = os.environ["OPENAI_API_KEY"]
+        uplink = None
+    else:
+        import mock_openai_server
+        server, base_url = mock_openai_server.start_server()
+        os.environ["OPENAI_BASE_URL"] = base_url
+        api_key = "mock-key"
+        uplink = args.uplink_mbps
+        print(f"\nSTT latency via mock server + modeled upload at {uplink:g} Mbps")
+    print(f"{'length':>7} {'raw p50':>10} {'raw p95':>10} {'prep p50':>10} {'prep p95':>10}")
+    for seconds, audio in recordings.items():
+        raw = stt_latencies(api_key, audio, False, args.runs, uplink)
+        prepared = stt_latencies(api_key, audio, True, args.runs, uplink)
+        print(f"{seconds:6.0f}s {percentile(raw, 50):8.0f}ms {percentile(raw, 95):8.0f}ms "
+              f"{percentile(prepared, 50):8.0f}ms {percentile(prepared, 95):8.0f}ms")
+    stats = audio_preprocess.report()
+    print(f"\nuploaded {stats['bytes_in'] / 1e6:.1f} MB -> {stats['bytes_out'] / 1e6:.1f} MB ({stats['ratio']:.1f}x smaller)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import os
+import statistics
+import time
+
+import openai
+
+from mock_openai_server import start_server
+
+# OpenAI 클라이언트 재사용 여부에 따른 턴당 지연시간 비교
+# 한 턴 = STT(transcribe) + 채팅(get_ai_response) + TTS(text_to_speech)
+
+API_KEY = "sk-mock"
+QUESTION = {"context": "[제시문 가] 벤치마크용 제시문", "questions": ["질문 1"]}
+MESSAGES = [{"role": "user", "content": "벤치마크 답변입니다."}]
+
+def run_turn_without_reuse(base_url):
+    # 기존 방식: 호출마다 새 클라이언트(=새 커넥션 풀) 생성
+    import io
+    client = openai.OpenAI(api_key=API_KEY, base_url=base_url)
+    audio_file = io.BytesIO(b"RIFF" + b"\x00" * 4096)
+    audio_file.name = "input.wav"
+    client.audio.transcriptions.create(model="whisper-1", file=audio_file, language="ko")
+
+    client = openai.OpenAI(api_key=API_KEY, base_url=base_url)
+    client.chat.completions.create(model="gpt-4o", messages=MESSAGES)
+
+    client = openai.OpenAI(api_key=API_KEY, base_url=base_url)
+    client.audio.speech.create(model="tts-1", voice="onyx", input="잘 들었습니다.")
+
+def run_turn_with_reuse(base_url):
+    import llm_manager
+    llm_manager.transcribe_audio(API_KEY, b"RIFF" + b"\x00" * 4096)
+    llm_manager.get_ai_response(API_KEY, MESSAGES, "논리적이고 사실 중심 스타일", QUESTION)
+    llm_manager.text_to_speech(API_KEY, "잘 들었습니다.", voice="onyx")
+
+def measure(label, turn_fn, base_url, turns):
+    turn_fn(base_url) # 워밍업 (임포트 등)
+    latencies = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        turn_fn(base_url)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<16} mean={statistics.mean(latencies):7.2f}ms  p50={statistics.median(latencies):7.2f}ms  p95={p95:7.2f}ms")
+    return statistics.mean(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 클라이언트 재사용 벤치마크 (로컬 스텁 서버)")
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 서버 응답 지연(초)")
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency=args.latency)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    print(f"Stub server: {base_url}, turns={args.turns}")
+
+    try:
+        before = measure("without reuse", run_turn_without_reuse, base_url, args.turns)
+        after = measure("with reuse", run_turn_with_reuse, base_url, args.turns)
+        print(f"-> 턴당 {before - after:.2f}ms 절감 ({(1 - after / before) * 100:.1f}%)")
+        print("※ 로컬 HTTP 기준이므로 실제 API의 TLS 핸드셰이크 절감분은 포함되지 않음")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import audio_store
+import history_manager
+import llm_manager
+import question_bank
+import tts_cache
+from bench_async import percentile
+from bench_audio import synthetic_recording
+from interview_phrases import INTERVIEWER_VOICES, next_question_message, welcome_message
+from mock_openai_server import start_server_process
+from speech_pipeline import SpeechPipeline, presynthesize
+
+# 면접 전체 흐름 부하 테스트 (app.py 한 세션 = 스크립트 스레드 하나와 같은 방식으로 동기 llm_manager 사용)
+# 세션 1개 = 첫인사 TTS + (STT -> 면접관 답변 스트리밍 + 문장 단위 TTS -> 지난 질문 요약 -> 다음 질문 TTS) x 질문 수 + 평가
+# 동시 세션 수를 --levels 단계로 늘려 가며 처리량, 단계별 지연 백분위, 포화 지점을 측정하고
+# 끝난 세션 상태(메시지, 요약)가 차지하는 세션당 메모리를 따로 측정
+# 대역 서버는 별도 프로세스에서 실행 (--latency, --token-latency, --stt-rtf로 지연 조절, --error-rate로 오류 주입)
+
+API_KEY = "sk-mock"
+PERSONALITY = "논리적이고 사실 중심 스타일"
+STAGES = ["welcome_tts", "stt", "first_token", "chat", "reply_tts", "next_tts", "evaluate", "turn", "session"]
+
+class StageStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.values = {}
+        self.errors = {}
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self.values.setdefault(stage, []).append(seconds)
+
+    def error(self, stage, e):
+        with self._lock:
+            key = f"{stage}: {type(e).__name__}"
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def timed(self, stage, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            self.error(stage, e)
+            raise
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+def run_session(stats, question, recording, voice, think_time=0.0):
+    # app.py와 같은 순서로 한 세션을 실행하고 세션 상태(메시지, 요약)를 반환
+    session_start = time.perf_counter()
+    messages, summaries = [], {}
+    questions = question["questions"]
+
+    # 남은 질문 안내 음성은 시작하자마자 모두 미리 합성 (app.py의 presynthesize_question_audio)
+    question_audio = presynthesize(lambda text: llm_manager.text_to_speech(API_KEY, text, voice=voice, cache=True),
+                                   {i: next_question_message(questions[i]) for i in range(1, len(questions))})
+    welcome = welcome_message(questions[0])
+    audio = stats.timed("welcome_tts", llm_manager.text_to_speech, API_KEY, welcome, voice=voice, cache=True)
+    messages.append({"role": "assistant", "content": welcome, "q_index": 0, "audio_id": audio_store.put(audio)})
+
+    for idx in range(len(questions)):
+        time.sleep(think_time) # 학생이 답변하는 시간
+        turn_start = time.perf_counter()
+        answer = stats.timed("stt", llm_manager.transcribe_audio, API_KEY, recording)
+        messages.append({"role": "user", "content": answer, "q_index": idx})
+        is_last = idx == len(questions) - 1
+
+        prompt_messages = history_manager.compact_messages(messages, idx, summaries, questions)
+        pipeline = SpeechPipeline(lambda sentence: llm_manager.text_to_speech(API_KEY, sentence, voice=voice))
+        chat_start = time.perf_counter()
+        reply, first_token = "", None
+        try:
+            for token in pipeline.tee(llm_manager.get_ai_response_stream(API_KEY, prompt_messages, PERSONALITY, question, is_last)):
+                if first_token is None:
+                    first_token = time.perf_counter() - chat_start
+                reply += token
+        except Exception as e:
+            stats.error("chat", e)
+        stats.add("chat", time.perf_counter() - chat_start)
+        if first_token is not None:
+            stats.add("first_token", first_token)
+        tts_start = time.perf_counter()
+        pipeline.drain()
+        stats.add("reply_tts", time.perf_counter() - tts_start)
+        message = {"role": "assistant", "content": reply, "q_index": idx}
+        if pipeline.audio_chunks:
+            message["audio_id"] = audio_store.put(pipeline.full_audio())
+        messages.append(message)
+        stats.add("turn", time.perf_counter() - turn_start)
+
+        if not is_last:
+            # 다음 질문으로 전환: 미리 합성된 음성을 기다리는 시간
+            history_manager.submit_summary(API_KEY, summaries, questions[idx], idx, messages)
+            next_text = next_question_message(questions[idx + 1])
+            next_start = time.perf_counter()
+            try:
+                next_audio = question_audio.pop(idx + 1).result()
+                messages.append({"role": "assistant", "content": next_text, "q_index": idx + 1, "audio_id": audio_store.put(next_audio)})
+            except Exception as e:
+                stats.error("next_tts", e)
+            stats.add("next_tts", time.perf_counter() - next_start)
+
+    stats.timed("evaluate", llm_manager.evaluate_interview, API_KEY, messages, question)
+    stats.add("session", time.perf_counter() - session_start)
+    return {"messages": messages, "summaries": summaries}
+
+def run_level(concurrency, sessions, question, recording, think_time):
+    stats = StageStats()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(run_session, stats, question, recording, INTERVIEWER_VOICES[i % len(INTERVIEWER_VOICES)], think_time)
+                   for i in range(sessions)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                stats.error("session", e)
+    return stats, time.perf_counter() - start
+
+def session_memory(question, recording, sessions):
+    # 끝난 세션 상태(메시지, 요약)를 여러 개 유지했을 때 세션당 메모리 (audio_store는 따로 표시)
+    stats = StageStats()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store_before = audio_store.stats()["bytes"]
+    states = [run_session(stats, question, recording, INTERVIEWER_VOICES[0]) for _ in range(sessions)]
+    for state in states:
+        # 요약은 Future로 저장되므로 끝날 때까지 기다려서 결과까지 포함
+        for future in state["summaries"].values():
+            if hasattr(future, "result"):
+                future.result()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    store_growth = audio_store.stats()["bytes"] - store_before
+    return (current - before - store_growth) / sessions, store_growth / sessions
+
+def main():
+    parser = argparse.ArgumentParser(description="면접 전체 흐름 부하 테스트 (로컬 대역 서버)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 8, 16, 32], help="동시 세션 수 단계")
+    parser.add_argument("--rounds", type=int, default=2, help="단계마다 동시 세션 수 x rounds개의 세션 실행")
+    parser.add_argument("--questions", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.2, help="대역 서버 응답 지연(초)")
+    parser.add_argument("--token-latency", type=float, default=0.01, help="스트리밍 조각 사이 지연(초)")
+    parser.add_argument("--stt-rtf", type=float, default=0.05, help="음성 1초당 STT 처리 시간(초)")
+    parser.add_argument("--answer-seconds", type=float, default=20, help="학생 답변 녹음 길이(초)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="질문마다 학생이 답변하는 시간(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="대역 서버가 오류(503)로 응답할 요청 비율")
+    parser.add_argument("--saturation", type=float, default=1.1, help="처리량이 이 배율보다 적게 늘면 포화로 판단")
+    args = parser.parse_args()
+
+    # 고정 멘트 캐시는 임시 폴더 사용 (실제 캐시를 건드리지 않음)
+    tts_cache.TTS_CACHE_DIR = tempfile.mkdtemp(prefix="load_tts_cache_")
+    llm_manager.OPENAI_MAX_CONNECTIONS = max(llm_manager.OPENAI_MAX_CONNECTIONS, max(args.levels) * 4)
+    server, base_url = start_server_process(latency=args.latency, token_latency=args.token_latency, stt_rtf=args.stt_rtf,
+                                            error_rate=args.error_rate, error_status=503)
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    entry = max(question_bank.entries(), key=lambda e: e["question_count"])
+    question = dict(question_bank.get(entry["key"]))
+    question["questions"] = (question["questions"] * args.questions)[:args.questions]
+    recording = synthetic_recording(args.answer_seconds)
+    print(f"mock: latency {args.latency}s, token {args.token_latency}s, STT {args.stt_rtf}s/audio s; "
+          f"{args.questions} questions, {args.answer_seconds:g}s answers, {os.cpu_count()} CPUs")
+
+    results = []
+    try:
+        for level in args.levels:
+            stats, elapsed = run_level(level, level * args.rounds, question, recording, args.think_time)
+            throughput = len(stats.values.get("session", [])) / elapsed
+            results.append((level, throughput, stats))
+            print(f"\n== {level} concurrent sessions: {level * args.rounds} sessions in {elapsed:.1f}s, "
+                  f"{throughput * 60:.1f} sessions/min, {len(stats.values.get('turn', [])) / elapsed:.2f} turns/s")
+            print(f"{'stage':<12}{'count':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}")
+            for stage in STAGES:
+                values = stats.values.get(stage, [])
+                print(f"{stage:<12}{len(values):>7}" + "".join(f"{percentile(values, p) * 1000:>10.0f}" for p in (50, 95, 99)))
+            for key, count in stats.errors.items():
+                print(f"  error {key} x{count}")
+
+        per_session, store_per_session = session_memory(question, recording, 5)
+        print(f"\nmemory per finished session: {per_session / 1e3:.1f} KB session state + {store_per_session / 1e3:.1f} KB audio_store "
+              f"(shared, capped at {audio_store.AUDIO_STORE_MAX_MB:g} MB)")
+    finally:
+        server.terminate()
+
+    # 포화 지점: 동시 세션 수를 늘려도 처리량이 --saturation 배 이상 늘지 않는 첫 단계
+    saturation = None
+    for (prev_level, prev_tp, _), (level, tp, _) in zip(results, results[1:]):
+        if tp < prev_tp * min(args.saturation, level / prev_level):
+            saturation = prev_level
+            break
+    best = max(results, key=lambda r: r[1])
+    if saturation:
+        print(f"saturation: throughput stops scaling after {saturation} concurrent sessions "
+              f"(peak {best[1] * 60:.1f} sessions/min at {best[0]})")
+    else:
+        print(f"no saturation up to {results[-1][0]} concurrent sessions (peak {best[1] * 60:.1f} sessions/min)")
+
+if __name__ == "__main__":
+    main()
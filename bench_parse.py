@@ -0,0 +1,108 @@
+import argparse
+import json
+import time
+from collections import Counter
+
+import llm_manager
+import question_bank
+from llm_manager import parse_generated_content, parse_question_output, parse_structured_content
+
+# 문제 생성 응답 파싱 비교: JSON 스키마(구조화 출력) 파서 vs 기존 줄 단위 파서
+# - 파싱 시간 (같은 문제를 두 형식으로 표현한 응답)
+# - 원본과 내용이 그대로 일치하는 비율 (제시문 단락 줄바꿈, 질문/평가 포인트 목록)
+# - 구조화 응답 중 줄 파서로 대체(fallback)된 비율
+#
+# 실제 응답 기록으로 측정: GENERATION_RECORD_PATH=outputs.jsonl 로 앱/verify_gen.py를 실행한 뒤
+#   python bench_parse.py --corpus outputs.jsonl
+# 기록이 없으면 기출 문제 저장소로 응답 코퍼스를 만들어 사용 (아래 built_in_corpus 참고)
+
+def line_format(data):
+    # BASE_SYSTEM_PROMPT의 출력 포맷(TITLE:/CONTEXT:/QUESTION_LIST:/KEY_POINTS:)으로 표현
+    out = [f"TITLE: {data['title']}", "CONTEXT: ", data["context"], "", "QUESTION_LIST:"]
+    out.extend(f"- {q}" for q in data["questions"])
+    out.extend(["", "KEY_POINTS:"])
+    out.extend(f"- {kp}" for kp in data["key_points"])
+    return "\n".join(out)
+
+def built_in_corpus():
+    # 기출 문제 하나당 여러 형태의 응답:
+    # strict    - 스키마 강제(json_schema) 응답 그대로
+    # fenced    - 스키마 없이 JSON만 요청했을 때 흔한 ```json 코드 블록
+    # preamble  - JSON 앞에 설명 문장이 붙은 응답
+    # truncated - max_tokens에 걸려 중간에 끊긴 응답
+    # ignored   - response_format을 무시하는 호환 서버가 기존 형식으로 답한 응답 (줄 파서로 대체)
+    # lines     - 기존 TITLE:/CONTEXT: 형식 응답 (structured=False)
+    corpus = []
+    for _, data in question_bank.iter_questions():
+        text = json.dumps(data, ensure_ascii=False)
+        corpus.append({"source": "strict", "structured": True, "text": text, "expected": data})
+        corpus.append({"source": "fenced", "structured": True, "text": f"```json\n{text}\n```", "expected": data})
+        corpus.append({"source": "preamble", "structured": True, "text": f"다음과 같이 출제했습니다.\n{text}", "expected": data})
+        corpus.append({"source": "truncated", "structured": True, "text": text[:len(text) * 4 // 5], "expected": data})
+        corpus.append({"source": "ignored", "structured": True, "text": line_format(data), "expected": data})
+        corpus.append({"source": "lines", "structured": False, "text": line_format(data), "expected": data})
+    return corpus
+
+def load_corpus(path):
+    corpus = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                source = "structured" if record.get("structured") else "lines"
+                corpus.append({"source": source, "structured": record.get("structured", False), "text": record["text"], "expected": None})
+    return corpus
+
+def matches(result, expected):
+    return all(result.get(field) == expected[field] for field in ("title", "context", "questions", "key_points"))
+
+def per_call_us(fn, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="GENERATION_RECORD_PATH로 기록한 응답 JSONL")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else built_in_corpus()
+    print(f"corpus: {len(corpus)} responses ({'recorded' if args.corpus else 'built-in from question bank'})")
+
+    # 파싱 시간: 같은 문제의 JSON 응답 vs 줄 형식 응답
+    if not args.corpus:
+        pairs = [(r["text"], line_format(r["expected"])) for r in corpus if r["source"] == "strict"]
+        json_us = per_call_us(parse_structured_content, [p[0] for p in pairs], args.repeat)
+        line_us = per_call_us(parse_generated_content, [p[1] for p in pairs], args.repeat)
+        print(f"parse time per response: structured {json_us:7.1f} us, line parser {line_us:7.1f} us")
+
+    # 응답 종류별 파싱 결과 (구조화 응답은 parse_question_output의 통계로 분류)
+    outcomes = {}
+    exact = Counter()
+    for record in corpus:
+        before = llm_manager.parse_stats()
+        result = parse_question_output(record["text"], record["structured"])
+        after = llm_manager.parse_stats()
+        outcome = next((k for k in ("structured", "fallback", "failed") if after[k] != before[k]), "line parser")
+        outcomes.setdefault(record["source"], Counter())[outcome] += 1
+        if record["expected"] is not None and matches(result, record["expected"]):
+            exact[record["source"]] += 1
+
+    print(f"{'source':<12}{'count':>6}  outcome" + ("" if args.corpus else "                                 exact match"))
+    for source, counter in outcomes.items():
+        count = sum(counter.values())
+        detail = ", ".join(f"{k} {v}" for k, v in counter.items())
+        line = f"{source:<12}{count:>6}  {detail:<40}"
+        if not args.corpus:
+            line += f" {exact[source] / count:6.0%}"
+        print(line)
+
+    stats = llm_manager.parse_stats()
+    print(f"structured responses: {stats['structured']} parsed in one pass, {stats['fallback']} fallback, "
+          f"{stats['failed']} failed -> fallback rate {stats['fallback_rate']:.1%}")
+
+if __name__ == "__main__":
+    main()
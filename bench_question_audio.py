@@ -0,0 +1,80 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import llm_manager
+import speech_pipeline
+import tts_cache
+from bench_async import percentile
+from mock_openai_server import start_server
+
+# 질문 전환 시 다음 질문 음성을 기다리는 시간 비교 (동시 세션 --sessions개, 질문 --questions개)
+# - on_demand: 전환할 때 합성
+# - prefetch:  답변을 제출할 때 다음 질문 하나를 면접관 답변 문장 TTS와 같은 스레드 풀에서 합성 (이전 방식)
+# - presynth:  면접 시작 시 남은 질문 전체를 별도 스레드 풀에서 동시에 합성 (app.py presynthesize_question_audio)
+# 학생 답변(--answer-seconds) → 면접관 답변 문장 TTS(--reply-sentences개) → 전환 대기(--advance-delay) → 다음 질문 음성
+# 면접관 답변 TTS 시간도 함께 출력 (미리 합성이 답변 음성을 늦추지 않는지 확인)
+
+API_KEY = "sk-mock"
+
+def synthesize(text):
+    # 캐시를 쓰지 않음 (매번 실제 합성 시간을 측정)
+    return llm_manager.text_to_speech(API_KEY, text)
+
+def run_session(strategy, session_no, args, waits, replies, lock):
+    prompts = {idx: f"세션 {session_no} 질문 {idx} 안내 멘트입니다." for idx in range(1, args.questions)}
+    presynth = speech_pipeline.presynthesize(synthesize, prompts) if strategy == "presynth" else {}
+    for idx in range(1, args.questions):
+        time.sleep(args.answer_seconds)
+        prefetched = speech_pipeline.submit_tts(synthesize, prompts[idx]) if strategy == "prefetch" else None
+        start = time.perf_counter()
+        sentences = [speech_pipeline.submit_tts(synthesize, f"세션 {session_no} 답변 {idx}-{n}.") for n in range(args.reply_sentences)]
+        for future in sentences:
+            future.result()
+        reply = time.perf_counter() - start
+        time.sleep(args.advance_delay)
+
+        start = time.perf_counter()
+        if strategy == "presynth":
+            presynth.pop(idx).result()
+        elif strategy == "prefetch":
+            prefetched.result()
+        else:
+            synthesize(prompts[idx])
+        with lock:
+            waits.append(time.perf_counter() - start)
+            replies.append(reply)
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 전환 시 다음 질문 음성 대기 시간 (on_demand vs prefetch vs presynth)")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--tts-latency", type=float, default=0.8, help="대역 서버 TTS 응답 시간(초)")
+    parser.add_argument("--answer-seconds", type=float, default=3.0, help="학생 답변 시간(초)")
+    parser.add_argument("--reply-sentences", type=int, default=3)
+    parser.add_argument("--advance-delay", type=float, default=0.5, help="면접관 답변 후 다음 질문까지 대기(초, app.py는 3초)")
+    args = parser.parse_args()
+
+    tts_cache.TTS_CACHE_DIR = tempfile.mkdtemp(prefix="question_audio_cache_")
+    server, base_url = start_server(latency=args.tts_latency)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    print(f"{args.sessions} sessions x {args.questions} questions, TTS {args.tts_latency}s, "
+          f"TTS_PIPELINE_WORKERS={speech_pipeline.TTS_PIPELINE_WORKERS}, TTS_PRESYNTH_WORKERS={speech_pipeline.TTS_PRESYNTH_WORKERS}")
+    print(f"{'strategy':<10}{'wait p50':>10}{'wait p95':>10}{'wait max':>10}{'reply TTS p50':>15}{'reply TTS p95':>15}")
+    try:
+        for strategy in ("on_demand", "prefetch", "presynth"):
+            waits, replies, lock = [], [], threading.Lock()
+            with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+                for future in [executor.submit(run_session, strategy, n, args, waits, replies, lock) for n in range(args.sessions)]:
+                    future.result()
+            ms = lambda values, p: percentile(values, p) * 1000
+            print(f"{strategy:<10}{ms(waits, 50):>8.0f}ms{ms(waits, 95):>8.0f}ms{max(waits) * 1000:>8.0f}ms"
+                  f"{ms(replies, 50):>13.0f}ms{ms(replies, 95):>13.0f}ms")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import tracemalloc
+
+import audio_store
+import question_bank
+from interview_phrases import next_question_message, welcome_message
+
+# 세션당 메모리 비교: 메시지에 음성 bytes를 그대로 저장(기존) vs audio_store id만 저장
+# 면접 한 번(질문 --questions개)의 st.session_state.messages를 app.py와 같은 모양으로 만들어서
+# - 세션 상태가 차지하는 메모리 (tracemalloc, 세션 --sessions개 평균)
+# - 리런 한 번에 st.audio로 브라우저에 보내는 음성 크기
+# - 여러 세션이 함께 쓰는 audio_store 크기 (고정 멘트는 세션 사이에서 한 번만 보관)
+# 를 측정. 음성 크기는 한국어 초당 --chars-per-second 글자, mp3 --kbps로 추정
+
+REPLY = "말씀 잘 들었습니다. 환자의 자율성을 강조하셨는데, 보호자의 의견이 환자와 다를 때는 어떻게 판단하시겠습니까? 근거를 들어 조금 더 설명해 주세요. " * 2
+ANSWER = "저는 환자의 자율성을 가장 중요하게 생각합니다. 다만 의학적 판단과 충돌할 때는 충분한 설명을 통해 합의를 이끌어야 한다고 봅니다. " * 3
+
+def fake_tts(text, kbps, chars_per_second, salt=""):
+    # 글자 수에 비례하는 크기의 가짜 mp3 (같은 문장 + salt면 같은 bytes → 고정 멘트 공유 확인용)
+    seconds = len(text) / chars_per_second
+    size = int(seconds * kbps * 1000 / 8)
+    seed = (salt + text).encode("utf-8")
+    return (seed * (size // len(seed) + 1))[:size]
+
+def interview_turns(questions):
+    # (role, content, 음성 여부, 고정 멘트 여부)
+    turns = [("assistant", welcome_message(questions[0]), True, True)]
+    for i, question in enumerate(questions):
+        if i:
+            turns.append(("assistant", next_question_message(question), True, True))
+        turns.append(("user", ANSWER, False, False))
+        turns.append(("assistant", REPLY, True, False))
+    return turns
+
+def build_session(turns, session_no, use_store, kbps, chars_per_second):
+    messages = []
+    for q_index, (role, content, has_audio, fixed) in enumerate(turns):
+        message = {"role": role, "content": content, "q_index": q_index}
+        if has_audio:
+            # 면접관 답변은 세션마다 다르므로 salt로 구분
+            audio = fake_tts(content, kbps, chars_per_second, "" if fixed else str(session_no))
+            if use_store:
+                message["audio_id"] = audio_store.put(audio)
+            else:
+                message["audio"] = audio
+            message["played"] = True
+        messages.append(message)
+    return messages
+
+def measure(turns, sessions, use_store, kbps, chars_per_second):
+    audio_store.clear()
+    tracemalloc.start()
+    # 세션 상태(메시지 목록)만 측정하기 위해 저장소 메모리는 따로 계산
+    states = [build_session(turns, n, use_store, kbps, chars_per_second) for n in range(sessions)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    store_bytes = audio_store.stats()["bytes"]
+    # 저장소 크기는 tracemalloc에도 포함되어 있으므로 빼서 세션 상태만 남김
+    per_session = (current - store_bytes) / sessions if use_store else current / sessions
+    last = states[-1]
+    if use_store:
+        shipped = len(audio_store.get([m for m in last if "audio_id" in m][-1]["audio_id"]) or b"")
+    else:
+        shipped = sum(len(m["audio"]) for m in last if "audio" in m)
+    return per_session, shipped, store_bytes
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--kbps", type=float, default=64.0, help="TTS mp3 비트레이트 추정")
+    parser.add_argument("--chars-per-second", type=float, default=6.0)
+    args = parser.parse_args()
+
+    entry = max(question_bank.entries(), key=lambda e: e["question_count"])
+    questions = (question_bank.get(entry["key"])["questions"] * args.questions)[:args.questions]
+    turns = interview_turns(questions)
+    print(f"{args.questions}-question interview, {len(turns)} messages, {sum(t[2] for t in turns)} clips, {args.sessions} sessions")
+
+    inline = measure(turns, args.sessions, False, args.kbps, args.chars_per_second)
+    stored = measure(turns, args.sessions, True, args.kbps, args.chars_per_second)
+    print(f"{'':<22}{'session state':>15}{'st.audio per rerun':>20}{'shared store':>15}")
+    for label, (per_session, shipped, store_bytes) in (("audio bytes in state", inline), ("audio_store ids", stored)):
+        print(f"{label:<22}{per_session / 1e3:12.1f} KB{shipped / 1e3:17.1f} KB{store_bytes / 1e6:12.2f} MB")
+    total_inline = inline[0] * args.sessions
+    total_stored = stored[0] * args.sessions + stored[2]
+    print(f"total for {args.sessions} sessions: {total_inline / 1e6:.1f} MB -> {total_stored / 1e6:.1f} MB "
+          f"(store capped at AUDIO_STORE_MAX_MB={audio_store.AUDIO_STORE_MAX_MB:g}, "
+          f"{'disk backed' if audio_store.AUDIO_STORE_DIR else 'memory only'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import glob
+import os
+import time
+
+import audio_preprocess
+import llm_manager
+import question_bank
+from bench_async import percentile
+from bench_audio import synthetic_recording
+from interview_phrases import INTERVIEWER_VOICES, next_question_message, welcome_message
+
+# 음성 엔진(provider)별 STT/TTS 지연과 실시간 배율(RTF = 처리 시간 / 음성 길이) 비교
+# - STT: --recordings 폴더의 WAV 녹음(고정된 한국어 답변 녹음 세트)을 각 엔진으로 인식
+#        폴더를 지정하지 않으면 합성 신호를 사용 (말소리가 아니므로 로컬 엔진의 속도는 실제와 다를 수 있음)
+# - TTS: 면접관 고정 멘트 + 기출 문제 질문 문장을 각 엔진으로 합성
+# openai는 --real이 없으면 로컬 대역 서버(음성 1초당 --stt-rtf초)로 측정
+#
+# 사용법: python bench_speech_providers.py --recordings recordings/ --providers openai local
+
+def tts_sentences(count):
+    questions = [q for _, data in question_bank.iter_questions() for q in data["questions"]]
+    return [welcome_message(questions[0]), next_question_message(questions[1])] + questions[2:count]
+
+def load_recordings(directory):
+    if not directory:
+        return [(f"synthetic {s}s", synthetic_recording(s, seed=s)) for s in (5, 15, 30)]
+    recordings = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+        with open(path, "rb") as f:
+            recordings.append((os.path.basename(path), f.read()))
+    return recordings
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def bench_stt(api_key, provider, recordings, runs):
+    # 첫 호출은 모델 로드 시간이 섞이므로 따로 표시
+    _, warmup = timed(llm_manager.transcribe_audio, api_key, recordings[0][1], provider=provider)
+    print(f"  STT first call (incl. model load): {warmup * 1000:.0f} ms")
+    latencies, total_time, total_audio = [], 0.0, 0.0
+    for name, audio in recordings:
+        seconds = audio_preprocess.duration_seconds(audio)
+        for _ in range(runs):
+            text, elapsed = timed(llm_manager.transcribe_audio, api_key, audio, provider=provider)
+            latencies.append(elapsed * 1000)
+            total_time += elapsed
+            total_audio += seconds
+        print(f"  STT {name:<28} {seconds:5.1f}s audio  {elapsed * 1000:7.0f} ms  RTF {elapsed / seconds:5.2f}  {text[:30]!r}")
+    print(f"  STT p50 {percentile(latencies, 50):.0f} ms, p95 {percentile(latencies, 95):.0f} ms, RTF {total_time / total_audio:.2f}")
+
+def bench_tts(api_key, provider, sentences, runs):
+    voice = INTERVIEWER_VOICES[0]
+    _, warmup = timed(llm_manager.text_to_speech, api_key, sentences[0], voice=voice, provider=provider)
+    print(f"  TTS first call: {warmup * 1000:.0f} ms")
+    latencies, total_time, total_audio = [], 0.0, 0.0
+    for _ in range(runs):
+        for sentence in sentences:
+            audio, elapsed = timed(llm_manager.text_to_speech, api_key, sentence, voice=voice, provider=provider)
+            latencies.append(elapsed * 1000)
+            total_time += elapsed
+            total_audio += audio_preprocess.duration_seconds(audio)
+    rtf = f"{total_time / total_audio:.2f}" if total_audio else "- (length unknown)"
+    print(f"  TTS {len(sentences)} sentences: p50 {percentile(latencies, 50):.0f} ms, p95 {percentile(latencies, 95):.0f} ms, RTF {rtf}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--providers", nargs="+", default=["openai", "local"])
+    parser.add_argument("--recordings", help="WAV 녹음 폴더")
+    parser.add_argument("--sentences", type=int, default=6, help="TTS 문장 수")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--real", action="store_true", help="openai: 실제 API 사용 (OPENAI_API_KEY 필요)")
+    parser.add_argument("--stt-rtf", type=float, default=0.1, help="openai 대역 서버의 음성 1초당 처리 시간")
+    parser.add_argument("--latency", type=float, default=0.3, help="openai 대역 서버의 요청당 지연")
+    args = parser.parse_args()
+
+    if args.real:
+        api_key = os.environ["OPENAI_API_KEY"]
+    else:
+        import mock_openai_server
+        server, base_url = mock_openai_server.start_server(latency=args.latency, stt_rtf=args.stt_rtf)
+        os.environ["OPENAI_BASE_URL"] = base_url
+        api_key = "mock-key"
+
+    recordings = load_recordings(args.recordings)
+    sentences = tts_sentences(args.sentences)
+    for provider in args.providers:
+        print(f"[{provider}]")
+        for label, bench, data in (("STT", bench_stt, recordings), ("TTS", bench_tts, sentences)):
+            try:
+                bench(api_key, provider, data, args.runs)
+            except Exception as e:
+                # 선택 설치 패키지/명령이 없으면 해당 엔진만 건너뜀
+                print(f"  {label} unavailable: {type(e).__name__}: {e}")
+
+if __name__ == "__main__":
+    main()
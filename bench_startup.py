@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import question_bank
+from update_questions import write_questions_py
+
+# 시작 시간 벤치마크: questions.py(파이썬 리터럴) import vs question_bank 인덱스 로드
+# 기출 문제를 복제해서 N개짜리 문제 은행을 만들고, 새 인터프리터에서 다음을 측정
+# - import: 모듈 import + 목록 준비 (앱 시작 1회)
+# - rerun: Streamlit 리런마다 하는 작업 (목록 → 무작위 선택 → 문제 하나 가져오기)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LEGACY_SCRIPT = """
+import json, random, time
+t = time.perf_counter()
+from questions import QUESTIONS
+keys = list(QUESTIONS.keys())
+import_ms = (time.perf_counter() - t) * 1000
+t = time.perf_counter()
+for _ in range(1000):
+    q = QUESTIONS[random.choice(list(QUESTIONS.keys()))]
+rerun_us = (time.perf_counter() - t) * 1000
+print(json.dumps({"import_ms": import_ms, "rerun_us": rerun_us}))
+"""
+
+BANK_SCRIPT = """
+import json, time
+t = time.perf_counter()
+import question_bank
+keys = question_bank.keys()
+import_ms = (time.perf_counter() - t) * 1000
+t = time.perf_counter()
+for _ in range(1000):
+    keys = question_bank.keys()
+    q = question_bank.get(question_bank.random_key())
+rerun_us = (time.perf_counter() - t) * 1000
+print(json.dumps({"import_ms": import_ms, "rerun_us": rerun_us}))
+"""
+
+def synthetic_db(size):
+    base = list(question_bank.iter_questions())
+    db = {}
+    for i in range(size):
+        key, data = base[i % len(base)]
+        db[f"{key} #{i}"] = data
+    return db
+
+def run(script, work_dir):
+    env = dict(os.environ, QUESTION_BANK_PATH=os.path.join(work_dir, "questions.jsonl"))
+    env["PYTHONPATH"] = os.pathsep.join([work_dir, REPO_DIR])
+    # 첫 실행은 .pyc 컴파일 포함 → 두 번째 실행(실제 서버 재시작과 같은 조건)을 사용
+    for _ in range(2):
+        out = subprocess.run([sys.executable, "-c", script], cwd=work_dir, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="8,1000,5000", help="문제 개수 (쉼표로 구분)")
+    args = parser.parse_args()
+
+    print(f"{'problems':>8} | {'questions.py import':>19} | {'bank import':>11} | {'py rerun':>9} | {'bank rerun':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as work_dir:
+            db = synthetic_db(size)
+            write_questions_py(db, os.path.join(work_dir, "questions.py"))
+            question_bank.write_bank(db, os.path.join(work_dir, "questions.jsonl"))
+            legacy = run(LEGACY_SCRIPT, work_dir)
+            bank = run(BANK_SCRIPT, work_dir)
+        print(f"{size:>8} | {legacy['import_ms']:>16.1f} ms | {bank['import_ms']:>8.1f} ms | {legacy['rerun_us']:>6.1f} us | {bank['rerun_us']:>7.1f} us")
+
+if __name__ == "__main__":
+    main()
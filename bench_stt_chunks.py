@@ -0,0 +1,49 @@
+import argparse
+import os
+import time
+
+import audio_preprocess
+import llm_manager
+import mock_openai_server
+from bench_audio import synthetic_recording
+
+# 긴 답변 STT: 한 번에 보내기 vs 쉬는 구간에서 나눠 동시에 인식
+# 대역 서버는 음성 길이에 비례해서 응답을 늦춤 (--stt-rtf: 음성 1초당 처리 시간, --latency: 요청당 고정 지연)
+# 조각으로 나누면 전체 시간이 가장 긴 조각 하나의 인식 시간에 가까워져야 함
+
+def timed_ms(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, nargs="+", default=[60, 120, 180], help="녹음 길이(초)")
+    parser.add_argument("--chunk-seconds", type=float, default=audio_preprocess.AUDIO_CHUNK_SECONDS)
+    parser.add_argument("--stt-rtf", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    server, base_url = mock_openai_server.start_server(latency=args.latency, stt_rtf=args.stt_rtf)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    api_key = "mock-key"
+
+    print(f"mock STT: {args.latency * 1000:.0f} ms + {args.stt_rtf:g} s per audio second, chunks of ~{args.chunk_seconds:g} s, "
+          f"{llm_manager.STT_CHUNK_WORKERS} workers")
+    print(f"{'length':>7} {'single':>9} {'chunked':>9} {'chunks':>7} {'longest chunk':>14}")
+    for seconds in args.seconds:
+        audio = synthetic_recording(seconds)
+        audio_preprocess.AUDIO_CHUNK_SECONDS = 0
+        _, single_ms = timed_ms(llm_manager.transcribe_audio, api_key, audio)
+        audio_preprocess.AUDIO_CHUNK_SECONDS = args.chunk_seconds
+        _, chunked_ms = timed_ms(llm_manager.transcribe_audio, api_key, audio)
+
+        # 가장 긴 조각 하나만 인식하는 시간 (전처리 포함 비교를 위해 전처리 시간을 더함)
+        chunks, prep_ms = timed_ms(audio_preprocess.prepare_upload_chunks, audio)
+        longest = max(chunks, key=lambda c: mock_openai_server.audio_seconds(c[0]))
+        _, longest_ms = timed_ms(llm_manager._transcribe_upload, api_key, longest[0], longest[1])
+        print(f"{seconds:6.0f}s {single_ms:7.0f}ms {chunked_ms:7.0f}ms {len(chunks):>7} {prep_ms + longest_ms:12.0f}ms")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import statistics
+import time
+
+import mock_openai_server
+from mock_openai_server import start_server
+
+# 면접관 한 턴의 첫 음성까지 걸리는 시간 비교
+# - serial: 답변 전체 생성 -> 전체 문장 TTS -> 재생
+# - pipelined: 스트리밍 중 완성된 문장부터 TTS -> 첫 문장 오디오가 준비되면 재생
+
+API_KEY = "sk-mock"
+QUESTION = {"context": "[제시문 가] 벤치마크용 제시문", "questions": ["질문 1"]}
+MESSAGES = [{"role": "user", "content": "벤치마크 답변입니다."}]
+REPLY = (
+    "잘 들었습니다. 제시문 [가]의 실험 조건을 정확히 짚어주셨습니다. "
+    "다만 대조군 설정에 대한 설명이 조금 부족했습니다. "
+    "그래프의 변곡점이 의미하는 바를 한 번 더 생각해 보시기 바랍니다. "
+    "답변 감사합니다."
+)
+
+def serial_turn():
+    import llm_manager
+    start = time.perf_counter()
+    text = llm_manager.get_ai_response(API_KEY, MESSAGES, "친절하고 격려하는 스타일", QUESTION)
+    llm_manager.text_to_speech(API_KEY, text)
+    return time.perf_counter() - start
+
+def pipelined_turn():
+    import llm_manager
+    from speech_pipeline import SpeechPipeline
+    start = time.perf_counter()
+    pipeline = SpeechPipeline(lambda sentence: llm_manager.text_to_speech(API_KEY, sentence))
+    first_audio = None
+    for _ in pipeline.tee(llm_manager.get_ai_response_stream(API_KEY, MESSAGES, "친절하고 격려하는 스타일", QUESTION)):
+        if first_audio is None and pipeline.pop_ready():
+            first_audio = time.perf_counter() - start
+    chunks = pipeline.drain()
+    if first_audio is None and chunks:
+        first_audio = time.perf_counter() - start
+    return first_audio
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 단위 TTS 파이프라인의 첫 음성 도달 시간 벤치마크")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3, help="요청당 응답 지연(초, TTS 포함)")
+    parser.add_argument("--token-latency", type=float, default=0.03, help="스트리밍 조각 사이 지연(초)")
+    args = parser.parse_args()
+
+    mock_openai_server.MOCK_CHAT_REPLY = REPLY
+    server, base_url = start_server(latency=args.latency, token_latency=args.token_latency)
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    try:
+        for label, turn in [("serial", serial_turn), ("pipelined", pipelined_turn)]:
+            turn() # 워밍업
+            results = [turn() * 1000 for _ in range(args.turns)]
+            print(f"{label:<10} time-to-first-audio mean={statistics.mean(results):7.1f}ms  p50={statistics.median(results):7.1f}ms")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
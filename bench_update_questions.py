@@ -0,0 +1,110 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import question_bank
+from update_questions import ingest, parse_markdown, rebuild, update_incremental, write_questions_py
+
+# update_questions.py 전체 재작성 vs 증분 갱신 시간 비교
+# 실제 problem.md의 문제들을 복제해서 수천 개짜리 합성 problem.md를 만든 뒤
+# 일부 문제를 수정·추가하고 다시 반영하는 데 걸리는 시간을 측정
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def synthetic_markdown(problem_count, edited=0, added=0):
+    # 연도 섹션(##) 하나 = 원본 문제 전체 한 벌, 섹션 제목에 번호를 붙여 key가 겹치지 않게 함
+    with open(os.path.join(REPO_DIR, "problem.md"), "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    body = lines[next(i for i, line in enumerate(lines) if line.startswith("## ")):]
+    body[-1] = body[-1].rstrip("\n") + "\n"
+    per_copy = sum(1 for line in body if line.strip().startswith("**[문제"))
+
+    out = []
+    copies = -(-problem_count // per_copy) + -(-added // per_copy)
+    for copy in range(copies):
+        for line in body:
+            if line.startswith("## "):
+                line = f"{line.rstrip()} #{copy}\n"
+            elif copy < -(-edited // per_copy) and line.startswith("> **제시문"):
+                # 앞쪽 문제들의 제시문을 조금 바꿈 (변경 감지 대상)
+                line = line.replace("제시문", "제시문 (개정)")
+            out.append(line)
+    return "".join(out)
+
+def timed(fn, *args, repeat=3):
+    # 디스크 캐시 영향을 줄이기 위해 여러 번 실행해서 가장 빠른 시간 사용
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--problems", type=int, default=3000)
+    parser.add_argument("--edited", type=int, default=16, help="수정할 문제 수 (대략)")
+    parser.add_argument("--added", type=int, default=16, help="추가할 문제 수 (대략)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        md_path = os.path.join(work_dir, "problem.md")
+        bank_path = os.path.join(work_dir, "questions.jsonl")
+        py_path = os.path.join(work_dir, "questions.py")
+
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(synthetic_markdown(args.problems))
+        update_incremental(md_path, bank_path) # 첫 실행: 전체 기록
+        print(f"synthetic problem.md: {len(question_bank.stored_hashes(bank_path))} problems, {os.path.getsize(md_path) / 1e6:.1f} MB")
+
+        # 일부 수정 + 추가
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(synthetic_markdown(args.problems, edited=args.edited, added=args.added))
+
+        def legacy():
+            # 기존 방식: 전체 파싱 후 questions.py 전체 재작성
+            write_questions_py(parse_markdown(md_path), py_path)
+
+        def full():
+            rebuild(md_path, bank_path + ".full")
+
+        _, legacy_ms = timed(legacy)
+        _, full_ms = timed(full)
+        size_before = os.path.getsize(bank_path)
+        changes, incremental_ms = timed(update_incremental, md_path, bank_path, repeat=1)
+        appended = os.path.getsize(bank_path) - size_before
+        rewritten = os.path.getsize(bank_path + ".full")
+        _, noop_ms = timed(update_incremental, md_path, bank_path)
+
+    print(f"changes: {changes}")
+    print(f"full parse + questions.py (legacy) : {legacy_ms:8.1f} ms")
+    print(f"full rebuild (questions.jsonl)     : {full_ms:8.1f} ms")
+    print(f"incremental                        : {incremental_ms:8.1f} ms")
+    print(f"incremental (no changes)           : {noop_ms:8.1f} ms")
+    print(f"bytes written: full {rewritten / 1e6:.1f} MB vs incremental {appended / 1e3:.0f} KB (+ index)")
+
+    for count in (args.problems // 4, args.problems):
+        peak, dict_peak = streaming_peak_memory(count)
+        print(f"peak memory, {count:>5} problems: streaming ingest {peak / 1e6:5.2f} MB, parse_markdown(dict) {dict_peak / 1e6:6.2f} MB")
+
+def streaming_peak_memory(problem_count):
+    # 스트리밍 파서 → questions.py 기록 시 최대 메모리 (문제 수와 무관하게 일정해야 함)
+    with tempfile.TemporaryDirectory() as work_dir:
+        md_path = os.path.join(work_dir, "problem.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(synthetic_markdown(problem_count))
+        tracemalloc.start()
+        ingest(md_path, write_questions_py, os.path.join(work_dir, "questions.py"))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tracemalloc.start()
+        parse_markdown(md_path)
+        dict_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak, dict_peak
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+
+# 면접 평가(run_evaluation) 백그라운드 작업 큐
+# - 평가는 제한된 워커 풀에서 실행되어 Streamlit 스크립트 스레드를 잡아두지 않음
+# - 작업 결과는 디스크에 저장되어 새로고침 후에도 다시 채점하지 않고 결과를 불러옴
+# - 저장된 작업(전체 대화 포함)은 EVAL_JOBS_MAX_AGE가 지나거나 EVAL_JOBS_MAX_FILES개를 넘으면 오래된 것부터 삭제
+
+EVAL_MAX_WORKERS = int(os.environ.get("EVAL_MAX_WORKERS", "4"))
+EVAL_MAX_QUEUE = int(os.environ.get("EVAL_MAX_QUEUE", "50"))
+EVAL_JOBS_DIR = os.environ.get("EVAL_JOBS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".eval_jobs"))
+EVAL_JOBS_MAX_AGE = float(os.environ.get("EVAL_JOBS_MAX_AGE", str(7 * 24 * 3600))) # 초
+EVAL_JOBS_MAX_FILES = int(os.environ.get("EVAL_JOBS_MAX_FILES", "1000"))
+EVAL_JOBS_CLEANUP_INTERVAL = 600 # 정리는 이 간격(초)마다 한 번만
+
+_executor = ThreadPoolExecutor(max_workers=EVAL_MAX_WORKERS, thread_name_prefix="eval")
+_lock = threading.Lock()
+_active = {} # 이 프로세스에서 대기/실행 중인 작업: job_id -> 상태 dict
+_queue_order = [] # 대기 순서 (queued 상태의 job_id)
+_counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "deduplicated": 0}
+_durations = [] # 최근 평가 소요 시간(초)
+_last_cleanup = 0.0
+
+class QueueFullError(Exception):
+    pass
+
+def _job_path(job_id):
+    return os.path.join(EVAL_JOBS_DIR, f"{job_id}.json")
+
+def _save(job):
+    os.makedirs(EVAL_JOBS_DIR, exist_ok=True)
+    tmp_path = _job_path(job["id"]) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(job, f, ensure_ascii=False)
+    os.replace(tmp_path, _job_path(job["id"]))
+
+def _text_messages(messages):
+    # 오디오 바이트 등은 제외하고 평가에 필요한 텍스트만 저장
+    return [{"role": m["role"], "content": m["content"]} for m in messages]
+
+def job_id_for(messages, question_data):
+    # 같은 문제·같은 대화는 같은 작업 id → 중복 제출 시 다시 채점하지 않음
+    raw = json.dumps([question_data.get("title"), _text_messages(messages)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+def get(job_id):
+    with _lock:
+        return _lookup(job_id)
+
+def _lookup(job_id):
+    # _lock을 잡은 상태에서 호출 (submit이 확인과 등록을 한 번에 하도록)
+    job = _active.get(job_id)
+    if job is not None:
+        return dict(job)
+    try:
+        with open(_job_path(job_id), "r", encoding="utf-8") as f:
+            job = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if job["status"] in ("queued", "running"):
+        # 디스크에는 진행 중이지만 이 프로세스에 없음 = 서버 재시작으로 유실된 작업
+        job["status"] = "lost"
+    return job
+
+def submit(api_key, messages, question_data):
+    job_id = job_id_for(messages, question_data)
+    job = {
+        "id": job_id,
+        "status": "queued",
+        "submitted_at": time.time(),
+        "question": question_data,
+        "messages": _text_messages(messages),
+        "result": None,
+        "error": None,
+    }
+    with _lock:
+        # 확인과 등록을 한 번에: 거의 동시에 두 번 제출해도(더블 클릭, 리런) 평가는 한 번만 실행
+        # 완료/진행 중인 작업만 재사용하고, error(API 오류)·lost(서버 재시작으로 유실)는 다시 대기열에 넣음
+        existing = _lookup(job_id)
+        if existing and existing["status"] in ("queued", "running", "done"):
+            _counters["deduplicated"] += 1
+            return job_id
+        if len(_active) >= EVAL_MAX_QUEUE:
+            _counters["rejected"] += 1
+            raise QueueFullError(f"평가 대기열이 가득 찼습니다. ({EVAL_MAX_QUEUE}건)")
+        _active[job_id] = job
+        _queue_order.append(job_id)
+        _counters["submitted"] += 1
+    _save(job)
+    _executor.submit(tracing.bind(_run), job_id, api_key)
+    _cleanup()
+    return job_id
+
+def _cleanup(now=None):
+    # 오래된 작업 파일 삭제 (대기/실행 중인 작업은 제외)
+    global _last_cleanup
+    now = time.time() if now is None else now
+    with _lock:
+        if now - _last_cleanup < EVAL_JOBS_CLEANUP_INTERVAL:
+            return 0
+        _last_cleanup = now
+        active = set(_active)
+    files = []
+    for name in os.listdir(EVAL_JOBS_DIR):
+        if name.endswith(".json") and name[:-5] not in active:
+            try:
+                files.append((os.path.getmtime(os.path.join(EVAL_JOBS_DIR, name)), name))
+            except OSError:
+                pass
+    files.sort()
+    expired = [name for mtime, name in files if now - mtime > EVAL_JOBS_MAX_AGE]
+    kept = len(files) - len(expired)
+    expired += [name for _, name in files[len(expired):len(expired) + max(kept - EVAL_JOBS_MAX_FILES, 0)]]
+    for name in expired:
+        try:
+            os.remove(os.path.join(EVAL_JOBS_DIR, name))
+        except OSError:
+            pass
+    return len(expired)
+
+def _run(job_id, api_key):
+    # 오류를 raise하는 버전 사용: 일시적인 429/5xx가 평가 결과로 저장되지 않고 error 상태로 남아 다시 제출할 수 있음
+    from llm_manager import run_evaluation
+
+    with _lock:
+        job = _active[job_id]
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        if job_id in _queue_order:
+            _queue_order.remove(job_id)
+    _save(job)
+
+    try:
+        job["result"] = run_evaluation(api_key, job["messages"], job["question"])
+        job["status"] = "done"
+    except Exception as e:
+        job["error"] = str(e)
+        job["status"] = "error"
+    job["finished_at"] = time.time()
+    _save(job)
+
+    with _lock:
+        _active.pop(job_id, None)
+        if job["status"] == "done":
+            _counters["completed"] += 1
+            _durations.append(job["finished_at"] - job["started_at"])
+            del _durations[:-100]
+        else:
+            _counters["failed"] += 1
+
+def queue_position(job_id):
+    # 대기 중이면 1부터 시작하는 순번, 아니면 0
+    with _lock:
+        if job_id in _queue_order:
+            return _queue_order.index(job_id) + 1
+    return 0
+
+def metrics():
+    with _lock:
+        running = sum(1 for job in _active.values() if job["status"] == "running")
+        return {
+            "queued": len(_queue_order),
+            "running": running,
+            "max_workers": EVAL_MAX_WORKERS,
+            "max_queue": EVAL_MAX_QUEUE,
+            "avg_duration": sum(_durations) / len(_durations) if _durations else None,
+            **_counters,
+        }
@@ -1,34 +1,46 @@
 import os
-from pypdf import PdfReader
+import page_store
+from pdf_ingest import is_candidate_page
 
-def extract_questions(filename):
+def extract_questions(filename, texts=None):
     print(f"--- Processing: {filename} ---")
+    # 페이지 텍스트는 page_store(mmap)에서 읽음 (저장소에 없을 때만 PDF에서 추출해 추가)
     try:
-        reader = PdfReader(filename)
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text()
-            # 의예과 면접 관련 키워드가 있는 페이지만 출력 (너무 많으므로)
-            if "의예과" in text and "면접" in text:
-                print(f"[Page {i+1}]")
-                print(text)
-                print("-" * 50)
-            # 제시문, 문항 등의 키워드도 확인
-            elif "제시문" in text and ("가]" in text or "나]" in text):
-                 if "의학" in text or "실험" in text or "도표" in text:
-                    print(f"[Page {i+1} - Potential Question]")
-                    print(text[:500]) # 앞부분만 일단 출력
-                    print("-" * 50)
-
+        if texts is None:
+            texts = page_store.pages_of(filename)
+            if texts is None:
+                page_store.build([filename])
+                texts = page_store.pages_of(filename) or []
     except Exception as e:
         print(f"Error reading {filename}: {e}")
+        return
+    for i, text in enumerate(texts):
+        if not is_candidate_page(text):
+            continue
+        # 의예과 면접 관련 키워드가 있는 페이지만 출력 (너무 많으므로)
+        if "의예과" in text and "면접" in text:
+            print(f"[Page {i+1}]")
+            print(text)
+            print("-" * 50)
+        # 제시문, 문항 등의 키워드도 확인
+        else:
+            print(f"[Page {i+1} - Potential Question]")
+            print(text[:500]) # 앞부분만 일단 출력
+            print("-" * 50)
 
 files = [
     "2024학년도 연세대학교 대학별고사 선행학습 영향평가 결과보고서 별책(기출문제).pdf",
     "2025학년도 연세대학교 대학별고사 선행학습 영향평가 결과보고서(별책).pdf"
 ]
 
-for f in files:
-    if os.path.exists(f):
+if __name__ == "__main__":
+    existing = []
+    for f in files:
+        if os.path.exists(f):
+            existing.append(f)
+        else:
+            print(f"File not found: {f}")
+    # 저장소에 없는 파일만 한 번에 병렬 추출해서 추가 (읽을 수 없는 파일은 build가 오류를 출력하고 건너뜀)
+    page_store.build(existing)
+    for f in existing:
         extract_questions(f)
-    else:
-        print(f"File not found: {f}")
@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+
+# 면접 대화 기록 압축
+# 매 턴 전체 대화를 다시 보내면 질문 수에 비례해 프롬프트가 커지므로,
+# 현재 질문의 문답만 원문으로 보내고 지나간 질문은 질문 전환 시 한 번 만든 요약으로 대체
+# - 메시지마다 "q_index"(몇 번째 질문에 속하는지)를 기록해 두고 이를 기준으로 나눔
+# - 요약은 질문이 넘어갈 때 백그라운드에서 gpt-4o-mini로 생성, 아직 안 끝났거나 실패하면 로컬 요약 사용
+
+HISTORY_SUMMARY_WORKERS = int(os.environ.get("HISTORY_SUMMARY_WORKERS", "2"))
+# 로컬 요약(대체용)에서 답변을 잘라낼 길이
+LOCAL_SUMMARY_CHARS = int(os.environ.get("HISTORY_LOCAL_SUMMARY_CHARS", "200"))
+
+_executor = ThreadPoolExecutor(max_workers=HISTORY_SUMMARY_WORKERS, thread_name_prefix="history")
+
+def exchange(messages, q_index):
+    return [msg for msg in messages if msg.get("q_index") == q_index]
+
+def local_summary(question, messages):
+    # API 없이 만드는 요약: 지원자 답변 앞부분만 남김
+    answer = " ".join(msg["content"] for msg in messages if msg["role"] == "user")
+    answer = " ".join(answer.split())
+    if len(answer) > LOCAL_SUMMARY_CHARS:
+        answer = answer[:LOCAL_SUMMARY_CHARS] + "…"
+    return f"지원자 답변: {answer}" if answer else "지원자 답변 없음"
+
+def _summarize(api_key, question, messages):
+    from llm_manager import summarize_exchange
+    try:
+        return summarize_exchange(api_key, question, messages)
+    except Exception:
+        return local_summary(question, messages)
+
+def submit_summary(api_key, summaries, question, q_index, messages):
+    # 질문 전환 시 한 번만 호출: 해당 질문의 문답을 백그라운드에서 요약 (이미 있으면 건너뜀)
+    if q_index in summaries:
+        return
+    turns = [{"role": msg["role"], "content": msg["content"]} for msg in exchange(messages, q_index)]
+    if api_key:
+        summaries[q_index] = _executor.submit(tracing.bind(_summarize), api_key, question, turns)
+    else:
+        summaries[q_index] = local_summary(question, turns)
+
+def _summary_text(summary, question, messages):
+    # 요약이 아직 진행 중이면 기다리지 않고 로컬 요약 사용 (다음 턴에는 완료된 요약을 사용)
+    if isinstance(summary, str):
+        return summary
+    if summary is not None and summary.done():
+        return summary.result()
+    return local_summary(question, messages)
+
+def compact_messages(messages, current_index, summaries, questions):
+    # 프롬프트에 보낼 메시지: 지난 질문 요약(system 메시지 1개) + 현재 질문 문답 원문
+    # q_index가 없는 메시지(이전 버전 세션 등)는 그대로 유지
+    lines = []
+    for q_index in range(current_index):
+        turns = exchange(messages, q_index)
+        question = questions[q_index] if q_index < len(questions) else ""
+        lines.append(f"- 질문 {q_index + 1}: {question}\n  {_summary_text(summaries.get(q_index), question, turns)}")
+
+    compacted = []
+    if lines:
+        compacted.append({"role": "system", "content": "[이전 질문 요약]\n" + "\n".join(lines)})
+    compacted.extend(msg for msg in messages if msg.get("q_index", current_index) == current_index)
+    return compacted
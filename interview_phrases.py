@@ -0,0 +1,11 @@
+# 면접관 고정 멘트 및 목소리
+# TTS 캐시 키가 되므로 app.py와 사전 합성(tts_cache.py --prewarm)에서 반드시 같은 함수를 사용
+
+# 면접관 성격(0, 1, 2)별 목소리
+INTERVIEWER_VOICES = ["onyx", "shimmer", "alloy"]
+
+def welcome_message(first_question):
+    return f"반갑습니다. 면접을 시작하겠습니다. 첫 번째 질문입니다.\n\n{first_question}"
+
+def next_question_message(question):
+    return f"다음 질문 드리겠습니다.\n\n{question}"
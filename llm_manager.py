@@ -1,6 +1,96 @@
 import openai
+import httpx
+import audio_preprocess
+import io
+import json
 import os
-from questions import QUESTIONS
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import prompt_budget
+import speech_local
+import tracing
+import tts_cache
+
+# [공통] OpenAI 클라이언트 설정 (환경변수로 조정 가능)
+OPENAI_TIMEOUT = float(os.environ.get("OPENAI_TIMEOUT", "60"))
+OPENAI_CONNECT_TIMEOUT = float(os.environ.get("OPENAI_CONNECT_TIMEOUT", "5"))
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.environ.get("OPENAI_KEEPALIVE_EXPIRY", "60"))
+
+# [공통] 음성 설정
+TTS_MODEL = "tts-1"
+# 긴 답변을 조각으로 나눠 동시에 인식할 때 최대 동시 요청 수
+STT_CHUNK_WORKERS = int(os.environ.get("STT_CHUNK_WORKERS", "8"))
+_stt_executor = ThreadPoolExecutor(max_workers=STT_CHUNK_WORKERS, thread_name_prefix="stt")
+
+# [공통] 음성 엔진 선택 (배포 환경별로 지정)
+# - openai: Whisper / tts-1 API (기본)
+# - local: CPU에서 직접 실행 (speech_local.py: faster-whisper / espeak-ng)
+STT_PROVIDER = os.environ.get("STT_PROVIDER", "openai")
+TTS_PROVIDER = os.environ.get("TTS_PROVIDER", "openai")
+
+_stt_providers = {}
+_tts_providers = {}
+
+def register_stt_provider(name, transcribe, concurrent=True):
+    # transcribe(api_key, upload_bytes, upload_name) -> text
+    # concurrent=False: 같은 CPU를 나눠 쓰는 로컬 엔진은 긴 녹음 조각도 순서대로 처리
+    _stt_providers[name] = {"transcribe": transcribe, "concurrent": concurrent}
+
+def register_tts_provider(name, synthesize, model):
+    # synthesize(api_key, text, voice) -> 음성 bytes (mp3 또는 wav)
+    # model: TTS 캐시 key에 들어가는 이름 (엔진마다 다른 음성이 캐시되도록)
+    _tts_providers[name] = {"synthesize": synthesize, "model": model}
+
+def stt_provider(name=None):
+    name = name or STT_PROVIDER
+    if name not in _stt_providers:
+        raise ValueError(f"Unknown STT provider: {name} (available: {', '.join(_stt_providers)})")
+    return _stt_providers[name]
+
+def tts_provider(name=None):
+    name = name or TTS_PROVIDER
+    if name not in _tts_providers:
+        raise ValueError(f"Unknown TTS provider: {name} (available: {', '.join(_tts_providers)})")
+    return _tts_providers[name]
+
+# API 키별로 프로세스 전체에서 공유하는 클라이언트 (커넥션 풀 재사용)
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(api_key, base_url=None):
+    # base_url이 없으면 OPENAI_BASE_URL 환경변수 또는 기본 주소를 사용
+    base_url = base_url or os.environ.get("OPENAI_BASE_URL") or None
+    cache_key = (api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            # keep-alive 커넥션 풀: 매 호출마다 TCP/TLS 핸드셰이크를 하지 않도록 함
+            http_client = openai.DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY
+                )
+            )
+            # 재시도는 openai 라이브러리의 지수 백오프(exponential backoff)를 사용
+            client = openai.OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+                max_retries=OPENAI_MAX_RETRIES,
+                http_client=http_client
+            )
+            _clients[cache_key] = client
+    return client
+
+def close_clients():
+    # 테스트/벤치마크에서 풀을 비우고 싶을 때 사용
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
 
 # [공통] 문제 생성 시스템 프롬프트 (기본 설정)
 BASE_SYSTEM_PROMPT = """
@@ -64,9 +154,37 @@ GEN_SYSTEM_PROMPT_SCIENCE = BASE_SYSTEM_PROMPT + """
   - 예: "약물 A 투여 시 그래프 변화가 [가]와 같다. 제시문 [나]의 세포 기작을 바탕으로 그 원인을 추론하시오."
 """
 
-def generate_dynamic_question(api_key, topic, mode="ethics"):
-    client = openai.OpenAI(api_key=api_key)
-    
+# [구조화 출력] JSON 스키마로 문제를 받아 json.loads 한 번 + 검증으로 파싱 (줄 단위 파서는 대체 경로로 유지)
+# OPENAI_STRUCTURED_OUTPUT=0 이면 기존 TITLE:/CONTEXT: 형식으로 요청
+STRUCTURED_OUTPUT = os.environ.get("OPENAI_STRUCTURED_OUTPUT", "1") != "0"
+# 지정하면 생성 응답 원문을 JSONL로 기록 (bench_parse.py --corpus 로 파서 비교에 사용)
+GENERATION_RECORD_PATH = os.environ.get("GENERATION_RECORD_PATH")
+
+QUESTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "context": {"type": "string"},
+        "questions": {"type": "array", "items": {"type": "string"}},
+        "key_points": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["title", "context", "questions", "key_points"],
+    "additionalProperties": False
+}
+
+STRUCTURED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "interview_question", "strict": True, "schema": QUESTION_SCHEMA}
+}
+
+STRUCTURED_OUTPUT_INSTRUCTION = """
+**[출력 형식: JSON]**
+- 위 '출력 포맷'의 TITLE:/CONTEXT: 헤더 대신 JSON 객체 하나로만 답하세요.
+- title: 제목, context: 제시문 전체 (### [제시문 가] 헤더와 단락 간 줄바꿈 2번 유지)
+- questions: 질문 목록, key_points: 평가 포인트 목록 (번호나 '-' 없이 문장만)
+"""
+
+def build_generation_messages(topic, mode="ethics", structured=False):
     # 모드에 따른 프롬프트 선택
     if mode == "science":
         system_prompt = GEN_SYSTEM_PROMPT_SCIENCE
@@ -81,9 +199,8 @@ def generate_dynamic_question(api_key, topic, mode="ethics"):
         상반된 입장의 근거들을 제시문 [가], [나], [다]에 분산 배치하세요.
         """
     
-    # 예시 데이터 가져오기 (Few-shot)
-    example_key = list(QUESTIONS.keys())[0] 
-    example = QUESTIONS[example_key]
+    # 예시 데이터 가져오기 (Few-shot): 같은 유형의 짧은 기출 문제를 토큰 예산 안으로 줄여서 사용
+    example = prompt_budget.select_exemplar(mode)
     
     prompt = f"""
     [참고할 기출 문제 스타일]
@@ -98,21 +215,126 @@ def generate_dynamic_question(api_key, topic, mode="ethics"):
     
     **중요: '답'을 직접 알려주지 말고, '단서'만 제시하세요. 지원자가 스스로 연결해야 합니다.**
     """
+    # 예시 제시문을 줄이기 전과 비교한 절감량 기록 (select_exemplar가 미리 계산한 토큰 수 사용)
+    saved_tokens = example['full_context_tokens'] - example['context_tokens']
+    sent_tokens = prompt_budget.count_tokens(system_prompt + prompt)
+    prompt_budget.record("generation", sent_tokens + saved_tokens, sent_tokens)
+    if structured:
+        system_prompt += STRUCTURED_OUTPUT_INSTRUCTION
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+
+def generation_request(topic, mode="ethics", structured=False):
+    # chat.completions.create 인자 (동기/비동기 버전 공용)
+    request = {
+        "model": "gpt-4o",
+        "messages": build_generation_messages(topic, mode, structured),
+        "temperature": 0.7
+    }
+    if structured:
+        request["response_format"] = STRUCTURED_RESPONSE_FORMAT
+    return request
+
+def finish_generation(response, mode, structured):
+    message = response.choices[0].message
+    # 구조화 출력에서 모델이 거절하면 content 대신 refusal이 옴
+    if getattr(message, "refusal", None):
+        return {"error": message.refusal}
+    content = message.content or ""
+    record_generation_output(mode, structured, content)
+    return parse_question_output(content, structured)
+
+def _payload_size(messages):
+    # 추적용: 보내는 메시지 본문 크기(bytes)
+    return sum(len(msg["content"].encode("utf-8")) for msg in messages)
+
+@tracing.traced("generate_question")
+def generate_dynamic_question(api_key, topic, mode="ethics", structured=None):
+    client = get_client(api_key)
+    structured = STRUCTURED_OUTPUT if structured is None else structured
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o", 
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7 
-        )
-        content = response.choices[0].message.content
-        return parse_generated_content(content)
+        try:
+            response = client.chat.completions.create(**generation_request(topic, mode, structured))
+        except openai.BadRequestError:
+            # response_format을 지원하지 않는 모델/호환 서버 → 기존 줄 형식으로 다시 요청
+            if not structured:
+                raise
+            structured = False
+            response = client.chat.completions.create(**generation_request(topic, mode, structured))
+        tracing.record_usage(response.usage)
+        tracing.annotate(mode=mode, structured=structured)
+        return finish_generation(response, mode, structured)
     except Exception as e:
+        tracing.annotate(error=e)
         return {"error": str(e)}
 
+# 구조화 응답 파싱 결과 통계: structured(한 번에 성공) / fallback(줄 파서로 대체) / failed(대체해도 질문 없음)
+_parse_stats = {"structured": 0, "fallback": 0, "failed": 0}
+_parse_stats_lock = threading.Lock()
+_record_lock = threading.Lock()
+
+def _count_parse(kind):
+    with _parse_stats_lock:
+        _parse_stats[kind] += 1
+
+def parse_stats():
+    with _parse_stats_lock:
+        stats = dict(_parse_stats)
+    total = sum(stats.values())
+    stats["fallback_rate"] = (stats["fallback"] + stats["failed"]) / total if total else 0.0
+    return stats
+
+def record_generation_output(mode, structured, text):
+    if not GENERATION_RECORD_PATH:
+        return
+    line = json.dumps({"mode": mode, "structured": structured, "text": text}, ensure_ascii=False)
+    with _record_lock, open(GENERATION_RECORD_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def _string_list(data, field):
+    value = data.get(field)
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"'{field}' must be a list of strings")
+    return [v.strip() for v in value if v.strip()]
+
+def parse_structured_content(text):
+    # JSON 파싱과 스키마 검증을 한 번에 수행. 형식이 맞지 않으면 ValueError
+    text = text.strip()
+    if not text.startswith("{"):
+        # 스키마 없이 JSON만 요청한 경우 코드 블록(```json)이나 앞뒤 설명 문장이 붙어 오는 경우가 있음
+        text = text[text.find("{"):text.rfind("}") + 1]
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("structured output is not an object")
+    for field in ("title", "context"):
+        if not isinstance(data.get(field), str):
+            raise ValueError(f"'{field}' must be a string")
+    questions = _string_list(data, "questions")
+    if not questions:
+        raise ValueError("'questions' is empty")
+    return {
+        "title": data["title"].strip() or "AI 생성 문제",
+        "context": data["context"].strip(),
+        "questions": questions,
+        "key_points": _string_list(data, "key_points")
+    }
+
+def parse_question_output(text, structured=True):
+    # 구조화 응답은 JSON으로 먼저 파싱하고, 실패하면 기존 줄 파서로 대체
+    if not structured:
+        return parse_generated_content(text)
+    try:
+        data = parse_structured_content(text)
+        _count_parse("structured")
+        return data
+    except ValueError:
+        data = parse_generated_content(text)
+        _count_parse("fallback" if data.get("questions") else "failed")
+        return data
+
 def parse_generated_content(text):
     data = {"title": "AI 생성 문제", "context": "", "questions": [], "key_points": []}
     try:
@@ -151,9 +373,7 @@ def parse_generated_content(text):
     except Exception as e:
         return {"title": "파싱 에러", "context": text, "questions": ["질문 생성 중 오류가 발생했습니다."], "key_points": [], "error": str(e)}
 
-def get_ai_response(api_key, messages, personality, question_data, is_last_question=False):
-    client = openai.OpenAI(api_key=api_key)
-    
+def build_interviewer_messages(messages, personality, question_data, is_last_question=False):
     # 마지막 질문 여부에 따른 지시사항 분기
     if is_last_question:
         instruction_text = """
@@ -169,36 +389,77 @@ def get_ai_response(api_key, messages, personality, question_data, is_last_quest
         3. 더 이상 아무 말도 하지 말고 기다리세요. 사용자가 알아서 넘어갑니다.
         """
 
+    # 제시문과 질문 목록은 그대로 보내고, 턴 전체 토큰 예산을 넘으면 오래된 대화 기록부터 줄임
+    context = prompt_budget.interview_context(question_data)
+
     system_prompt = f"""
     당신은 의대 면접관입니다. 성격은 '{personality}'입니다.
     
     [현재 면접 문제]
-    {question_data.get('context', '')}
+    {context}
     {question_data.get('questions', '')}
     
     [지시사항]
     {instruction_text}
     """
     
+    system_tokens = prompt_budget.count_tokens(system_prompt)
+    full_tokens = system_tokens + sum(prompt_budget.count_tokens(msg["content"]) for msg in messages)
+    full_tokens += prompt_budget.count_tokens(question_data.get('context', '')) - prompt_budget.count_tokens(context)
+    messages = prompt_budget.fit_history(messages, prompt_budget.TURN_TOKEN_BUDGET - system_tokens)
+    sent_tokens = system_tokens + sum(prompt_budget.count_tokens(msg["content"]) for msg in messages)
+    prompt_budget.record("interview", full_tokens, sent_tokens)
+
     # 메시지 포맷 변환 (streamlit history -> openai messages)
     gpt_messages = [{"role": "system", "content": system_prompt}]
     for msg in messages:
         gpt_messages.append({"role": msg["role"], "content": msg["content"]})
+    return gpt_messages
+
+@tracing.traced("chat")
+def get_ai_response(api_key, messages, personality, question_data, is_last_question=False):
+    client = get_client(api_key)
+    gpt_messages = build_interviewer_messages(messages, personality, question_data, is_last_question)
         
     response = client.chat.completions.create(
         model="gpt-4o",
         messages=gpt_messages
     )
-    return response.choices[0].message.content
+    content = response.choices[0].message.content
+    tracing.record_usage(response.usage)
+    tracing.annotate(bytes_in=_payload_size(gpt_messages), bytes_out=len((content or "").encode("utf-8")))
+    return content
 
-def transcribe_audio(api_key, audio_bytes):
-    client = openai.OpenAI(api_key=api_key)
-    # 메모리 상의 오디오 데이터를 임시 파일로 저장하거나 바로 전송해야 함.
-    # streamlit-audiorecorder는 bytes를 반환함.
+@tracing.traced("chat_stream")
+def get_ai_response_stream(api_key, messages, personality, question_data, is_last_question=False):
+    # 스트리밍 버전: 토큰이 도착하는 대로 텍스트 조각을 yield (st.write_stream에 바로 전달 가능)
+    client = get_client(api_key)
+    gpt_messages = build_interviewer_messages(messages, personality, question_data, is_last_question)
+    tracing.annotate(bytes_in=_payload_size(gpt_messages))
+
+    # include_usage: 마지막에 choices 없이 토큰 사용량만 담긴 조각이 옴
+    stream = client.chat.completions.create(
+        model="gpt-4o",
+        messages=gpt_messages,
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    received = 0
+    for chunk in stream:
+        if not chunk.choices:
+            tracing.record_usage(chunk.usage)
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            received += len(delta.encode("utf-8"))
+            tracing.annotate(bytes_out=received)
+            yield delta
+
+def _transcribe_upload(api_key, upload_bytes, upload_name):
+    client = get_client(api_key)
     # API는 파일 객체를 원하므로, io.BytesIO와 name 속성을 사용.
-    import io
-    audio_file = io.BytesIO(audio_bytes)
-    audio_file.name = "input.wav"
+    audio_file = io.BytesIO(upload_bytes)
+    audio_file.name = upload_name
     
     transcript = client.audio.transcriptions.create(
         model="whisper-1",
@@ -207,21 +468,62 @@ def transcribe_audio(api_key, audio_bytes):
     )
     return transcript.text
 
-def text_to_speech(api_key, text, voice="onyx"):
-    client = openai.OpenAI(api_key=api_key)
+@tracing.traced("stt")
+def transcribe_audio(api_key, audio_bytes, provider=None):
+    # 메모리 상의 오디오 데이터를 임시 파일로 저장하거나 바로 전송해야 함.
+    # streamlit-audiorecorder는 bytes를 반환함.
+    # 업로드 전에 무음 제거/모노/16 kHz/압축으로 크기를 줄이고, 긴 녹음은 쉬는 구간에서 나눔 (audio_preprocess)
+    engine = stt_provider(provider)
+    transcribe = engine["transcribe"]
+    chunks = audio_preprocess.prepare_upload_chunks(audio_bytes)
+    # bytes_in: 전처리 후 실제로 보낸 크기 (audio_bytes: 녹음 원본 크기)
+    tracing.annotate(provider=provider or STT_PROVIDER, audio_bytes=len(audio_bytes),
+                     bytes_in=sum(len(c[0]) for c in chunks), chunks=len(chunks))
+    if len(chunks) == 1:
+        return transcribe(api_key, chunks[0][0], chunks[0][1])
+    if engine["concurrent"]:
+        # 조각들을 동시에 인식한 뒤 순서대로 이어 붙임 → 전체가 아니라 가장 긴 조각의 인식 시간만큼 기다림
+        futures = [_stt_executor.submit(tracing.bind(transcribe), api_key, data, name) for data, name, _ in chunks]
+        texts = [f.result() for f in futures]
+    else:
+        texts = [transcribe(api_key, data, name) for data, name, _ in chunks]
+    return audio_preprocess.stitch_transcripts(texts, [c[2] for c in chunks])
+
+def _synthesize(api_key, text, voice):
+    client = get_client(api_key)
     response = client.audio.speech.create(
-        model="tts-1",
+        model=TTS_MODEL,
         voice=voice,
         input=text
     )
     # 스트림 대신 바로 바이트로 반환
     return response.content
 
-def evaluate_interview(api_key, messages, question_data):
-    client = openai.OpenAI(api_key=api_key)
-    
+@tracing.traced("tts")
+def text_to_speech(api_key, text, voice="onyx", cache=False, provider=None):
+    # cache=True: 고정 멘트용. 디스크 캐시에 있으면 API를 호출하지 않음
+    engine = tts_provider(provider)
+    tracing.annotate(provider=provider or TTS_PROVIDER, bytes_in=len(text.encode("utf-8")))
+    if cache:
+        cached = tts_cache.get(text, voice, engine["model"])
+        if cached is not None:
+            tracing.annotate(cached=True, bytes_out=len(cached))
+            return cached
+
+    audio_bytes = engine["synthesize"](api_key, text, voice)
+    tracing.annotate(bytes_out=len(audio_bytes))
+    if cache:
+        tts_cache.put(text, voice, engine["model"], audio_bytes)
+    return audio_bytes
+
+register_stt_provider("openai", _transcribe_upload)
+register_tts_provider("openai", _synthesize, TTS_MODEL)
+register_stt_provider("local", speech_local.transcribe, concurrent=False)
+register_tts_provider("local", speech_local.synthesize, speech_local.TTS_MODEL)
+
+def build_evaluation_messages(messages, question_data):
     # 메시지 정제 (오디오 데이터 제외하고 텍스트만 추출)
-    # messages가 [{'role': 'user', 'content': '...', 'audio': b'...'}, ...] 형태일 수 있음.
+    # messages가 [{'role': 'user', 'content': '...', 'audio_id': '...'}, ...] 형태일 수 있음.
     filtered_messages = []
     for msg in messages:
         filtered_messages.append(f"{msg['role']}: {msg['content']}")
@@ -325,13 +627,55 @@ def evaluate_interview(api_key, messages, question_data):
        - 이유: 한 줄 요약
     """
     
+    return [{"role": "system", "content": "You are a professional grader."}, 
+            {"role": "user", "content": prompt}]
+
+@tracing.traced("evaluate")
+def run_evaluation(api_key, messages, question_data):
+    # API 오류를 그대로 raise (eval_jobs는 실패한 작업을 error로 저장해서 다시 평가할 수 있게 함)
+    client = get_client(api_key)
+    eval_messages = build_evaluation_messages(messages, question_data)
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=eval_messages
+    )
+    tracing.record_usage(response.usage)
+    tracing.annotate(bytes_in=_payload_size(eval_messages))
+    return response.choices[0].message.content
+
+def evaluate_interview(api_key, messages, question_data):
+    # 오류를 평가 결과 문자열로 돌려주는 버전 (화면에 바로 표시하는 호출용)
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "system", "content": "You are a professional grader."}, 
-                      {"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
+        return run_evaluation(api_key, messages, question_data)
     except Exception as e:
         return f"평가 생성 중 오류가 발생했습니다: {str(e)}"
 
+
+def build_summary_messages(question, messages):
+    # 지나간 질문 하나의 문답을 다음 턴 프롬프트에 넣을 짧은 요약으로 압축
+    transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in messages)
+    prompt = f"""
+    다음은 의대 면접에서 질문 하나에 대한 문답입니다.
+    지원자의 핵심 주장과 근거만 2~3문장으로 요약하세요. 평가나 조언은 쓰지 마세요.
+
+    [질문]
+    {question}
+
+    [문답]
+    {transcript}
+    """
+    return [{"role": "system", "content": "You summarize interview transcripts concisely in Korean."},
+            {"role": "user", "content": prompt}]
+
+@tracing.traced("summarize")
+def summarize_exchange(api_key, question, messages):
+    client = get_client(api_key)
+    summary_messages = build_summary_messages(question, messages)
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=summary_messages,
+        max_tokens=200
+    )
+    tracing.record_usage(response.usage)
+    tracing.annotate(bytes_in=_payload_size(summary_messages))
+    return response.choices[0].message.content
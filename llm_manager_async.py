@@ -0,0 +1,172 @@
+import asyncio
+import io
+import itertools
+import os
+import threading
+import weakref
+
+import httpx
+import openai
+
+import audio_preprocess
+import llm_manager
+import tts_cache
+from llm_manager import (
+    TTS_MODEL,
+    build_evaluation_messages,
+    build_interviewer_messages,
+    build_summary_messages,
+    finish_generation,
+    generation_request,
+)
+
+# llm_manager의 비동기(asyncio) 버전
+# Streamlit 외의 프런트엔드나 배치 도구에서 하나의 이벤트 루프로 수백 개의 면접 세션을 돌릴 때 사용
+# 프롬프트 구성과 파싱은 llm_manager와 동일한 함수를 그대로 사용함
+
+# 이벤트 루프 -> {(API 키, base_url): 클라이언트 목록} (httpx.AsyncClient는 생성된 루프에 묶이므로 루프별로 분리)
+# 루프 객체를 약한 참조 키로 사용: asyncio.run이 끝나 루프가 사라지면 그 루프의 클라이언트도 함께 정리되고,
+# id(loop)처럼 새 루프가 같은 값을 재사용해서 닫힌 루프에 묶인 클라이언트를 돌려받는 일이 없음
+_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_round_robin = itertools.count()
+
+# httpcore 커넥션 풀은 요청마다 풀 안의 모든 커넥션을 검사하므로(O(n)) 커넥션 수백 개를 한 풀에 두면
+# 동시 요청이 많을 때 CPU를 대부분 풀 관리에 씀 → 작은 풀 여러 개(shard)로 나눠 라운드 로빈으로 사용
+ASYNC_POOL_SHARD_SIZE = int(os.environ.get("OPENAI_ASYNC_POOL_SHARD_SIZE", "16"))
+
+def _new_async_client(api_key, base_url, max_connections):
+    http_client = openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=llm_manager.OPENAI_KEEPALIVE_EXPIRY
+        )
+    )
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=httpx.Timeout(llm_manager.OPENAI_TIMEOUT, connect=llm_manager.OPENAI_CONNECT_TIMEOUT),
+        max_retries=llm_manager.OPENAI_MAX_RETRIES,
+        http_client=http_client
+    )
+
+def get_async_client(api_key, base_url=None):
+    base_url = base_url or os.environ.get("OPENAI_BASE_URL") or None
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        loop_clients = _clients.setdefault(loop, {})
+        shards = loop_clients.get((api_key, base_url))
+        if shards is None:
+            total = llm_manager.OPENAI_MAX_CONNECTIONS
+            shard_count = max(1, -(-total // ASYNC_POOL_SHARD_SIZE))
+            per_shard = max(1, -(-total // shard_count))
+            shards = [_new_async_client(api_key, base_url, per_shard) for _ in range(shard_count)]
+            loop_clients[(api_key, base_url)] = shards
+    return shards[next(_round_robin) % len(shards)]
+
+async def close_async_clients():
+    # 현재 루프에서 만든 클라이언트를 닫음 (asyncio.run 종료 전에 호출)
+    with _clients_lock:
+        shards = _clients.pop(asyncio.get_running_loop(), {}).values()
+    for clients in shards:
+        for client in clients:
+            await client.close()
+
+async def generate_dynamic_question(api_key, topic, mode="ethics", structured=None):
+    client = get_async_client(api_key)
+    structured = llm_manager.STRUCTURED_OUTPUT if structured is None else structured
+    try:
+        try:
+            response = await client.chat.completions.create(**generation_request(topic, mode, structured))
+        except openai.BadRequestError:
+            if not structured:
+                raise
+            structured = False
+            response = await client.chat.completions.create(**generation_request(topic, mode, structured))
+        return finish_generation(response, mode, structured)
+    except Exception as e:
+        return {"error": str(e)}
+
+async def get_ai_response(api_key, messages, personality, question_data, is_last_question=False):
+    client = get_async_client(api_key)
+    response = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=build_interviewer_messages(messages, personality, question_data, is_last_question)
+    )
+    return response.choices[0].message.content
+
+async def get_ai_response_stream(api_key, messages, personality, question_data, is_last_question=False):
+    client = get_async_client(api_key)
+    stream = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=build_interviewer_messages(messages, personality, question_data, is_last_question),
+        stream=True
+    )
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
+
+async def _transcribe_upload(api_key, upload_bytes, upload_name):
+    client = get_async_client(api_key)
+    audio_file = io.BytesIO(upload_bytes)
+    audio_file.name = upload_name
+    transcript = await client.audio.transcriptions.create(
+        model="whisper-1",
+        file=audio_file,
+        language="ko"
+    )
+    return transcript.text
+
+async def transcribe_audio(api_key, audio_bytes, provider=None):
+    if (provider or llm_manager.STT_PROVIDER) != "openai":
+        # 로컬 엔진 등 동기 provider는 스레드에서 실행
+        return await asyncio.to_thread(llm_manager.transcribe_audio, api_key, audio_bytes, provider)
+    # numpy 전처리는 CPU 작업이므로 스레드에서 실행
+    chunks = await asyncio.to_thread(audio_preprocess.prepare_upload_chunks, audio_bytes)
+    # 긴 녹음은 조각을 동시에 인식해서 순서대로 이어 붙임
+    texts = await asyncio.gather(*(_transcribe_upload(api_key, data, name) for data, name, _ in chunks))
+    return audio_preprocess.stitch_transcripts(texts, [c[2] for c in chunks])
+
+async def text_to_speech(api_key, text, voice="onyx", cache=False, provider=None):
+    if (provider or llm_manager.TTS_PROVIDER) != "openai":
+        return await asyncio.to_thread(llm_manager.text_to_speech, api_key, text, voice, cache, provider)
+    # 디스크 캐시 입출력은 이벤트 루프를 막지 않도록 스레드에서 실행
+    if cache:
+        cached = await asyncio.to_thread(tts_cache.get, text, voice, TTS_MODEL)
+        if cached is not None:
+            return cached
+
+    client = get_async_client(api_key)
+    response = await client.audio.speech.create(
+        model=TTS_MODEL,
+        voice=voice,
+        input=text
+    )
+    audio_bytes = response.content
+    if cache:
+        await asyncio.to_thread(tts_cache.put, text, voice, TTS_MODEL, audio_bytes)
+    return audio_bytes
+
+async def evaluate_interview(api_key, messages, question_data):
+    client = get_async_client(api_key)
+    try:
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=build_evaluation_messages(messages, question_data)
+        )
+        return response.choices[0].message.content
+    except Exception as e:
+        return f"평가 생성 중 오류가 발생했습니다: {str(e)}"
+
+async def summarize_exchange(api_key, question, messages):
+    client = get_async_client(api_key)
+    response = await client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=build_summary_messages(question, messages),
+        max_tokens=200
+    )
+    return response.choices[0].message.content
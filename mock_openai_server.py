@@ -0,0 +1,311 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from audio_preprocess import duration_seconds
+from prompt_budget import count_tokens
+
+# 로컬 OpenAI 대역 서버 (벤치마크/오프라인 개발용)
+# llm_manager가 사용하는 엔드포인트(chat.completions(스트리밍 포함), audio.transcriptions, audio.speech)를 흉내냄
+# - 요청 종류(문제 생성/면접관 답변/요약/평가)별로 정해진 한국어 응답
+# - 지연: latency(요청당), token_latency(스트리밍 조각 사이), stt_rtf(음성 1초당 STT 처리 시간)
+# - 오류 주입: error_rate 비율의 요청에 error_status 응답 (seed로 재현 가능)
+# llm_manager는 OPENAI_BASE_URL 환경변수로 이 서버를 사용
+#
+# 사용법: python mock_openai_server.py --port 8765 --latency 0.3 --error-rate 0.05
+#         OPENAI_BASE_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+
+MOCK_CHAT_REPLY = "잘 들었습니다. 답변 감사합니다."
+# 마지막 질문에 대한 면접관 답변
+MOCK_FINAL_REPLY = "잘 들었습니다. 면접이 모두 종료되었습니다. 잠시 후 평가 결과가 제공됩니다."
+MOCK_SUMMARY = "지원자는 환자의 자율성을 가장 중요한 원칙으로 보고, 의학적 판단과 충돌할 때는 충분한 설명으로 합의를 이끌어야 한다고 주장했다."
+MOCK_TRANSCRIPT = "저는 환자의 자율성을 존중해야 한다고 생각합니다."
+MOCK_AUDIO = b"ID3" + b"\x00" * 2048  # 가짜 mp3 바이트
+# 문제 생성 응답 (response_format이 있으면 JSON, 없으면 TITLE:/CONTEXT: 형식)
+MOCK_QUESTION = {
+    "title": "[고난도] 제한된 중환자실 병상 배분",
+    "context": (
+        "### [제시문 가]\n"
+        "감염병 유행 3주 차, A 지역 거점 병원의 중환자실 병상은 10개가 남았다. 대기 중인 중증 환자는 23명이며, "
+        "이 중 14명은 65세 이상이다. 병원 윤리위원회 회의록에 따르면 지난주 병상을 배정받은 환자 9명 중 7명이 "
+        "입원 순서대로 배정되었고, 이 기간 대기 중 사망한 환자는 5명이었다. 같은 기간 인근 B 병원은 예상 생존 "
+        "확률이 높은 환자부터 배정했으며 대기 중 사망자는 2명, 중환자실 퇴원 후 30일 생존율은 A 병원보다 12%p 높았다.\n\n"
+        "### [제시문 나]\n"
+        "한 연구팀이 중환자 1,200명을 분석한 결과, 중증도 점수가 같은 환자 사이에서도 나이가 10세 많아질 때마다 "
+        "인공호흡기 이탈 성공률이 평균 6%p 낮아졌다. 그러나 기저 질환이 없는 75세 이상 환자군의 생존율은 기저 질환이 "
+        "있는 50대 환자군과 통계적으로 차이가 없었다. 연구팀은 '나이 자체보다 동반 질환과 허약 지수가 예후를 더 잘 "
+        "설명한다'고 보고했지만, 허약 지수 측정에는 평균 40분이 걸려 응급 상황에서는 거의 사용되지 않았다. "
+        "같은 자료에서 중환자실 재원 기간의 중앙값은 고령 환자군이 11일, 50대 환자군이 7일이었고, "
+        "재원 기간이 길수록 같은 병상으로 치료할 수 있는 환자 수는 줄어들었다. 연구팀은 병상 하나가 한 달 동안 "
+        "살릴 수 있는 환자 수를 기준으로 삼으면 결론이 달라질 수 있다고 덧붙였다.\n\n"
+        "### [제시문 다]\n"
+        "장애인 단체는 '예상 생존 확률'을 기준으로 삼으면 기저 질환이 많은 장애인이 구조적으로 뒤로 밀린다고 "
+        "문제를 제기했다. 실제로 한 지역에서 생존 확률 기준을 도입한 뒤 중증 장애인의 중환자실 입실률은 이전의 "
+        "절반으로 줄었다. 한편 의료진 설문에서 응답자의 68%는 '순서대로 배정하는 방식은 공정해 보이지만 더 많은 "
+        "생명을 구할 기회를 포기하는 것'이라고 답했고, 21%는 '어떤 기준이든 의사가 결정의 책임을 혼자 지는 것이 "
+        "가장 큰 문제'라고 답했다."
+    ),
+    "questions": [
+        "제시문 [가]와 [나]를 바탕으로 병상 배분 기준을 제시하고 그 근거를 설명하시오.",
+        "제시문 [다]의 문제 제기를 고려할 때, 본인이 제시한 기준의 한계와 보완 방법은 무엇인가?"
+    ],
+    "key_points": ["생존 확률과 형평성의 충돌 인식", "나이와 예후 자료의 구분", "제도적 책임 분담에 대한 고려"]
+}
+# 평가 응답 (llm_manager.build_evaluation_messages의 평가 양식)
+MOCK_EVALUATION = """1. **질문별 상세 분석**
+   - 질문 1: 환자의 자율성을 핵심 원칙으로 제시했으나 제시문의 자료를 근거로 활용하지 못했습니다.
+   - 질문 2: 기준의 한계를 인식했지만 구체적인 보완 방법이 부족했습니다.
+
+2. **항목별 점수 (100점 만점 환산)**
+    - 윤리 및 가치관: 22/30
+    - 논리적 사고력: 18/30
+    - 의사소통능력: 15/20
+    - 상황 대처 및 유연성: 12/20
+    - **총점 (Total Score)**: 67/100
+
+3. **종합 총평 및 고득점을 위한 조언 (Punchline Advice)**
+   - 강점: 일관된 가치관과 차분한 전달력
+   - 약점: 제시문 수치를 인용하지 않아 논거가 추상적임
+   - **[고득점 전략 Punchline 예제]**: "제시문 [나]에서 나이보다 동반 질환이 예후를 더 잘 설명하므로, 나이 대신 임상 지표를 기준으로 삼되 [다]의 우려를 줄이기 위해 장애를 이유로 한 감점은 배제해야 합니다."
+
+4. **최종 합격 여부 (Pass/Fail)**
+   - 판단: Borderline
+   - 이유: 가치관은 분명하나 자료 기반의 논증이 부족함"""
+
+# 오류 주입 대상 엔드포인트 이름
+ENDPOINTS = {"/chat/completions": "chat", "/audio/transcriptions": "stt", "/audio/speech": "tts"}
+
+def question_text(question):
+    # 구조화 출력을 쓰지 않는 문제 생성 요청용 (llm_manager.parse_generated_content 형식)
+    return "\n".join(
+        [f"TITLE: {question['title']}", "CONTEXT:", question["context"], "", "QUESTION_LIST:"]
+        + [f"- {q}" for q in question["questions"]]
+        + ["", "KEY_POINTS:"]
+        + [f"- {p}" for p in question["key_points"]]
+    )
+
+def canned_reply(request):
+    # 시스템 프롬프트로 요청 종류를 구분해서 정해진 응답 선택
+    messages = request.get("messages") or [{}]
+    system = messages[0].get("content") or ""
+    if request.get("response_format"):
+        return json.dumps(MOCK_QUESTION, ensure_ascii=False)
+    if "출제 위원" in system:
+        return question_text(MOCK_QUESTION)
+    if "professional grader" in system:
+        return MOCK_EVALUATION
+    if "summarize interview" in system:
+        return MOCK_SUMMARY
+    if "마지막 질문" in system:
+        return MOCK_FINAL_REPLY
+    return MOCK_CHAT_REPLY
+
+def usage(request, reply):
+    # 토큰 사용량 (prompt_budget의 토큰 계산으로 추정)
+    prompt_tokens = sum(count_tokens(msg.get("content") or "") for msg in request.get("messages", []))
+    completion_tokens = count_tokens(reply)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+
+def audio_seconds(body):
+    # 업로드(multipart 본문)에 들어 있는 음성 파일의 길이(초), 알 수 없으면 0
+    for magic in (b"fLaC", b"RIFF"):
+        pos = body.find(magic)
+        if pos >= 0:
+            return duration_seconds(body[pos:])
+    return 0.0
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    # keep-alive 지원 (커넥션 재사용 측정을 위해 필수)
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True # 헤더/본문 분할 전송 시 지연된 ACK 대기 방지
+
+    def log_message(self, format, *args):
+        pass # 콘솔 로그 생략
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data, status=200):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    def _send_chat_stream(self, text, usage=None):
+        # SSE(server-sent events) 형식으로 몇 글자씩 나눠 전송
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def write_event(data):
+            payload = f"data: {data}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(payload):X}\r\n".encode() + payload + b"\r\n")
+
+        for i in range(0, len(text), 4):
+            time.sleep(self.server.token_latency)
+            write_event(json.dumps({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": "mock",
+                "choices": [{"index": 0, "delta": {"content": text[i:i + 4]}, "finish_reason": None}]
+            }, ensure_ascii=False))
+        if usage:
+            # stream_options.include_usage: choices 없이 사용량만 담긴 마지막 조각
+            write_event(json.dumps({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": "mock",
+                "choices": [],
+                "usage": usage
+            }))
+        write_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _inject_error(self, endpoint):
+        # error_rate 비율로 오류 응답 (429는 rate limit, 그 외는 서버 오류로 표시)
+        server = self.server
+        if not server.error_rate or (server.error_endpoints and endpoint not in server.error_endpoints):
+            return False
+        with server.lock:
+            failed = server.rng.random() < server.error_rate
+            if failed:
+                server.counts["errors"] = server.counts.get("errors", 0) + 1
+        if failed:
+            kind = "rate_limit_exceeded" if server.error_status == 429 else "server_error"
+            self._send_json({"error": {"message": f"Injected {server.error_status} error", "type": kind, "code": kind}},
+                            status=server.error_status)
+        return failed
+
+    def do_POST(self):
+        body = self._read_body()
+        endpoint = next((name for suffix, name in ENDPOINTS.items() if self.path.endswith(suffix)), None)
+        with self.server.lock:
+            self.server.counts[endpoint] = self.server.counts.get(endpoint, 0) + 1
+        time.sleep(self.server.latency)
+        if endpoint and self._inject_error(endpoint):
+            return
+
+        if endpoint == "chat":
+            request = json.loads(body or b"{}")
+            reply = canned_reply(request)
+            if request.get("stream"):
+                include_usage = (request.get("stream_options") or {}).get("include_usage")
+                self._send_chat_stream(reply, usage(request, reply) if include_usage else None)
+                return
+            # 비스트리밍도 전체 생성 시간만큼 기다린 뒤 응답
+            time.sleep(self.server.token_latency * ((len(reply) + 3) // 4))
+            self._send_json({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "mock",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop"
+                }],
+                "usage": usage(request, reply)
+            })
+        elif endpoint == "stt":
+            # 실제 STT처럼 음성 길이에 비례하는 처리 시간 (stt_rtf: 음성 1초당 처리 시간)
+            time.sleep(self.server.stt_rtf * audio_seconds(body))
+            self._send_json({"text": MOCK_TRANSCRIPT})
+        elif endpoint == "tts":
+            # 입력 문장마다 다른 바이트를 돌려줌 (실제 TTS처럼 문장별로 구분되도록)
+            self._send(200, MOCK_AUDIO + hashlib.sha256(body).digest(), content_type="audio/mpeg")
+        else:
+            self._send_json({"error": {"message": f"Unknown path: {self.path}"}}, status=404)
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024 # 부하 테스트 시 동시 접속이 몰려도 연결이 거부되지 않도록
+
+def _create_server(host, port, latency=0.0, token_latency=0.0, stt_rtf=0.0,
+                   error_rate=0.0, error_status=500, error_endpoints=None, seed=0):
+    server = MockOpenAIServer((host, port), MockOpenAIHandler)
+    server.latency = latency
+    server.token_latency = token_latency
+    server.stt_rtf = stt_rtf
+    server.error_rate = error_rate
+    server.error_status = error_status
+    server.error_endpoints = set(error_endpoints or ())
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.counts = {} # 엔드포인트별 요청 수 + 주입한 오류 수
+    return server
+
+def start_server(host="127.0.0.1", port=0, latency=0.0, token_latency=0.0, stt_rtf=0.0,
+                 error_rate=0.0, error_status=500, error_endpoints=None, seed=0):
+    # port=0이면 빈 포트를 자동 할당. (server, base_url) 반환
+    # latency: 응답 시작 전 지연(초), token_latency: 스트리밍 조각 사이 지연(초)
+    # stt_rtf: 음성 인식 시 음성 1초당 처리 시간(초)
+    # error_rate: 오류로 응답할 요청 비율, error_status: 오류 HTTP 상태 코드,
+    # error_endpoints: 오류를 주입할 엔드포인트("chat", "stt", "tts", 없으면 전체), seed: 오류 발생 순서 고정
+    server = _create_server(host, port, latency, token_latency, stt_rtf, error_rate, error_status, error_endpoints, seed)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_address[1]}/v1"
+    return server, base_url
+
+def _serve_forever(port, latency, token_latency, stt_rtf=0.0, error_rate=0.0, error_status=500, error_endpoints=None, seed=0):
+    server = _create_server("127.0.0.1", port, latency, token_latency, stt_rtf, error_rate, error_status, error_endpoints, seed)
+    server.serve_forever()
+
+def start_server_process(latency=0.0, token_latency=0.0, stt_rtf=0.0, error_rate=0.0, error_status=500, error_endpoints=None, seed=0):
+    # 부하 테스트용: 별도 프로세스에서 실행해서 클라이언트와 GIL을 나눠 쓰지 않도록 함
+    # (process, base_url) 반환, 끝나면 process.terminate()
+    import multiprocessing
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = multiprocessing.Process(
+        target=_serve_forever,
+        args=(port, latency, token_latency, stt_rtf, error_rate, error_status, error_endpoints, seed),
+        daemon=True
+    )
+    process.start()
+    # 서버가 포트를 열 때까지 대기
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return process, f"http://127.0.0.1:{port}/v1"
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 응답 지연(초)")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="스트리밍 조각(4글자) 사이 지연(초)")
+    parser.add_argument("--stt-rtf", type=float, default=0.0, help="음성 1초당 STT 처리 시간(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=500, help="주입할 오류의 HTTP 상태 코드 (예: 429, 500, 503)")
+    parser.add_argument("--error-endpoints", nargs="+", choices=sorted(ENDPOINTS.values()), help="오류를 주입할 엔드포인트 (기본: 전체)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.host, args.port, args.latency, args.token_latency, args.stt_rtf,
+                                    args.error_rate, args.error_status, args.error_endpoints, args.seed)
+    print(f"Mock OpenAI server running at {base_url}")
+    print(f"  OPENAI_BASE_URL={base_url} streamlit run app.py")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"requests: {server.counts}")
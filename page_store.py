@@ -0,0 +1,259 @@
+import json
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+
+import pdf_ingest
+
+# PDF 페이지 텍스트 저장소 + 키워드 역색인
+# build할 때마다 새 버전 폴더(v<버전>/)에 세 파일을 모두 쓰고 current.json(버전 이름) 하나만 교체
+# → 읽는 쪽은 항상 같은 버전의 pages.bin / pages.json / index.json을 함께 엶
+# - pages.bin: 모든 페이지 텍스트(UTF-8)를 이어 붙인 파일 → mmap으로 필요한 페이지만 읽음
+# - pages.json: 문서 목록 (파일 이름, 해시, 연도, 페이지별 위치, 추출에 실패한 페이지)
+# - index.json: 글자 2-gram -> 해당 2-gram이 있는 페이지 id 목록
+# "제시문 and 실험" 같은 검색은 색인으로 후보 페이지를 좁힌 뒤 mmap 텍스트로 확인 (PDF는 열지 않음)
+# 한국어는 조사가 붙어 단어 단위 색인이 맞지 않으므로("실험에서", "실험을") 2-gram 색인을 사용
+
+PAGE_STORE_DIR = os.environ.get("PAGE_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".page_store"))
+
+_lock = threading.Lock()
+_store = None # {"mtime", "version", "docs", "pages", "index", "file", "mmap"}
+
+def _path(name, version=None):
+    # version이 ""이면 버전 폴더 없이 PAGE_STORE_DIR에 바로 있던 예전 형식
+    return os.path.join(PAGE_STORE_DIR, version, name) if version else os.path.join(PAGE_STORE_DIR, name)
+
+def _pointer():
+    # (current.json 변경 시각, 예전 형식 여부) 또는 저장소가 없으면 None
+    try:
+        return os.stat(_path("current.json")).st_mtime_ns, False
+    except FileNotFoundError:
+        pass
+    try:
+        return os.stat(_path("pages.json")).st_mtime_ns, True
+    except FileNotFoundError:
+        return None
+
+def _current_version(legacy):
+    if legacy:
+        return ""
+    with open(_path("current.json"), "r", encoding="utf-8") as f:
+        return json.load(f)["version"]
+
+def _bigrams(text):
+    text = re.sub(r"\s+", "", text)
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+def _open():
+    # 저장소가 다시 만들어졌으면(current.json 변경) 새 버전을 연다
+    global _store
+    pointer = _pointer()
+    if pointer is None:
+        return None
+    mtime, legacy = pointer
+    with _lock:
+        if _store is None or _store["mtime"] != mtime:
+            version = _current_version(legacy)
+            if _store is not None:
+                if _store["mmap"]:
+                    _store["mmap"].close()
+                _store["file"].close()
+            with open(_path("pages.json", version), "r", encoding="utf-8") as f:
+                docs = json.load(f)
+            with open(_path("index.json", version), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            f = open(_path("pages.bin", version), "rb")
+            # 빈 파일은 mmap할 수 없으므로 빈 bytes로 대체
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+            pages = [(d, page, offset, length) for d in docs for page, (offset, length) in enumerate(d["pages"])]
+            _store = {"mtime": mtime, "version": version, "docs": docs, "pages": pages, "index": index, "file": f, "mmap": mm}
+        return _store
+
+def page_text(page_id):
+    store = _open()
+    _, _, offset, length = store["pages"][page_id]
+    return store["mmap"][offset:offset + length].decode("utf-8")
+
+def _close():
+    # Windows에서는 mmap으로 열려 있는 파일을 지울 수 없으므로 예전 버전을 정리하기 전에 닫음
+    global _store
+    with _lock:
+        if _store is not None:
+            if _store["mmap"]:
+                _store["mmap"].close()
+            _store["file"].close()
+            _store = None
+
+def build(paths, workers=None):
+    # PDF를 저장소에 추가 (이미 있는 파일 해시는 건너뜀). 페이지 텍스트는 pdf_ingest 캐시를 사용
+    # 읽을 수 없는 파일은 오류를 출력하고 건너뜀 (나머지 파일은 그대로 추가)
+    # 추출에 실패한 페이지가 있는 문서는 다시 build할 때 그 페이지만 다시 추출해서 교체
+    store = _open()
+    old_docs = store["docs"] if store else []
+    known = {d["hash"] for d in old_docs if not d.get("missing")}
+    digests = {}
+    for path in paths:
+        try:
+            digest = pdf_ingest.file_hash(path)
+        except OSError as e:
+            print(f"Error reading {path}: {e}")
+            continue
+        if digest not in known and digest not in digests.values():
+            digests[path] = digest
+    extracted = pdf_ingest.extract_pages(list(digests), workers=workers) if digests else {}
+    digests = {path: digest for path, digest in digests.items() if path in extracted}
+    if not digests:
+        return 0
+
+    # (문서 정보, 페이지 텍스트) 목록: 기존 문서는 mmap에서, 새 문서는 추출 결과에서
+    sources = []
+    start = 0
+    for doc in old_docs:
+        if doc["hash"] not in digests.values():
+            sources.append((doc, [page_text(start + i) for i in range(len(doc["pages"]))]))
+        start += len(doc["pages"])
+    for path, digest in digests.items():
+        texts = extracted[path]
+        missing = pdf_ingest.missing_pages(digest, len(texts))
+        if missing:
+            print(f"{path}: {len(missing)} pages failed to extract (retried on next build)")
+        sources.append(({"file": os.path.basename(path), "hash": digest, "year": pdf_ingest.year_of(path, texts), "missing": missing}, texts))
+
+    version = f"v{time.time_ns():x}"
+    os.makedirs(_path("", version), exist_ok=True)
+    docs, index = [], {}
+    offset = page_id = 0
+    with open(_path("pages.bin", version), "wb") as f:
+        for doc, texts in sources:
+            doc = dict(doc, pages=[])
+            for text in texts:
+                data = text.encode("utf-8")
+                f.write(data)
+                doc["pages"].append([offset, len(data)])
+                offset += len(data)
+                for gram in _bigrams(text):
+                    index.setdefault(gram, []).append(page_id)
+                page_id += 1
+            docs.append(doc)
+
+    with open(_path("index.json", version), "w", encoding="utf-8") as f:
+        f.write(json.dumps(index, ensure_ascii=False))
+    with open(_path("pages.json", version), "w", encoding="utf-8") as f:
+        f.write(json.dumps(docs, ensure_ascii=False))
+    # current.json 하나만 교체 → 이 시점부터 읽는 쪽은 새 버전 폴더의 세 파일을 함께 사용
+    previous = store["version"] if store else None
+    with open(_path("current.json.tmp"), "w", encoding="utf-8") as f:
+        f.write(json.dumps({"version": version}))
+    os.replace(_path("current.json.tmp"), _path("current.json"))
+    _close()
+    _remove_old_versions(keep=(previous, version))
+    return len(digests)
+
+def _remove_old_versions(keep):
+    # 직전 버전은 남김 (방금 예전 current.json을 읽은 쪽이 아직 열 수 있음), 그보다 오래된 버전 폴더와 예전 형식 파일만 삭제
+    # Windows에서 다른 프로세스가 mmap으로 열고 있으면 지워지지 않으므로 다음 build에서 다시 시도
+    for name in os.listdir(PAGE_STORE_DIR):
+        path = _path(name)
+        if re.fullmatch(r"v[0-9a-f]+", name) and name not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+        elif name in ("pages.bin", "pages.json", "index.json") and "" not in keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def documents():
+    store = _open()
+    return store["docs"] if store else []
+
+def pages_of(path):
+    # 저장소에 있는 PDF의 페이지 텍스트 목록 (없으면 None)
+    # 같은 내용의 파일이 이름만 다르게 있을 수 있으므로 파일 해시로 찾음
+    store = _open()
+    if store is None:
+        return None
+    digest = pdf_ingest.file_hash(path)
+    start = 0
+    for doc in store["docs"]:
+        if doc["hash"] == digest:
+            return [page_text(start + i) for i in range(len(doc["pages"]))]
+        start += len(doc["pages"])
+    return None
+
+def _squeeze(text):
+    return re.sub(r"\s+", "", text)
+
+def _term_pages(store, term):
+    grams = _bigrams(term)
+    if not grams:
+        # 한 글자 검색어는 색인으로 좁힐 수 없으므로 전체 페이지가 후보
+        return set(range(len(store["pages"])))
+    postings = sorted((store["index"].get(g, []) for g in grams), key=len)
+    result = set(postings[0])
+    for posting in postings[1:]:
+        result.intersection_update(posting)
+    return result
+
+def search(terms, any_term=False, year=None, file_name=None):
+    # 검색어가 모두(any_term=True면 하나라도) 들어 있는 페이지: [(파일, 연도, 페이지 번호(0부터), 텍스트), ...]
+    # 공백·줄바꿈은 무시하고 비교 (PDF 추출 시 단어 중간에 줄바꿈이 들어가는 경우가 많음)
+    store = _open()
+    if store is None or not terms:
+        return []
+    candidate_sets = [_term_pages(store, term) for term in terms]
+    candidates = set.union(*candidate_sets) if any_term else set.intersection(*candidate_sets)
+
+    squeezed_terms = [_squeeze(term) for term in terms]
+    check = any if any_term else all
+    results = []
+    for page_id in sorted(candidates):
+        doc, page, _, _ = store["pages"][page_id]
+        if year and year not in doc["year"]:
+            continue
+        if file_name and doc["file"] != file_name:
+            continue
+        # 2-gram이 모두 있어도 순서가 다를 수 있으므로 실제 텍스트로 확인
+        text = page_text(page_id)
+        squeezed = _squeeze(text)
+        if check(term in squeezed for term in squeezed_terms):
+            results.append((doc["file"], doc["year"], page, text))
+    return results
+
+def _snippet(text, term, width=40):
+    flat = " ".join(text.split())
+    pos = flat.find(term)
+    if pos < 0:
+        return flat[:width * 2]
+    return flat[max(0, pos - width):pos + len(term) + width]
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="PDF 페이지 저장소 / 키워드 검색")
+    sub = parser.add_subparsers(dest="command")
+    p_build = sub.add_parser("build", help="PDF를 저장소에 추가")
+    p_build.add_argument("pdfs", nargs="+")
+    p_search = sub.add_parser("search", help="키워드가 들어 있는 페이지 검색")
+    p_search.add_argument("terms", nargs="+")
+    p_search.add_argument("--any", action="store_true", help="검색어 중 하나라도 있으면 (기본: 모두)")
+    p_search.add_argument("--year", help="예: 2024")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        paths = []
+        for p in args.pdfs:
+            if os.path.exists(p):
+                paths.append(p)
+            else:
+                print(f"File not found: {p}")
+        print(f"Added {build(paths)} files.")
+    elif args.command == "search":
+        results = search(args.terms, any_term=args.any, year=args.year)
+        for file_name, year, page, text in results:
+            print(f"[{year}] {file_name} p.{page + 1}: ...{_snippet(text, args.terms[0])}...")
+        print(f"{len(results)} pages")
+    else:
+        for doc in documents():
+            print(f"[{doc['year']}] {doc['file']} ({len(doc['pages'])} pages)")
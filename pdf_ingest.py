@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# 기출문제 PDF 수집 도구
+# - 여러 PDF를 페이지 구간 단위로 나눠 여러 프로세스에서 동시에 텍스트 추출
+# - 추출한 텍스트는 (파일 해시, 페이지) 단위로 캐시 → 바뀌지 않은 PDF는 다시 열지 않음
+# - 면접 문제로 보이는 페이지를 problem.md 형식의 후보 문제로 만들어 출력 (question_bank 저장소로도 기록 가능)
+#
+# 사용법: python pdf_ingest.py a.pdf b.pdf --markdown candidates.md [--bank candidates.jsonl]
+
+PDF_CACHE_DIR = os.environ.get("PDF_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pdf_cache"))
+PDF_INGEST_WORKERS = int(os.environ.get("PDF_INGEST_WORKERS", str(os.cpu_count() or 1)))
+PDF_PAGES_PER_TASK = int(os.environ.get("PDF_PAGES_PER_TASK", "8"))
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _cache_dir(digest):
+    return os.path.join(PDF_CACHE_DIR, digest[:2], digest)
+
+def _page_path(digest, page):
+    return os.path.join(_cache_dir(digest), f"{page:05d}.txt")
+
+def _meta_path(digest):
+    return os.path.join(_cache_dir(digest), "meta.json")
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def cached_page_count(digest):
+    try:
+        with open(_meta_path(digest), "r", encoding="utf-8") as f:
+            return json.load(f)["page_count"]
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+def read_cached_page(digest, page):
+    try:
+        with open(_page_path(digest, page), "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def missing_pages(digest, page_count):
+    # 아직 캐시에 없는(추출하지 않았거나 추출에 실패한) 페이지 번호
+    return [p for p in range(page_count) if not os.path.exists(_page_path(digest, p))]
+
+def _count_pages(path, digest):
+    from pypdf import PdfReader
+    page_count = len(PdfReader(path).pages)
+    os.makedirs(_cache_dir(digest), exist_ok=True)
+    _write_atomic(_meta_path(digest), json.dumps({"name": os.path.basename(path), "page_count": page_count}, ensure_ascii=False))
+    return page_count
+
+def _extract_range(path, digest, pages):
+    # 작업 프로세스에서 실행: 페이지 구간을 추출해서 페이지별 캐시 파일로 저장
+    from pypdf import PdfReader
+    reader = PdfReader(path)
+    for page in pages:
+        try:
+            text = reader.pages[page].extract_text() or ""
+        except Exception as e:
+            # 깨진 페이지 하나 때문에 파일 전체를 버리지 않음. 실패한 페이지는 캐시하지 않음 → 다음 실행에서 다시 추출
+            print(f"Error reading {path} page {page + 1}: {e}")
+            continue
+        _write_atomic(_page_path(digest, page), text)
+    return len(pages)
+
+def extract_pages(paths, workers=None):
+    # {path: [page text, ...]} 반환. 캐시에 없는 페이지만 프로세스 풀에서 추출
+    # 열 수 없는 PDF는 오류를 출력하고 결과에서 뺌 (나머지 파일은 그대로 처리)
+    workers = workers or PDF_INGEST_WORKERS
+    digests = {}
+    tasks = []
+    page_counts = {}
+    for path in paths:
+        try:
+            digest = file_hash(path)
+            page_count = cached_page_count(digest)
+            if page_count is None:
+                page_count = _count_pages(path, digest)
+        except Exception as e:
+            print(f"Error reading {path}: {e}")
+            continue
+        digests[path] = digest
+        page_counts[path] = page_count
+        missing = missing_pages(digest, page_count)
+        for i in range(0, len(missing), PDF_PAGES_PER_TASK):
+            tasks.append((path, digest, missing[i:i + PDF_PAGES_PER_TASK]))
+
+    # 구간 하나가 실패해도 다른 구간은 계속 추출 (추출하지 못한 페이지는 빈 텍스트, 캐시하지 않으므로 다음 실행에서 재시도)
+    if tasks:
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                futures = [(task[0], executor.submit(_extract_range, *task)) for task in tasks]
+                for path, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error reading {path}: {e}")
+        else:
+            for task in tasks:
+                try:
+                    _extract_range(*task)
+                except Exception as e:
+                    print(f"Error reading {task[0]}: {e}")
+
+    return {path: [read_cached_page(digest, p) or "" for p in range(page_counts[path])] for path, digest in digests.items()}
+
+# --- 후보 문제 추출 ---
+
+def is_candidate_page(text):
+    # extract_pdf.py의 기존 키워드 기준과 동일
+    if "의예과" in text and "면접" in text:
+        return True
+    if "제시문" in text and ("가]" in text or "나]" in text):
+        return "의학" in text or "실험" in text or "도표" in text
+    return False
+
+_SCIENCE_WORDS = ("실험", "그래프", "도표", "세포", "분자", "유전", "화학", "물리")
+_PROBLEM_START = re.compile(r"\[?문제\s*(\d+)\]?")
+_PROBLEM_LINE = re.compile(r"^\s*\[?문제\s*\d+\]?\s*(.*)$")
+_PASSAGE_START = re.compile(r"^\s*\[?제시문\s*(\[?[가-하]\]?)?\]?\s*(.*)$")
+_QUESTION_LINE = re.compile(r"^\s*(?:\[?(?:질문|문항)\s*\d*\]?|\(\d+\)|\d+\s*[.)])\s*(.+)$")
+_YEAR = re.compile(r"(20\d\d)학년도")
+
+def year_of(path, texts):
+    m = _YEAR.search(os.path.basename(path)) or next((m for m in map(_YEAR.search, texts) if m), None)
+    return f"{m.group(1)}학년도" if m else "연도 미상"
+
+def _problem_markdown(number, page_label, lines):
+    # 페이지 텍스트를 problem.md의 문제 블록 형식으로 변환 (질문으로 보이는 줄은 질문 목록으로)
+    # "[문제 N] 제목" 줄이 있으면 제목으로 사용
+    title = page_label
+    body = []
+    for line in lines:
+        m_title = _PROBLEM_LINE.match(line)
+        if m_title and title == page_label:
+            title = f"{m_title.group(1).strip()} ({page_label})".strip()
+            continue
+        body.append(line)
+
+    out = [f"**[문제 {number}] {title}**", ""]
+    questions = []
+    for line in body:
+        line = line.strip()
+        if not line:
+            continue
+        m_q = _QUESTION_LINE.match(line)
+        if m_q and not _PASSAGE_START.match(line):
+            questions.append(m_q.group(1).strip())
+            continue
+        m_p = _PASSAGE_START.match(line)
+        if m_p:
+            label = m_p.group(1) or ""
+            if label and not label.startswith("["):
+                label = f"[{label.strip(']')}]"
+            out.append(f"> **제시문 {label}**".rstrip())
+            if m_p.group(2):
+                out.append(f"> {m_p.group(2)}")
+            continue
+        out.append(f"> {line}")
+    out.append("")
+    for i, q in enumerate(questions or ["(질문을 찾지 못함 - 원문 확인 필요)"], 1):
+        out.append(f"* **질문 {i}**: {q}")
+    out.append("")
+    return out
+
+def candidate_markdown(pages_by_path):
+    # 후보 페이지를 문제 단위로 묶어 problem.md 형식 문자열로 반환
+    # 연속된 후보 페이지는 한 문제로 합치고, "문제 N" 표시가 새로 나오면 새 문제로 나눔
+    out = ["# PDF 추출 후보 문제 (검토 후 problem.md에 반영)", ""]
+    for path, texts in pages_by_path.items():
+        groups = [] # [(첫 페이지 번호, 문제 번호, [줄...]), ...]
+        previous = None
+        for page, text in enumerate(texts):
+            if not is_candidate_page(text):
+                previous = None
+                continue
+            m = _PROBLEM_START.search(text)
+            if previous is None or previous != page - 1 or m:
+                groups.append((page, m.group(1) if m else str(len(groups) + 1), []))
+            groups[-1][2].extend(text.splitlines())
+            previous = page
+
+        if not groups:
+            continue
+        stem = os.path.splitext(os.path.basename(path))[0]
+        section = stem if _YEAR.search(stem) else f"{year_of(path, texts)} {stem}"
+        out.extend([f"## {section}", ""])
+        for part, science in (("[Part 1: 인성 및 가치관 면접]", False), ("[Part 2: 과학적 사고력]", True)):
+            part_groups = [g for g in groups if any(w in "\n".join(g[2]) for w in _SCIENCE_WORDS) == science]
+            if not part_groups:
+                continue
+            out.extend([f"### {part}", ""])
+            for page, number, lines in part_groups:
+                out.extend(_problem_markdown(number, f"p.{page + 1}", lines))
+    return "\n".join(out) + "\n"
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="기출문제 PDF 병렬 추출 및 후보 문제 생성")
+    parser.add_argument("pdfs", nargs="+")
+    parser.add_argument("--workers", type=int, default=PDF_INGEST_WORKERS)
+    parser.add_argument("--markdown", metavar="PATH", help="후보 문제를 problem.md 형식으로 저장")
+    parser.add_argument("--bank", metavar="PATH", help="후보 문제를 question_bank 저장소(jsonl)로 저장")
+    args = parser.parse_args()
+
+    paths = []
+    for p in args.pdfs:
+        if os.path.exists(p):
+            paths.append(p)
+        else:
+            print(f"File not found: {p}")
+    start = time.perf_counter()
+    pages = extract_pages(paths, workers=args.workers)
+    print(f"Extracted {sum(map(len, pages.values()))} pages from {len(pages)} files in {time.perf_counter() - start:.2f}s")
+
+    markdown = candidate_markdown(pages)
+    if args.markdown:
+        with open(args.markdown, "w", encoding="utf-8") as f:
+            f.write(markdown)
+    if args.bank:
+        import question_bank
+        from update_questions import iter_problems
+        count = question_bank.write_bank(iter_problems(markdown.splitlines(keepends=True)), args.bank)
+        print(f"Wrote {count} candidate problems to {args.bank}")
+    if not args.markdown and not args.bank:
+        print(markdown)
@@ -0,0 +1,155 @@
+import functools
+import logging
+import os
+import re
+import threading
+
+import question_bank
+
+# 프롬프트 토큰 예산 관리
+# - 문제 생성: 기출 문제 전체를 예시로 붙이지 않고, 요청한 유형(인성/과학)에 맞는 짧은 예시를 골라 예산 안으로 줄임
+# - 면접 진행: 제시문과 질문 목록은 그대로 보내고, 턴 전체 예산을 넘으면 오래된 대화 기록부터 줄임
+# - 호출마다 줄이기 전/후 토큰 수를 기록해서 절감량을 보고
+
+logger = logging.getLogger(__name__)
+
+EXEMPLAR_TOKEN_BUDGET = int(os.environ.get("PROMPT_EXEMPLAR_TOKENS", "600"))
+# 생성된 문제의 제시문이 비정상적으로 길 때만 적용하는 상한 (기출 문제 중 가장 긴 제시문보다 작아지지 않음)
+INTERVIEW_CONTEXT_TOKEN_BUDGET = int(os.environ.get("PROMPT_INTERVIEW_CONTEXT_TOKENS", "4000"))
+# 면접 한 턴 전체(시스템 프롬프트 + 대화 기록) 예산. 넘으면 제시문 대신 오래된 대화 기록을 줄임
+TURN_TOKEN_BUDGET = int(os.environ.get("PROMPT_TURN_TOKENS", "3000"))
+# 대화 기록을 줄일 때 메시지 하나에 최소한 남기는 토큰 수
+MIN_MESSAGE_TOKENS = 60
+
+TRUNCATION_MARK = " …(중략)"
+
+_lock = threading.Lock()
+_stats = {} # kind -> {"calls", "tokens_full", "tokens_sent", "last_saved"}
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    # tiktoken이 설치되어 있고 인코딩 파일을 받을 수 있으면 정확히 계산, 아니면 근사치 사용
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+_HANGUL = re.compile(r"[가-힣]")
+
+def count_tokens(text):
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 근사치: 한글은 대략 글자당 1토큰, 그 외(영문·숫자·기호)는 4글자당 1토큰
+    hangul = len(_HANGUL.findall(text))
+    others = len(text) - hangul - text.count(" ")
+    return hangul + (others + 3) // 4
+
+def _truncate(text, max_tokens):
+    if count_tokens(text) <= max_tokens:
+        return text
+    kept = ""
+    for sentence in re.split(r"(?<=[.!?다])\s+", text):
+        candidate = f"{kept} {sentence}".strip()
+        if count_tokens(candidate) > max_tokens:
+            break
+        kept = candidate
+    if not kept:
+        # 첫 문장부터 예산을 넘으면 글자 수로 자름
+        kept = text[:max(max_tokens, 1)]
+    return kept + TRUNCATION_MARK
+
+def fit_to_budget(text, max_tokens):
+    # 단락([제시문 가] 등) 구조는 유지하면서 각 단락을 앞부분 위주로 균등하게 줄임
+    if count_tokens(text) <= max_tokens:
+        return text
+    blocks = [b.strip() for b in text.split("\n\n") if b.strip()]
+    headers = [b for b in blocks if b.startswith("#")]
+    bodies = [b for b in blocks if not b.startswith("#")]
+    header_tokens = sum(count_tokens(h) for h in headers)
+    share = max((max_tokens - header_tokens) // max(len(bodies), 1), 20)
+    return "\n\n".join(b if b.startswith("#") else _truncate(b, share) for b in blocks)
+
+def is_science(question_data):
+    # evaluate_interview와 같은 기준 (Part 2 = 과학적 사고력)
+    title = question_data.get("title", "")
+    return "Part 2" in title or "과학" in title
+
+def select_exemplar(mode):
+    # 요청 유형과 같은 파트의 기출 문제 중 가장 짧은 것을 예시로 사용하고 예산 안으로 줄임
+    # 인덱스가 바뀌면(update_questions.py 실행 등) 다시 고름
+    return _select_exemplar(mode, question_bank.version())
+
+@functools.lru_cache(maxsize=4)
+def _select_exemplar(mode, version):
+    # 인덱스의 제시문 길이로 고르고 선택한 문제 하나만 읽음
+    candidates = [e for e in question_bank.entries() if is_science(e) == (mode == "science")] or question_bank.entries()
+    entry = min(candidates, key=lambda e: e["context_length"])
+    example = question_bank.get(entry["key"])
+    context = fit_to_budget(example["context"], EXEMPLAR_TOKEN_BUDGET)
+    return {
+        "title": example["title"],
+        "context": context,
+        "questions": example["questions"],
+        # 절감량 기록용: 줄이기 전/후 제시문 토큰 수
+        "full_context_tokens": count_tokens(example["context"]),
+        "context_tokens": count_tokens(context),
+    }
+
+def interview_context(question_data):
+    # 면접관이 보는 제시문은 줄이지 않음. 상한은 기출 문제에는 걸리지 않도록 가장 긴 기출 제시문(인덱스에 기록된 토큰 수) 이상으로 둠
+    context = question_data.get("context", "")
+    return fit_to_budget(context, max(INTERVIEW_CONTEXT_TOKEN_BUDGET, question_bank.max_context_tokens()))
+
+def fit_history(messages, max_tokens):
+    # 대화 기록을 예산 안으로: 오래된 메시지(지난 질문 요약부터)를 먼저 줄이고 마지막 메시지(현재 답변)는 그대로 둠
+    total = sum(count_tokens(msg["content"]) for msg in messages)
+    if total <= max_tokens:
+        return messages
+    fitted = [dict(msg) for msg in messages]
+    for msg in fitted[:-1]:
+        over = total - max_tokens
+        if over <= 0:
+            break
+        tokens = count_tokens(msg["content"])
+        if tokens <= MIN_MESSAGE_TOKENS:
+            continue
+        msg["content"] = _truncate(msg["content"], max(tokens - over, MIN_MESSAGE_TOKENS))
+        total -= tokens - count_tokens(msg["content"])
+    return fitted
+
+def record(kind, tokens_full, tokens_sent):
+    saved = tokens_full - tokens_sent
+    with _lock:
+        stat = _stats.setdefault(kind, {"calls": 0, "tokens_full": 0, "tokens_sent": 0, "last_saved": 0})
+        stat["calls"] += 1
+        stat["tokens_full"] += tokens_full
+        stat["tokens_sent"] += tokens_sent
+        stat["last_saved"] = saved
+    logger.info("prompt[%s] %d -> %d tokens (saved %d)", kind, tokens_full, tokens_sent, saved)
+    return saved
+
+def report():
+    with _lock:
+        result = {}
+        for kind, stat in _stats.items():
+            saved = stat["tokens_full"] - stat["tokens_sent"]
+            result[kind] = dict(stat, tokens_saved=saved, saved_per_call=saved / stat["calls"])
+        return result
+
+if __name__ == "__main__":
+    # 기출 문제별로 줄이기 전/후 프롬프트 토큰 수 비교
+    # (llm_manager가 기록하는 쪽은 import된 prompt_budget 모듈이므로 그 모듈의 report를 사용)
+    import prompt_budget
+    from llm_manager import build_generation_messages, build_interviewer_messages
+
+    print(f"tokenizer: {'tiktoken o200k_base' if prompt_budget._encoding() else 'approximation'}")
+    for mode in ("ethics", "science"):
+        build_generation_messages("안락사", mode)
+    for _, q in question_bank.iter_questions():
+        build_interviewer_messages([{"role": "user", "content": "답변입니다."}], "논리적이고 사실 중심 스타일", q)
+    for kind, stat in prompt_budget.report().items():
+        print(f"{kind:<12} calls={stat['calls']:>3}  full={stat['tokens_full']:>6}  sent={stat['tokens_sent']:>6}  saved/call={stat['saved_per_call']:.0f}")
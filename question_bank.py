@@ -0,0 +1,248 @@
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+
+# 기출 문제 저장소
+# - questions.jsonl: 문제 하나당 한 줄(JSON, 줄마다 key 포함)
+# - questions.index.json: 메타데이터 목록 (key, year, part, title, 질문 수, 제시문 길이/토큰 수, 파일 내 위치)
+#   쓰는 쪽은 임시 파일에 기록한 뒤 저장소 → 인덱스 순으로 os.replace (인덱스 교체가 새 저장소로 넘어가는 시점)
+#   그 사이에 읽으면 새 저장소에 예전 위치를 쓰게 되므로, 읽은 줄의 key가 다르면 인덱스가 교체될 때까지 잠깐 기다렸다가 다시 읽음
+# 시작 시 작은 인덱스만 읽고, 제시문이 포함된 전체 문제는 필요할 때 해당 위치만 읽어옴 (LRU 캐시)
+# 문제가 수천 개로 늘어도 import와 Streamlit 리런 속도가 거의 그대로 유지됨
+
+BANK_PATH = os.environ.get("QUESTION_BANK_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.jsonl"))
+CACHE_SIZE = int(os.environ.get("QUESTION_BANK_CACHE_SIZE", "32"))
+# 저장소와 인덱스가 맞지 않을 때 인덱스 교체를 기다리는 횟수와 간격(초)
+READ_RETRIES = 50
+READ_RETRY_DELAY = 0.02
+
+_lock = threading.Lock()
+_index = None # {"mtime", "entries", "by_key", "keys", "max_context_tokens"}
+
+class StaleIndexError(ValueError):
+    pass
+
+def index_path(bank_path=None):
+    return os.path.splitext(bank_path or BANK_PATH)[0] + ".index.json"
+
+def _parse_index(data, path):
+    # 인덱스는 메타데이터 목록. 다른 형식(버전 파일을 가리키던 {"bank", "entries"})은 다시 만들어야 함
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: 지원하지 않는 인덱스 형식입니다. python update_questions.py --full 로 저장소를 다시 만드세요.")
+    return data
+
+_KEY_PATTERN = re.compile(r"^(.*?)\s+(Part \d+|General)\s+-\s+(.*)$")
+
+def split_key(key):
+    # "2025학년도 정시모집 (의예과) Part 1 - [문제 1] ..." -> (연도, 파트)
+    m = _KEY_PATTERN.match(key)
+    if not m:
+        return "", ""
+    return m.group(1), m.group(2)
+
+def _load_index():
+    # 인덱스 파일이 바뀌었으면(update_questions.py 실행 등) 다시 읽음
+    global _index
+    path = index_path()
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        if _index is None or _index["mtime"] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = _parse_index(json.load(f), path)
+            _index = {
+                "mtime": mtime,
+                "entries": entries,
+                "by_key": {e["key"]: e for e in entries},
+                "keys": tuple(e["key"] for e in entries),
+                "max_context_tokens": max((_context_tokens(e) for e in entries), default=0),
+            }
+            _read_record.cache_clear()
+        return _index
+
+def _context_tokens(entry):
+    # 토큰 수가 없는 예전 인덱스는 글자 수로 대신함 (한글·영문 모두 토큰 수보다 크거나 같음)
+    return entry.get("context_tokens", entry["context_length"])
+
+def version():
+    # 인덱스가 바뀌면 달라지는 값 (인덱스에서 계산한 값을 캐시할 때 키로 사용)
+    return _load_index()["mtime"]
+
+def max_context_tokens():
+    # 가장 긴 제시문의 토큰 수 (인덱스만 사용, 제시문은 읽지 않음)
+    return _load_index()["max_context_tokens"]
+
+def keys():
+    return _load_index()["keys"]
+
+def meta(key):
+    return _load_index()["by_key"][key]
+
+def entries(part=None):
+    # 메타데이터만 반환 (제시문은 읽지 않음)
+    return [e for e in _load_index()["entries"] if part is None or e["part"] == part]
+
+def random_key():
+    return random.choice(keys())
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _read_record(key, offset, length, mtime):
+    # 위치의 줄이 해당 문제가 아니면(저장소만 먼저 교체된 경우) 예외 → 캐시되지 않음
+    with open(BANK_PATH, "rb") as f:
+        f.seek(offset)
+        raw = f.read(length)
+    try:
+        record = json.loads(raw.decode("utf-8"))
+    except ValueError:
+        record = None
+    if not isinstance(record, dict) or record.get("key") != key:
+        raise StaleIndexError(key)
+    return record
+
+def get(key):
+    # 전체 문제(title, context, questions, key_points) 반환
+    for _ in range(READ_RETRIES):
+        index = _load_index()
+        entry = index["by_key"][key]
+        try:
+            record = _read_record(key, entry["offset"], entry["length"], index["mtime"])
+        except StaleIndexError:
+            time.sleep(READ_RETRY_DELAY) # 쓰는 쪽이 인덱스를 교체할 때까지 대기
+            continue
+        return {k: v for k, v in record.items() if k != "key"}
+    raise StaleIndexError(f"{index_path()}가 {BANK_PATH}와 맞지 않습니다 ({key}). python update_questions.py --full 로 다시 만드세요.")
+
+def iter_questions():
+    for key in keys():
+        yield key, get(key)
+
+def record_hash(data):
+    # 문제 내용(제목·제시문·질문 등)이 바뀌면 달라지는 해시 → 증분 갱신 시 변경 감지에 사용
+    raw = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+def _meta_entry(key, data, offset, length, content_hash=None):
+    from prompt_budget import count_tokens # prompt_budget이 이 모듈을 import하므로 여기서 import
+    year, part = split_key(key)
+    return {
+        "key": key,
+        "hash": content_hash or record_hash(data),
+        "year": year,
+        "part": part,
+        "title": data["title"],
+        "question_count": len(data["questions"]),
+        "context_length": len(data["context"]),
+        "context_tokens": count_tokens(data["context"]),
+        "offset": offset,
+        "length": length,
+    }
+
+def write_bank(db, bank_path=None, hashes=None):
+    # 문제 전체를 저장소로 기록 (임시 파일에 쓴 뒤 저장소 → 인덱스 순으로 교체)
+    # db: {key: question_data} 또는 (key, question_data) 레코드 iterable (스트리밍 파서 결과를 바로 기록 가능)
+    # hashes: {key: 원본 해시} (update_questions.py의 문제 블록 해시), 없으면 내용으로 계산
+    bank_path = bank_path or BANK_PATH
+    hashes = hashes if hashes is not None else {}
+    records = db.items() if isinstance(db, dict) else db
+    entries = {} # 같은 key가 다시 나오면 dict처럼 나중 것이 이김
+    offset = 0
+    with open(bank_path + ".tmp", "wb") as f:
+        for key, data in records:
+            line = json.dumps(dict(data, key=key), ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(line)
+            entries[key] = _meta_entry(key, data, offset, len(line), hashes.get(key))
+            offset += len(line)
+    entries = list(entries.values())
+    _write_index(entries, bank_path)
+    _swap(bank_path)
+    return len(entries)
+
+def _write_index(entries, bank_path):
+    # json.dump(파일)은 순수 파이썬 인코더로 동작해서 느림 → dumps(C 인코더)로 한 번에 기록
+    with open(index_path(bank_path) + ".tmp", "w", encoding="utf-8") as f:
+        f.write(json.dumps(entries, ensure_ascii=False))
+
+def _swap(bank_path):
+    # 인덱스를 마지막에 교체: 인덱스가 바뀌는 순간부터 새 저장소를 사용 (그 전에 읽은 쪽은 get()이 key로 확인)
+    os.replace(bank_path + ".tmp", bank_path)
+    os.replace(index_path(bank_path) + ".tmp", index_path(bank_path))
+
+def _read_index_file(bank_path):
+    # {key: 메타데이터}. 인덱스가 없거나 형식이 다르면 None → 전체 재작성
+    try:
+        with open(index_path(bank_path), "r", encoding="utf-8") as f:
+            return {e["key"]: e for e in _parse_index(json.load(f), index_path(bank_path))}
+    except (FileNotFoundError, ValueError):
+        return None
+
+def stored_hashes(bank_path=None):
+    # 저장소 파일이 없으면 인덱스가 남아 있어도 빈 dict → 호출 측이 모든 문제를 다시 파싱함
+    # (update_bank가 전체 재작성 경로로 가므로 None(변경 없음) 자리표시가 들어가면 안 됨)
+    bank_path = bank_path or BANK_PATH
+    if not os.path.exists(bank_path):
+        return {}
+    return {key: e.get("hash") for key, e in (_read_index_file(bank_path) or {}).items()}
+
+def update_bank(db, bank_path=None, hashes=None):
+    # 증분 갱신: 해시가 달라진(추가·변경된) 문제만 저장소 끝에 덧붙이고 인덱스만 다시 씀
+    # 기존 줄은 그대로 두고 덧붙인 뒤 인덱스만 교체하므로, 예전 인덱스의 위치도 계속 유효함
+    # db 값이 None이면 호출 측에서 해시로 변경 없음을 확인한 것 → 기존 항목 유지
+    bank_path = bank_path or BANK_PATH
+    hashes = hashes or {}
+    previous = _read_index_file(bank_path)
+    if previous is None or not os.path.exists(bank_path):
+        count = write_bank(db, bank_path, hashes)
+        return {"added": count, "changed": 0, "removed": 0, "unchanged": 0}
+
+    changes = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+    entries = []
+    with open(bank_path, "ab") as f:
+        offset = f.tell()
+        for key, data in db.items():
+            prev = previous.get(key)
+            content_hash = hashes.get(key) or record_hash(data)
+            if prev is not None and prev.get("hash") == content_hash:
+                entries.append(prev)
+                changes["unchanged"] += 1
+                continue
+            line = json.dumps(dict(data, key=key), ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(line)
+            entries.append(_meta_entry(key, data, offset, len(line), content_hash))
+            offset += len(line)
+            changes["changed" if prev is not None else "added"] += 1
+    changes["removed"] = sum(1 for key in previous if key not in db)
+
+    if changes["added"] or changes["changed"] or changes["removed"] or list(previous) != list(db):
+        # 예전 줄이 쌓여 사용하지 않는 부분이 절반을 넘으면 전체를 다시 씀
+        if offset > 2 * sum(e["length"] for e in entries):
+            _rewrite(entries, bank_path)
+        else:
+            _write_index(entries, bank_path)
+            os.replace(index_path(bank_path) + ".tmp", index_path(bank_path))
+    return changes
+
+def _rewrite(entries, bank_path):
+    # 현재 인덱스가 가리키는 줄만 새 파일로 복사하고 위치를 다시 계산
+    offset = 0
+    with open(bank_path, "rb") as src, open(bank_path + ".tmp", "wb") as dst:
+        for entry in entries:
+            src.seek(entry["offset"])
+            dst.write(src.read(entry["length"]))
+            entry["offset"] = offset
+            offset += entry["length"]
+    _write_index(entries, bank_path)
+    _swap(bank_path)
+
+if __name__ == "__main__":
+    import sys
+    # 사용법: python question_bank.py            -> 문제 목록
+    #         python question_bank.py "<key>"    -> 문제 하나 출력
+    if len(sys.argv) > 1:
+        print(json.dumps(get(sys.argv[1]), ensure_ascii=False, indent=2))
+    else:
+        for e in entries():
+            print(f"[{e['part'] or '-'}] {e['key']} (질문 {e['question_count']}개, 제시문 {e['context_length']}자)")
@@ -0,0 +1,107 @@
+import json
+import os
+import random
+import threading
+
+# AI 생성 문제 풀 (사전 생성)
+# "새로운 문제 생성 (AI)"은 gpt-4o로 1000자 이상의 제시문을 만드는 가장 느린 동작이므로,
+# 자주 쓰는 (유형, 주제) 조합은 미리 생성·파싱해 두었다가 즉시 제공하고 백그라운드에서 다시 채움
+
+POOL_TARGET_DEPTH = int(os.environ.get("QUESTION_POOL_DEPTH", "3"))
+POOL_PATH = os.environ.get("QUESTION_POOL_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".question_pool.json"))
+# 채울 항목이 없을 때 다시 확인하는 주기(초)
+REFILL_INTERVAL = float(os.environ.get("QUESTION_POOL_REFILL_INTERVAL", "60"))
+
+# 미리 생성해 둘 주제 (app.py 입력창 예시와 동일)
+POOL_TOPICS = {
+    "ethics": ["의사 파업", "안락사", "의료 자원 배분"],
+    "science": ["CRISPR 부작용", "효소 반응 속도", "도플러 효과"],
+}
+
+_lock = threading.Lock()
+_pools = None # "mode|topic" -> [question_data, ...]
+_wakeup = threading.Event()
+_refiller = None
+
+def normalize_topic(topic):
+    return " ".join((topic or "").split())
+
+def _pool_key(mode, topic):
+    return f"{mode}|{normalize_topic(topic)}"
+
+def _load():
+    global _pools
+    if _pools is None:
+        try:
+            with open(POOL_PATH, "r", encoding="utf-8") as f:
+                _pools = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _pools = {}
+    return _pools
+
+def _save():
+    tmp_path = POOL_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_pools, f, ensure_ascii=False)
+    os.replace(tmp_path, POOL_PATH)
+
+def take(mode, topic):
+    # 풀에 있으면 문제 하나를 꺼내서 반환 (한 번 낸 문제는 다시 내지 않음), 없으면 None
+    # 주제를 비워두면 해당 유형의 아무 주제에서 꺼냄
+    with _lock:
+        pools = _load()
+        if normalize_topic(topic):
+            keys = [_pool_key(mode, topic)]
+        else:
+            keys = [_pool_key(mode, t) for t in POOL_TOPICS.get(mode, [])]
+        candidates = [k for k in keys if pools.get(k)]
+        if not candidates:
+            return None
+        question = pools[random.choice(candidates)].pop(0)
+        _save()
+    _wakeup.set() # 꺼낸 만큼 바로 다시 채우도록 알림
+    return question
+
+def add(mode, topic, question_data):
+    with _lock:
+        _load().setdefault(_pool_key(mode, topic), []).append(question_data)
+        _save()
+
+def depths():
+    with _lock:
+        pools = _load()
+        return {(mode, topic): len(pools.get(_pool_key(mode, topic), [])) for mode, topics in POOL_TOPICS.items() for topic in topics}
+
+def _next_missing():
+    # 목표 개수보다 적은 (유형, 주제) 중 가장 부족한 것
+    missing = [(depth, mode, topic) for (mode, topic), depth in depths().items() if depth < POOL_TARGET_DEPTH]
+    if not missing:
+        return None
+    depth, mode, topic = min(missing)
+    return mode, topic
+
+def _refill_loop(api_key):
+    from llm_manager import generate_dynamic_question
+    while True:
+        target = _next_missing()
+        if target is None:
+            _wakeup.wait(REFILL_INTERVAL)
+            _wakeup.clear()
+            continue
+        mode, topic = target
+        question = generate_dynamic_question(api_key, topic, mode=mode)
+        if "error" in question or not question.get("questions"):
+            # API 오류나 파싱 실패는 풀에 넣지 않고 잠시 후 재시도
+            _wakeup.wait(REFILL_INTERVAL)
+            _wakeup.clear()
+            continue
+        add(mode, topic, question)
+
+def start_refiller(api_key):
+    # 프로세스당 한 번만 시작 (여러 번 호출해도 안전)
+    global _refiller
+    with _lock:
+        if _refiller is not None and _refiller.is_alive():
+            return
+        _refiller = threading.Thread(target=_refill_loop, args=(api_key,), daemon=True, name="question-pool")
+        _refiller.start()
@@ -1,216 +0,0 @@
-QUESTIONS = {
-    "2025학년도 정시모집 (의예과) Part 1 - [문제 1] 감염병 대응과 의료의 변화": {
-        "title": '2025학년도 정시모집 (의예과) [Part 1: 인성 및 가치관 면접] - [문제 1] 감염병 대응과 의료의 변화',
-        "context": """### 제시문 [가]
-
-Michel Serre의 그림 <Vue de Cours Pendant la peste de 1720>(1733)은 중세 유럽에서 발생한 마지막 페스트 대유행이라고도 불리는 1720년 프랑스 마르세유 페스트 유행을 묘사하고 있다. 이 그림에서 우리는 당시 페스트에 대한 다양한 대처 방법을 확인할 수 있다. 먼저 페스트 사망자들이 대로 위에 쓰레기 더미처럼 겹겹이 쌓여 방치된 광경이 눈길을 끈다. 페스트 사망자 사이에 웅크려 앉아 있는 사람들도 발견할 수 있다. 말 위에 앉아 팔을 뻗어 무엇인가 지시를 내리고 있는 모자를 쓴 인물(아마도 관리로 추정됨)과 사망자를 한가득 실은 마차를 시내 한복판으로 끌고 오는 인부들도 보인다. 18세기 초 페스트 유행으로 다수의 사망자가 발생했으나, 페스트에 의한 사망자 또는 환자는 병원이나 격리시설에 수용되지 않았고 길거리에 방치된 채 버려져 있었다는 점을 확인할 수 있다. 몇 세기에 걸쳐 페스트가 유행했지만, 페스트를 확실히 치료할 수 있는 약이나 기술은 존재하지 않았기 때문에 적극적인 의료 조치는 이루어지지 않았다. 다만, 감염병의 확산으로 경제적 피해가 컸기 때문에 검역을 강화하는 등의 관련 법규나 제도를 제정하는 대처를 시도했을 뿐이다.
-
-### 제시문 [나]
-
-2020년 코로나 바이러스로 인한 신종호흡기 전염병(코로나-19)이 전세계로 확산되며 단시간에 수억 명에 달하는 사망자가 발생했다. 현대의학의 발전으로 백신 개발과 접종이 빠르게 시행됐음에도 감염병의 확산을 막기에는 역부족이었다. 그러나 코로나-19에 대한 의학적 대처는 기본적으로 질병의 원인인 바이러스의 확산을 방지하는 조치(백신)와 개별 장기에 발생하는 증상의 의학적 처치(인공호흡기 등)가 주를 이루었고, 이는 개별 환자에 대한 치료와 예방에 과학적 의학이 적극적으로 활용되었음을 보여준다. 코로나-19가 세계적으로 유행했기 때문에 국가들은 감염병 확산을 방지하기 위한 조치에 합의하였으며 국가 간 이동은 제한되었다. 각국에서는 한정된 의료자원을 바탕으로 한 환자의 조기 발견 및 치료, 감염병 확산 방지를 위한 예방 및 격리 조치가 시행되었다. 아시아 각국에서는 국민의 협력 아래서 비교적 원활하게 이러한 조치가 이루어졌으나, 미국과 유럽 등에서는 환자 발견과 격리 조치에 대한 개인과 사회의 관점 차이로 저항이 컸고, 미국 뉴욕주에서는 코로나 사망자를 정해진 공간에 집단으로 매장하도록 하면서 윤리적인 문제도 대두했다.
-
-### 제시문 [다]
-
-19세기 전후를 기점으로 파리를 중심으로 근대임상의학이 탄생했다. 이는 의사가 환자를 눈앞에 두고 직접 만지며 진료하고 진료 결과를 바탕으로 통계를 내어 축적된 진단 자료, 이른바 임상경험을 바탕으로 병을 진단하고 환자를 치료하는 방식을 일컫는다. 근대임상의학은 몸에 대한 이해 방식을, 해부학을 통해 죽은 몸을 이해하는 방식에서 인간 장기의 각 부분을 연구하는 살아있는 몸을 이해하는 방식으로 전환시켰다. 그리고 과학적 의학의 발전으로 세균, 바이러스의 존재 등을 확인하게 되었다. 몸에 대한 새로운 이해, 환자 진료와 연구, 실험이 근대 이래 병원이라는 공간을 중심으로 시행되며 병원은 근대의 새로운 의학을 표상하는 공간이 되었다. 근대임상의학의 큰 틀 아래에서 병원을 중심으로 하는 체계적인 임상실험과 과학적 의학 연구는 현재까지도 지속되고 있고, 이러한 노력은 환자 개개인의 생명을 보호하고 연장시키는 결과를 가져왔다.
-
-### 제시문 [라]
-
-최근에는 로봇, 인공지능, 유전체학 등이 의료에 적극적으로 활용되면서 근대 이래 질병 치료를 주요 목적으로 하던, 병원의 기능과 의사의 역할에 대한 사회적 이해가 변화해가는 모습이 포착된다. 이러한 변화는 인간의 몸에 대한 이해와 의학적 접근 방식에도 영향을 미치고 있다. 최근에는 근대의학이 주장하던 세부 장기에 대한 개별적 연구가 아닌, 몸 전체를 하나의 대상으로 하여 이해하려는 시도가 이루어지고 있다. 일본의 한 사회학자는 '병원'이 치료 중심에서 벗어나 환자의 건강관리를 중심으로 할 수밖에 없는 공간으로 재편되어 간다고 주장하였다.""",
-        "questions": [
-            '질문 1: 제시문 [가], [나], [다]를 바탕으로 감염병 유행에 대한 각 사회의 대응 양상이 변화해가는 다양한 측면을 설명하시오.',
-            '질문 2: 제시문 [다], [라]에 근거하여 본인이 생각하는 미래 의료의 변화 방향과 의사가 수행할 역할을 설명하시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2025학년도 정시모집 (의예과) Part 1 - [문제 2] 공동체 윤리와 갈등 해결": {
-        "title": '2025학년도 정시모집 (의예과) [Part 1: 인성 및 가치관 면접] - [문제 2] 공동체 윤리와 갈등 해결',
-        "context": """### 제시문
-
-하윤이는 민정, 준수, 그리고 다른 친구 세 명과 함께 여섯 명 조를 만들어 자원봉사 활동을 시작했다. 오늘 발달장애인 거주시설에서 놀이 봉사를 마치고 돌아오는 길이다. 그 기관에는 발달장애인 중 건강 상태가 많이 악화되었거나 다른 신체장애가 중복되어 거동이 불가능하며 집중적인 돌봄이 필요한 환자들이 보호받고 있다. 그래서 대부분의 환자들은 침상에 누워 있고, 행사에도 침상에 누워서 혹은 휠체어를 타고 참석했다. 학생들은 모두 적극적으로 봉사에 참여했고 분위기는 화기애애했다. 뿌듯한 마음으로 행사를 마치고 돌아가는 버스 안에서 민정이 다른 친구에게 말을 건넸다.
-
-
-
-**민정**: 있잖아, 나 같으면 저렇게 살고 싶지 않아, 죽어버릴 거야.
-
-**준수**: (이 말을 듣고 대화에 참여한다) 뭐라고?
-
-**민정**: (깜짝 놀란 듯) 나 같으면 저렇게 침대에 누워서 침만 흘리고 있지 않고 죽어 버릴 거라고...
-
-**준수**: 너 참 말을... 어떻게 그렇게 말할 수 있니?
-
-**민정**: 왜, 너도 그렇게 생각하지 않아?
-
-**준수**: 왜 그 사람들이 죽고 싶어 할 거라 생각해? 우리도 그 사람들하고 같이 손뼉 치고 웃고, 즐거워했잖아.
-
-**민정**: 그게 진짜 같아?
-
-**준수**: (목소리가 점점 높아지고, 숨이 가빠진다) 진짜 너 별루다. 너랑은 더 말을 못하겠다.
-
-
-
-하윤이는 같은 조의 다른 친구들이 걱정스러운 표정을 짓는 것을 보았고 준수의 동생 이야기도 기억이 났다. 준수에게 장애가 있는 동생이 있고 그 동생이 최근 건강이 좋지 않아 입·퇴원을 반복하고 있다고 했다. 하지만 이 둘 사이의 대화가 격앙되는 것 같아서 당장은 아무 말 하지 않는 것이 낫다고 생각했다. 헤어지는 길에 준수가 하윤이에게 말을 걸었다.
-
-
-
-**준수**: 하윤아, 잠깐 이야기 할 수 있어?
-
-**하윤**: 왜?
-
-**준수**: 나 앞으로 민정이랑은 자원봉사 다니지 않을 거야.
-
-**하윤**: 우리 같은 조잖아. 이번 학기 앞으로 두 번만 더 가면 되는데.
-
-**준수**: 몰라. 민정을 조에서 빼든, 내가 나가든, 아무튼 같이 하지는 않을래.""",
-        "questions": [
-            '질문 1: 하윤이의 입장에서 현재 상황을 분석하고, 적절한 대응 방안을 제시하라. 특히 어떤 내용으로 대화를 나눌지 구체적인 대화 내용을 제시하라.',
-            '질문 2: 조장으로서 하윤이는 조원들이 어떤 일이 있었는지 이해하고 앞으로 협력할 수 있도록 조모임을 계획하였다. 어떻게 조모임을 운영할지 설명해 보라.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2025학년도 정시모집 (의예과) Part 2 - [문제 1] DNA 구조와 복제": {
-        "title": '2025학년도 정시모집 (의예과) [Part 2: 과학적 사고력 (생명과학/화학/물리)] - [문제 1] DNA 구조와 복제',
-        "context": """### 제시문 [가]
-
-이중 나선 DNA는 당, 인산, 염기로 이루어진 뉴클레오타이드가 인산과 당의 공유 결합으로 연결된 두 개의 폴리뉴클레오타이드 가닥으로 구성된다. 이때 당-인산 골격은 바깥쪽에 위치하며 염기는 안쪽에 위치하는데, 한 사슬의 염기는 다른 사슬의 염기와 짝을 이루어 수소 결합을 형성한다. 염기 아데닌(A)은 타이민(T)과, 구아닌(G)은 사이토신(C)과 항상 짝을 이루어 결합하기 때문에, 한 가닥의 염기 서열을 알면 다른 가닥의 염기 서열도 정확히 예측할 수 있다.
-
-### 제시문 [나]
-
-다세포 생물은 생장하거나 손상된 조직을 재생하는 과정에서 체세포 분열로 세포 수를 늘린다. 이때 딸세포의 유전 정보는 모세포와 같으며, 이와 같이 되기 위해서는 분열하기 전에 DNA 복제가 필수적이다. DNA 복제는 이중 나선 DNA를 2개의 가닥으로 분리하는 것으로 시작한다. 각각의 분리된 가닥을 주형으로 새로운 DNA 가닥이 만들어진다. 따라서, DNA 복제를 통해 생성된 2개의 이중 나선 DNA는, 원래부터 있던 가닥 중 하나와 새롭게 형성된 하나의 가닥을 각각 갖는다. 이러한 DNA 복제를 반보존적 복제라고 한다.""",
-        "questions": [
-            '질문: 제시문 [가]를 바탕으로 이중 나선 DNA 염기 간 결합의 세기와 당-인산 간 결합의 세기를 비교하고 그 이유를 설명하시오. 이를 바탕으로 제시문 [나]를 참고하여 체세포 분열에서 이중 나선 DNA가 유전 정보를 저장하는 물질로서 적합한 이유를 설명하시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2025학년도 정시모집 (의예과) Part 2 - [문제 2] 현미경과 분해능": {
-        "title": '2025학년도 정시모집 (의예과) [Part 2: 과학적 사고력 (생명과학/화학/물리)] - [문제 2] 현미경과 분해능',
-        "context": """### 제시문 [다]
-
-대부분의 동식물 세포는 그 지름이 수십 µm 정도 되는데, 세포 소기관들은 크기가 작아서 맨눈으로는 그 구조와 기능을 파악하기 어렵다. 예를 들어, 비교적 큰 세포 소기관인 엽록체나 미토콘드리아의 크기도 수 µm 정도이다. 세균 세포의 크기는 수 µm 정도이며 바이러스는 이보다 작아 수십 nm 정도 된다. 세포와 바이러스의 주요 구성 성분인 단백질의 크기는 수 nm, 단백질을 구성하는 아미노산은 1nm 정도이다.
-
-### 제시문 [라]
-
-드브로이는 빛의 이중성에 착안하여 전자와 같은 입자도 파동의 성질을 가질 수 있다고 제안하였다. 이 파동은 물질파라고 부르며, 물질파의 파장은 플랑크 상수를 입자의 운동량으로 나눈 값이다. 예를 들어 5만 볼트로 가속된 전자의 물질파는 약 5pm의 파장을 가지며, 이는 380nm~750nm인 가시광선의 파장보다 훨씬 짧은 파장대에 속해 있다. (* 제시문 [다]와 [라]에서 µm는 $10^{-6}m$, nm는 $10^{-9}m$, pm는 $10^{-12}m$를 의미함.)""",
-        "questions": [
-            '질문: 제시문 [다]와 [라]를 참고하여, 세포 소기관의 구조를 상세하게 관찰하는 데에 전자 현미경이 광학 현미경보다 더 적합한 이유를 설명하시오. 또한, 주어진 전자 현미경에서 전자의 운동 에너지가 4배가 될 때, 두 점이 분리되어 보이는 최소 거리의 변화를 논하고 그 이유를 설명하시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2024학년도 정시모집 (의예과) Part 1 - [문제 1] 고문과 공리주의적 딜레마": {
-        "title": '2024학년도 정시모집 (의예과) [Part 1: 인성 및 윤리 딜레마] - [문제 1] 고문과 공리주의적 딜레마',
-        "context": """### 제시문 [가]
-
-희귀 질환을 앓고 있는 아이가 유괴되는 사건이 벌어졌다. 급박한 수사 도중 아주 확실하지는 않지만, 상당히 유력한 피의자가 경찰서에 잡혀 들어왔다. 이 소식을 듣고 아이의 부모는 경찰서로 뛰쳐 들어와 "지금 우리 아이, 6시간 안에 약 먹지 않으면 죽어요"라고 애절하게 외치며 자신들이 피의자를 직접 만나서 이야기하게 해달라고 간청하고 있고 경찰들은 이를 겨우 가로막고 있는 상황이다. 하지만 피의자는 아이 위치를 말하라는 경찰의 추궁에 자기는 아니라고만 외치고 있다. 아이의 생명이 촌각에 달려 있는 상황에서 지금 조사실에 있는 경찰은 아이의 위치 파악을 위해 다음 사항을 경찰 상부에 요청하고 있다.
-
-
-
-*[요청사항] 아이 은닉 장소를 말하지 않으면 피의자에게 상당한 정도의 신체적 고통이 부과될 수 있음을 위협하고 그래도 통하지 않으면 실제 고통을 가할 수 있도록 허가해 주십시오.*
-
-
-
-상부의 경찰청장은 지금 깊은 고민에 빠져 있다. 아이의 생명 구조가 정말 긴급히 필요한 상황이긴 하지만, 과연 그러한 방법 투입이 합당한 것일까? 국민들의 여론도 걱정이다. 최근 수사기관의 과거 인권 유린 사건들이 조명되면서 국민들 사이에 경각심이 고조되고 있기도 한데 이런 강압적 행동을 과연 우호적으로 바라봐 줄까? 반면 아이의 생명에 문제가 생겼을 때 쏟아질지도 모르는 비난의 화살도 걱정이다.
-
-### 제시문 [나]
-
-아래 지문들에는 국가의 행위 선택과 관련된 규범적 준칙 및 목표들이 언급되어 있다.
-
-(1) 목적 달성에는 수단이 동반되는데 인간사회에서 어떤 수단들은 절대적으로 금지되어야 할 경우가 있다. 이러한 금지규범들은 인류사의 성취로서 그 내용은 문명의 수준이 결정한다.
-
-(2) 현대 법치국가에서 일반시민이 자기의 권리를 보호하거나 실현하기 위하여 국가의 힘을 빌리지 않고 직접 타인에게 실력을 행사하는 것은 금지되어 있다. 권리보호를 관철하고 집행하는 것은 국가의 역할이다.
-
-(3) 인간과 동물의 차이란 어디에 있는가? 동물은 욕구가 들면 자동적으로 그 욕구의 해소를 위해 움직인다. 그에 반해 인간은 그런 욕구가 있더라도 자신이 스스로 세운 목적을 위해 욕구를 이겨낼 수 있는 가능성을 갖는다. 따라서 각 개인이 스스로 세운 목표를 추구해 갈 수 있는 가능성을 존중하는 것이 인간을 존중하는 근본이다. 반대로 그의 자율적 판단 가능성을 부인하고 다른 목표 달성을 위한 한낱 수단이자 도구로 삼는 것은 인간이 갖는 품격을 빼앗는 것이다. 인간의 존엄에 바탕한 현대국가는 어떤 상황에서도 인간을 한낱 수단이나 도구로 삼는 행동을 해서는 안 된다.
-
-(4) 근대국가는 그 발전과정을 보면 참혹한 내전으로부터 구성원의 생명을 확보하기 위해 처음 만들어진 것을 알 수 있다. 다른 소중한 가치들의 보호는 생명의 보호가 전제될 때 가능하다. 구성원들의 생명 보호를 위해서라면 국가는 적극적인 조치들을 취할 의무가 있다.""",
-        "questions": [
-            '질문 1: 당신이 제시문 (가)의 경찰청장이라면 어떤 선택을 할 것인가? 제시문 (나)의 지문 중 당신 선택을 지지해 줄 만한 것을 두 개 골라서 설명하십시오.',
-            '질문 2: 당신의 선택에 불리하게 해석될 수 있는 지문을 두 개 골라서 그에 대해 반박하십시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2024학년도 정시모집 (의예과) Part 1 - [문제 2] 의사의 자질과 진로 선택": {
-        "title": '2024학년도 정시모집 (의예과) [Part 1: 인성 및 윤리 딜레마] - [문제 2] 의사의 자질과 진로 선택',
-        "context": """### 제시문 [가]
-
-의사는 새로운 의학지식을 발견하고 기술(술기)을 개발하기 위하여 실험실에서 지적 호기심을 탐구하고, 진료실, 병실, 수술실에서 과학적 근거를 환자 진료에 적용한다. 이러한 과정에서 동료 의사와 다양한 전문직 간의 협력은 필수적이다. 의사는 제자에게 자신의 의학지식과 기술을 전수하고 제자는 스승의 연구에서 출발하여 자신이 새롭게 얻은 지식과 기술을 그들의 제자에게 물려주는 방식으로 의학과 의술은 세대를 이어가며 축적되고 발전한다. 의사는 환자에게 최고의 의료 서비스를 제공하고, 아직 알려지지 않은 인체의 비밀과 질병의 실체에 접근하기 위해서 요란한 세상과는 일정한 거리를 두고 살아간다. 이러한 과정은 달콤하고 화려하기보다는 필연적으로 고통스럽고 고독할 수밖에 없다.
-
-### 제시문 [나]
-
-철수는 인턴 수료를 앞두고 레지던트 지원 분야를 결정해야 한다. 레지던트 수련은 내과, 외과, 산부인과 등 전문분야의 의사가 되는 과정으로 3~4년이 걸린다. 철수는 자신의 관심과 흥미, 수련의 난이도, 일과 삶의 균형, 미래 전망, 경제적 수익, 사회적 인식과 기대, 국가의 정책 등 자신의 미래와 관련된 여러 가지 미래 가치를 고려하고 있다. 철수는 불나방처럼 단기간의 이득이나 편익을 위해 뛰어드는 바보가 아니며, 앞으로 장기적 고통과 회의감이 들 수 있는 분야를 사명감 하나만으로 선택하는 초인적 인간도 아니다.""",
-        "questions": [
-            '질문 1: 제시문 (가)에서 요구되는 의사의 자질을 설명하고 그러한 자질과 관련한 자신의 경험을 구체적으로 설명해 보십시오.',
-            '질문 2: 제시문 (나)와 관련하여 당신이 철수라면 어떤 기준으로 레지던트 수련 분야를 선택하겠습니까? 그 이유를 설명하십시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2024학년도 정시모집 (의예과) Part 2 - [문제 1] 화학 결합과 물의 특성": {
-        "title": '2024학년도 정시모집 (의예과) [Part 2: 과학적 사고력 (화학/생명과학)] - [문제 1] 화학 결합과 물의 특성',
-        "context": """### 제시문 [가]
-
-전기 음성도는 공유 결합을 형성한 두 원자가 공유 전자쌍을 끌어당기는 정도를 상대적 수치로 나타낸 것이다. 폴링은 플루오린(F)의 전기 음성도를 4.0으로 하여 나머지 원소들의 전기 음성도를 상대적으로 정하였다. 전기 음성도는 주기율표에서 주기성을 나타낸다. 전기 음성도가 매우 큰 F, O, N 원자에 결합한 H 원자와 이웃한 분자의 F, O, N 원자 사이에 작용하는 강한 정전기적 인력을 수소 결합이라 한다. 수소 결합은 물의 독특한 성질과 관련되어 있으며, 생명체를 구성하는 주요 물질인 단백질과 핵산의 구조에서도 발견된다.
-
-### 제시문 [나]
-
-풀잎에 맺힌 물방울은 둥근 모양인데 이것은 물방울의 표면적을 줄이려는 표면 장력 때문이다. 액체의 표면적을 단위 면적만큼 늘리는 데 필요한 에너지를 표면 장력이라 한다. 물은 분자 사이의 수소 결합으로 인해 다른 액체보다 표면 장력이 크다.""",
-        "questions": [
-            '질문: [가]에 제시한 전기 음성도의 주기적 변화를 유효 핵전하, 원자 반지름의 주기성과 연관 지어 설명하시오. 또한 [나]에 제시한 바와 같이 물방울이 표면 장력에 의해 둥근 모양이 되는 이유를 분자 간 상호 작용으로 설명하시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-    "2024학년도 정시모집 (의예과) Part 2 - [문제 2] 유전자 발현과 치료": {
-        "title": '2024학년도 정시모집 (의예과) [Part 2: 과학적 사고력 (화학/생명과학)] - [문제 2] 유전자 발현과 치료',
-        "context": """### 제시문 [다]
-
-하나의 모세포는 핵분열 및 세포질 분열로 구성된 분열기를 거치면서 모세포와 염색체 수가 같은 두 개의 딸세포를 형성하게 된다. 이때 각각의 딸세포는 모세포와 동일한 유전정보를 지니게 된다. 이는 모세포가 분열기를 거치기 이전인 간기의 반보존적인 복제를 통해 두 배로 증가한 유전정보를 딸세포에 전달하기 때문이다. 궁극적으로 세포 분열을 통해 딸세포는 모세포의 생물학적 기능을 유지하게 된다.
-
-### 제시문 [라]
-
-아미노산 중 하나인 아르지닌은 [전구물질 > 오르니틴 > 시트룰린 > 아르지닌]의 합성 경로를 거쳐 합성된다. 비들과 테이텀은 야생형 붉은빵곰팡이에 돌연변이를 유도하기 위해 X선을 쬐는 실험을 통해, 돌연변이와 아르지닌 합성 경로의 상관관계를 알아보고자 하였다. 이때 얻은 돌연변이 곰팡이를 A형 곰팡이라고 하자. 1차 실험에서 A형 곰팡이를 최소배지에서 배양하자 야생형 곰팡이에 비해 느린 성장 속도를 지니고 배지에는 오르니틴이 축적된 것을 관찰하였다. 이 결과를 바탕으로 오르니틴에서 시트룰린의 합성 경로에 이상이 생긴 것으로 예측하여, 최소배지에 시트룰린을 첨가하는 2차 실험을 진행하였다. 실험 결과 A형 곰팡이의 성장 속도는 X선을 쬐지 않은 야생형 곰팡이와 비슷한 정도로 회복하였다. 다음으로 2차 실험을 통해 정상 성장 속도를 회복한 A형 곰팡이를 다시 최소배지에 옮겨 배양하는 3차 실험을 진행하였다. 그 결과, 1차 실험 결과와 유사하게, 다시 성장 속도가 느려지고 배지에 오르니틴이 축적되는 것을 확인하였다.
-
-### 제시문 [마]
-
-인간 게놈 프로젝트를 통해 인간 유전체 지도가 완성되면서, 인간이 가지고 있는 유전자의 염기 서열이 모두 밝혀졌다. 그 이후, 인간 유전체 지도를 기반으로 다양한 후속 연구가 수행되어, 질병을 유발하는 많은 유전자 역시 밝혀졌다. 유전자 치료란 유전자에 결함이 있는 유전병 환자들에게 정상 유전자 삽입, 결함 유전자 제거 혹은 유전자 발현 조절을 함으로써 유전 질환을 완화하거나 치료하는 기술이다. 다양한 유전자 치료 방법의 하나인 체외 유전자 치료는 유전병 환자의 골수, 혈액, 장기 등에서 체세포를 채취하여, 정상 유전자를 가진 바이러스 운반체를 체외에서 환자의 체세포에 감염시킨 후, 바이러스에 감염된 체세포를 다시 환자의 몸에 넣는 방법이다. 이를 통해 유전병 환자의 증상을 완화하거나 치료할 수 있다.""",
-        "questions": [
-            '질문: [라]의 2차 실험에서 회복된 A형 붉은빵곰팡이의 성장 속도가 3차 실험에서 다시 느려진 원인을 A형 붉은빵곰팡이에 발생한 생물학적 변화를 중심으로 추론하시오. 또한 [마]에서 설명한 체외 유전자 치료의 이론적 근거를 [다], [라]를 바탕으로 설명하시오.',
-        ],
-        "key_points": [
-            '문제의 핵심 쟁점 파악 능력',
-            '논리적 사고 및 근거 제시 능력',
-            '윤리적 판단 및 가치관의 일관성',
-            '의사소통 능력 및 태도',
-        ]
-    },
-}
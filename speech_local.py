@@ -0,0 +1,63 @@
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+
+# CPU에서 직접 실행하는 음성 엔진 (llm_manager의 "local" provider)
+# - STT: faster-whisper (pip install faster-whisper). 모델은 처음 사용할 때 한 번만 불러옴
+# - TTS: espeak-ng 명령 (한국어 지원, 음질은 API보다 낮지만 가볍고 빠름). WAV를 반환
+# API 키가 필요 없고 네트워크 없이 동작하지만 CPU를 사용하므로 동시 처리량은 서버 사양에 따라 다름
+
+LOCAL_STT_MODEL = os.environ.get("LOCAL_STT_MODEL", "small")
+LOCAL_STT_COMPUTE_TYPE = os.environ.get("LOCAL_STT_COMPUTE_TYPE", "int8")
+LOCAL_STT_THREADS = int(os.environ.get("LOCAL_STT_THREADS", "0")) # 0: CPU 코어 수에 맞춰 자동
+LOCAL_STT_BEAM_SIZE = int(os.environ.get("LOCAL_STT_BEAM_SIZE", "1"))
+LOCAL_TTS_COMMAND = os.environ.get("LOCAL_TTS_COMMAND", "espeak-ng")
+LOCAL_TTS_SPEED = int(os.environ.get("LOCAL_TTS_SPEED", "170")) # 분당 단어 수
+
+# TTS 캐시 key에 들어가는 이름
+TTS_MODEL = "espeak-ng"
+
+# OpenAI 목소리 이름 -> espeak-ng 목소리 (성별만 맞춤)
+VOICES = {
+    "onyx": "ko+m3",
+    "echo": "ko+m1",
+    "fable": "ko+m5",
+    "alloy": "ko+f2",
+    "nova": "ko+f3",
+    "shimmer": "ko+f4",
+}
+
+_model = None
+_model_lock = threading.Lock()
+
+def _whisper_model():
+    global _model
+    with _model_lock:
+        if _model is None:
+            from faster_whisper import WhisperModel
+            _model = WhisperModel(LOCAL_STT_MODEL, device="cpu", compute_type=LOCAL_STT_COMPUTE_TYPE, cpu_threads=LOCAL_STT_THREADS)
+        return _model
+
+def transcribe(api_key, upload_bytes, upload_name):
+    # api_key, upload_name은 사용하지 않음 (provider 함수 형식을 맞추기 위한 인자)
+    segments, _ = _whisper_model().transcribe(io.BytesIO(upload_bytes), language="ko", beam_size=LOCAL_STT_BEAM_SIZE)
+    return " ".join(segment.text.strip() for segment in segments).strip()
+
+def synthesize(api_key, text, voice="onyx"):
+    if shutil.which(LOCAL_TTS_COMMAND) is None:
+        raise RuntimeError(f"{LOCAL_TTS_COMMAND} not found (install espeak-ng or set LOCAL_TTS_COMMAND)")
+    # --stdout의 WAV 헤더에는 길이가 비어 있으므로 임시 파일로 받음
+    fd, path = tempfile.mkstemp(suffix=".wav")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [LOCAL_TTS_COMMAND, "-v", VOICES.get(voice, "ko"), "-s", str(LOCAL_TTS_SPEED), "-w", path, text],
+            check=True, capture_output=True
+        )
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
@@ -0,0 +1,181 @@
+import base64
+import io
+import json
+import os
+import re
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+
+# 문장 단위 TTS 파이프라인
+# LLM이 답변을 생성하는 동안 완성된 문장부터 바로 TTS로 보내고, 합성된 오디오는 순서대로 재생 큐에 넣음
+
+TTS_PIPELINE_WORKERS = int(os.environ.get("TTS_PIPELINE_WORKERS", "4"))
+# 너무 짧은 문장("네.")은 다음 문장과 합쳐서 TTS 호출 수를 줄임
+MIN_SENTENCE_CHARS = int(os.environ.get("TTS_MIN_SENTENCE_CHARS", "6"))
+
+# 미리 합성하는 음성(질문 안내 멘트)용 작업 수. 면접관 답변 문장 TTS와 스레드 풀을 나눠서 답변 음성이 뒤로 밀리지 않게 함
+TTS_PRESYNTH_WORKERS = int(os.environ.get("TTS_PRESYNTH_WORKERS", "4"))
+
+# 프로세스 전체에서 공유하는 TTS 작업 스레드 풀
+_executor = ThreadPoolExecutor(max_workers=TTS_PIPELINE_WORKERS, thread_name_prefix="tts")
+_presynth_executor = ThreadPoolExecutor(max_workers=TTS_PRESYNTH_WORKERS, thread_name_prefix="tts-presynth")
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표(+닫는 따옴표·괄호) 뒤 공백, 또는 줄바꿈
+# "3.5"처럼 숫자 사이의 점은 뒤에 공백이 없으므로 끊지 않음
+_SENTENCE_END = re.compile(r'[.!?…。？！]+["\'”’)\]]*\s+|\n+')
+
+def submit_tts(synthesize, text):
+    # 작업 스레드에서도 같은 세션으로 추적되도록 세션 id를 함께 넘김
+    return _executor.submit(tracing.bind(synthesize), text)
+
+def presynthesize(synthesize, texts):
+    # 나중에 재생할 음성을 미리 합성: {key: 문장} -> {key: Future}
+    return {key: _presynth_executor.submit(tracing.bind(synthesize), text) for key, text in texts.items()}
+
+def cancel_futures(futures):
+    # 아직 시작하지 않은 작업은 취소, 이미 합성 중인 작업은 끝나도 결과를 사용하지 않음
+    for future in futures:
+        future.cancel()
+
+class SentenceSplitter:
+    # 토큰을 하나씩 받아 완성된 문장 목록을 돌려주는 증분 분할기
+    def __init__(self, min_chars=MIN_SENTENCE_CHARS):
+        self.min_chars = min_chars
+        self.buffer = ""
+
+    def feed(self, token):
+        self.buffer += token
+        sentences = []
+        start = 0
+        for m in _SENTENCE_END.finditer(self.buffer):
+            if m.end() - start < self.min_chars:
+                continue
+            sentence = self.buffer[start:m.end()].strip()
+            start = m.end()
+            if sentence:
+                sentences.append(sentence)
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        rest = self.buffer.strip()
+        self.buffer = ""
+        return [rest] if rest else []
+
+def split_sentences(token_stream, min_chars=MIN_SENTENCE_CHARS):
+    # 토큰 스트림을 받아 문장이 완성되는 즉시 yield
+    splitter = SentenceSplitter(min_chars)
+    for token in token_stream:
+        yield from splitter.feed(token)
+    yield from splitter.flush()
+
+class SpeechPipeline:
+    # 사용법:
+    #   pipeline = SpeechPipeline(lambda s: text_to_speech(api_key, s, voice))
+    #   for token in pipeline.tee(stream): ...   # 토큰은 그대로 흘려보내고 문장은 TTS로 제출
+    #   pipeline.pop_ready()  -> 순서상 준비된 오디오 조각들 (non-blocking)
+    #   pipeline.flush()      -> 스트림이 도중에 끊겼을 때 남은 미완성 문장도 TTS로 제출
+    #   pipeline.drain()      -> 남은 오디오 조각들 (blocking)
+    def __init__(self, synthesize, min_chars=MIN_SENTENCE_CHARS):
+        self.synthesize = synthesize
+        self.min_chars = min_chars
+        self.sentences = []
+        self.audio_chunks = []
+        self._futures = []
+        self._next = 0
+        self._splitter = None
+
+    def _submit(self, sentence):
+        self.sentences.append(sentence)
+        self._futures.append(submit_tts(self.synthesize, sentence))
+
+    def tee(self, token_stream):
+        # 토큰은 그대로 흘려보내면서, 문장이 완성될 때마다 TTS 작업을 제출
+        self._splitter = SentenceSplitter(self.min_chars)
+        for token in token_stream:
+            for sentence in self._splitter.feed(token):
+                self._submit(sentence)
+            yield token
+        self.flush()
+
+    def flush(self):
+        # 아직 문장이 끝나지 않아 splitter에 남아 있는 텍스트를 제출 (여러 번 불러도 한 번만 제출)
+        if self._splitter is not None:
+            for sentence in self._splitter.flush():
+                self._submit(sentence)
+            self._splitter = None
+
+    def _collect(self, future):
+        try:
+            audio = future.result()
+        except Exception:
+            audio = None # 한 문장 합성이 실패해도 나머지는 재생
+        if audio:
+            self.audio_chunks.append(audio)
+        return audio
+
+    def pop_ready(self):
+        ready = []
+        while self._next < len(self._futures) and self._futures[self._next].done():
+            audio = self._collect(self._futures[self._next])
+            self._next += 1
+            if audio:
+                ready.append(audio)
+        return ready
+
+    def drain(self):
+        ready = []
+        while self._next < len(self._futures):
+            audio = self._collect(self._futures[self._next])
+            self._next += 1
+            if audio:
+                ready.append(audio)
+        return ready
+
+    def full_audio(self):
+        # 대화 기록용으로 하나로 합침
+        return join_audio(self.audio_chunks)
+
+def audio_mime(audio_bytes):
+    # 로컬 TTS(llm_manager의 "local" provider)는 WAV, OpenAI TTS는 mp3
+    return "audio/wav" if audio_bytes[:4] == b"RIFF" else "audio/mpeg"
+
+def join_audio(chunks):
+    # mp3 프레임은 이어붙여도 유효하지만 WAV는 헤더가 하나여야 하므로 PCM 데이터만 모아서 다시 씀
+    if not chunks or audio_mime(chunks[0]) != "audio/wav":
+        return b"".join(chunks)
+    out = io.BytesIO()
+    with wave.open(out, "wb") as writer:
+        for i, chunk in enumerate(chunks):
+            with wave.open(io.BytesIO(chunk), "rb") as reader:
+                if i == 0:
+                    writer.setparams(reader.getparams())
+                writer.writeframes(reader.readframes(reader.getnframes()))
+    return out.getvalue()
+
+def audio_queue_html(audio_bytes, mime=None):
+    # 부모 페이지(window.parent)에 재생 큐를 두고 순서대로 재생하는 HTML 조각
+    # 스크립트 재실행으로 iframe이 사라져도 부모 페이지의 Audio 객체는 계속 재생됨
+    mime = mime or audio_mime(audio_bytes)
+    src = f"data:{mime};base64,{base64.b64encode(audio_bytes).decode('ascii')}"
+    return f"""
+<script>
+(function() {{
+  const w = window.parent;
+  const q = w.__interviewAudio = w.__interviewAudio || {{queue: [], playing: false}};
+  function playNext() {{
+    if (q.playing || q.queue.length === 0) return;
+    q.playing = true;
+    const audio = new w.Audio(q.queue.shift());
+    const done = () => {{ q.playing = false; playNext(); }};
+    audio.onended = done;
+    audio.onerror = done;
+    audio.play().catch(done);
+  }}
+  q.queue.push({json.dumps(src)});
+  playNext();
+}})();
+</script>
+"""
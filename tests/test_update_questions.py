@@ -0,0 +1,117 @@
+import json
+import os
+import shutil
+import threading
+
+import question_bank
+from update_questions import rebuild, update_incremental
+
+# problem.md 증분 갱신(update_incremental) 테스트: 변경 없음 / 변경 / 삭제 / 빈 입력 / 저장소 파일 없음
+
+PROBLEM_MD = """## 2025학년도 정시모집 (의예과)
+
+### [Part 1: 인성 및 가치관 면접]
+
+**[문제 1] 첫 번째 문제**
+
+> **제시문**
+> 첫 번째 제시문입니다.
+
+* **질문 1**: 첫 번째 질문입니다.
+
+**[문제 2] 두 번째 문제**
+
+> **제시문**
+> 두 번째 제시문입니다.
+
+* **질문 1**: 두 번째 질문입니다.
+"""
+
+KEY_1 = "2025학년도 정시모집 (의예과) Part 1 - [문제 1] 첫 번째 문제"
+KEY_2 = "2025학년도 정시모집 (의예과) Part 1 - [문제 2] 두 번째 문제"
+
+def write_md(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def read_index(bank_path):
+    with open(question_bank.index_path(bank_path), encoding="utf-8") as f:
+        return json.load(f)
+
+def read_bank(bank_path):
+    # 인덱스가 가리키는 위치에서 문제를 읽음 (question_bank.get과 같은 방식)
+    result = {}
+    with open(bank_path, "rb") as f:
+        for entry in read_index(bank_path):
+            f.seek(entry["offset"])
+            result[entry["key"]] = json.loads(f.read(entry["length"]).decode("utf-8"))
+    return result
+
+def setup_bank(tmp_path):
+    md_path = str(tmp_path / "problem.md")
+    bank_path = str(tmp_path / "questions.jsonl")
+    write_md(md_path, PROBLEM_MD)
+    assert rebuild(md_path, bank_path) == 2
+    return md_path, bank_path
+
+def test_unchanged(tmp_path):
+    md_path, bank_path = setup_bank(tmp_path)
+    changes = update_incremental(md_path, bank_path)
+    assert changes == {"added": 0, "changed": 0, "removed": 0, "unchanged": 2}
+    assert read_bank(bank_path)[KEY_1]["context"] == "### 제시문\n\n첫 번째 제시문입니다."
+
+def test_changed(tmp_path):
+    md_path, bank_path = setup_bank(tmp_path)
+    write_md(md_path, PROBLEM_MD.replace("두 번째 제시문입니다.", "고친 제시문입니다."))
+    changes = update_incremental(md_path, bank_path)
+    assert changes == {"added": 0, "changed": 1, "removed": 0, "unchanged": 1}
+    bank = read_bank(bank_path)
+    assert bank[KEY_2]["context"] == "### 제시문\n\n고친 제시문입니다."
+    assert bank[KEY_1]["context"] == "### 제시문\n\n첫 번째 제시문입니다."
+
+def test_removed(tmp_path):
+    md_path, bank_path = setup_bank(tmp_path)
+    write_md(md_path, PROBLEM_MD[:PROBLEM_MD.index("**[문제 2]")])
+    changes = update_incremental(md_path, bank_path)
+    assert changes == {"added": 0, "changed": 0, "removed": 1, "unchanged": 1}
+    assert list(read_bank(bank_path)) == [KEY_1]
+
+def test_empty_input_keeps_bank(tmp_path):
+    # problem.md가 비었거나 저장 도중 잘려서 문제가 하나도 없으면 저장소를 그대로 둠
+    md_path, bank_path = setup_bank(tmp_path)
+    before = read_bank(bank_path)
+    for text in ("", "## 2025학년도 정시모집 (의예과)\n\n### [Part 1"):
+        write_md(md_path, text)
+        assert update_incremental(md_path, bank_path) is None
+        assert read_bank(bank_path) == before
+
+def test_missing_bank(tmp_path):
+    # 인덱스는 남아 있고 저장소 파일만 없으면 모든 문제를 다시 파싱해서 전체 재작성
+    md_path, bank_path = setup_bank(tmp_path)
+    os.remove(bank_path)
+    assert question_bank.stored_hashes(bank_path) == {}
+    changes = update_incremental(md_path, bank_path)
+    assert changes["added"] == 2
+    bank = read_bank(bank_path)
+    assert bank[KEY_1]["questions"] == ["질문 1: 첫 번째 질문입니다."]
+    assert bank[KEY_2]["context"] == "### 제시문\n\n두 번째 제시문입니다."
+
+def test_reader_waits_for_index_swap(tmp_path, monkeypatch):
+    # 전체 재작성 중 저장소만 먼저 교체된 상태에서 읽으면, 예전 위치를 그대로 쓰지 않고 인덱스 교체를 기다렸다가 새 내용을 읽음
+    md_path, bank_path = setup_bank(tmp_path)
+    monkeypatch.setattr(question_bank, "BANK_PATH", bank_path)
+    monkeypatch.setattr(question_bank, "_index", None)
+    assert question_bank.get(KEY_2)["context"] == "### 제시문\n\n두 번째 제시문입니다."
+
+    new_path = str(tmp_path / "new.jsonl")
+    write_md(md_path, PROBLEM_MD.replace("첫 번째 제시문입니다.", "처음 제시문을 훨씬 길게 고친 내용입니다."))
+    rebuild(md_path, new_path)
+    shutil.copy(new_path, bank_path) # 저장소만 교체된 상태
+    swap = threading.Timer(0.2, shutil.copy, (question_bank.index_path(new_path), question_bank.index_path(bank_path)))
+    swap.start()
+    try:
+        assert question_bank.get(KEY_2)["context"] == "### 제시문\n\n두 번째 제시문입니다."
+        assert question_bank.get(KEY_1)["context"] == "### 제시문\n\n처음 제시문을 훨씬 길게 고친 내용입니다."
+    finally:
+        swap.join()
+    monkeypatch.setattr(question_bank, "_index", None)
@@ -0,0 +1,177 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+# 주제 유사도 기반 AI 생성 문제 캐시 (로컬 계산, 네트워크 사용 없음)
+# "안락사", "안락사 허용 논란"처럼 거의 같은 주제는 이전에 생성한 문제를 재사용해서 gpt-4o 호출을 줄임
+# 유사도: 정규화한 주제 문자열의 글자 2-gram/3-gram 빈도 벡터 코사인 유사도
+# 조회/적중 횟수는 작은 별도 파일에 저장 (재시작해도 적중률 유지, 조회할 때 캐시 파일 전체를 다시 쓰지 않음)
+
+TOPIC_CACHE_THRESHOLD = float(os.environ.get("TOPIC_CACHE_THRESHOLD", "0.5"))
+TOPIC_CACHE_TTL = float(os.environ.get("TOPIC_CACHE_TTL", str(7 * 24 * 3600))) # 초
+TOPIC_CACHE_MAX_ENTRIES = int(os.environ.get("TOPIC_CACHE_MAX_ENTRIES", "500"))
+TOPIC_CACHE_PATH = os.environ.get("TOPIC_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".topic_cache.json"))
+TOPIC_CACHE_STATS_PATH = os.path.splitext(TOPIC_CACHE_PATH)[0] + ".stats.json"
+# 적중 시 바뀌는 항목 정보(last_used, hits)는 이 간격(초)마다 한 번만 캐시 파일에 반영 (store는 바로 저장)
+TOPIC_CACHE_SAVE_INTERVAL = float(os.environ.get("TOPIC_CACHE_SAVE_INTERVAL", "60"))
+
+_lock = threading.Lock()
+_entries = None # [{"mode", "topic", "question", "created_at", "last_used", "hits"}]
+_vectors = {} # 정규화된 주제 -> (n-gram Counter, 벡터 크기)
+_stats = {"lookups": 0, "hits": 0} # _load()가 통계 파일의 값으로 채움
+_stats_lock = threading.Lock()
+_dirty = False # 캐시 파일에 아직 반영하지 않은 변경
+_last_save = 0.0
+
+def normalize_topic(topic):
+    # 소문자화 후 공백·문장부호 제거 ("안락사 허용 논란?" -> "안락사허용논란")
+    return re.sub(r"[\W_]+", "", (topic or "").lower())
+
+def _ngrams(text):
+    grams = Counter()
+    for n in (2, 3):
+        for i in range(len(text) - n + 1):
+            grams[text[i:i + n]] += 1
+    if not grams and text:
+        grams[text] += 1 # 한 글자 주제
+    return grams
+
+def _vector(topic):
+    key = normalize_topic(topic)
+    if key not in _vectors:
+        grams = _ngrams(key)
+        _vectors[key] = (grams, math.sqrt(sum(v * v for v in grams.values())))
+    return _vectors[key]
+
+def similarity(a, b):
+    return _cosine(*_vector(a), *_vector(b))
+
+def _cosine(ga, na, gb, nb):
+    if not na or not nb:
+        return 0.0
+    if len(ga) > len(gb):
+        ga, gb = gb, ga
+    return sum(v * gb.get(k, 0) for k, v in ga.items()) / (na * nb)
+
+def _load():
+    global _entries
+    if _entries is None:
+        try:
+            with open(TOPIC_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = []
+        # 통계를 캐시 파일에 함께 넣었던 형식({"entries", "stats"})도 읽음
+        if isinstance(data, dict):
+            _stats.update(data.get("stats", {}))
+            data = data.get("entries", [])
+        _entries = data
+        try:
+            with open(TOPIC_CACHE_STATS_PATH, "r", encoding="utf-8") as f:
+                _stats.update(json.load(f))
+        except (FileNotFoundError, ValueError):
+            pass
+    return _entries
+
+def _save():
+    global _dirty, _last_save
+    tmp_path = TOPIC_CACHE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_entries, f, ensure_ascii=False)
+    os.replace(tmp_path, TOPIC_CACHE_PATH)
+    _dirty = False
+    _last_save = time.time()
+
+def _save_stats():
+    # 조회마다 호출: 숫자 두 개만 기록 (_lock 밖에서 실행)
+    with _stats_lock:
+        data = json.dumps(_stats)
+        tmp_path = TOPIC_CACHE_STATS_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, TOPIC_CACHE_STATS_PATH)
+
+def _expire(now):
+    entries = _load()
+    alive = [e for e in entries if now - e["created_at"] < TOPIC_CACHE_TTL]
+    if len(alive) != len(entries):
+        entries[:] = alive
+        return True
+    return False
+
+def lookup(mode, topic, threshold=None, exclude=None):
+    # 같은 유형에서 가장 비슷한 주제의 문제를 반환: (question_data, 일치한 주제, 유사도) 또는 None
+    # exclude: 지금 풀고 있는 문제 → 같은 주제로 새 문제를 요청하면 그 문제는 다시 내주지 않음
+    threshold = TOPIC_CACHE_THRESHOLD if threshold is None else threshold
+    grams = _ngrams(normalize_topic(topic))
+    norm = math.sqrt(sum(v * v for v in grams.values()))
+    if not norm:
+        return None
+
+    global _dirty
+    now = time.time()
+    result = None
+    with _lock:
+        _dirty |= _expire(now)
+        _stats["lookups"] += 1
+        best, best_score = None, 0.0
+        for entry in _load():
+            if entry["mode"] != mode or (exclude is not None and entry["question"] == exclude):
+                continue
+            score = _cosine(grams, norm, *_vector(entry["topic"]))
+            if score > best_score:
+                best, best_score = entry, score
+        if best is not None and best_score >= threshold:
+            _stats["hits"] += 1
+            best["last_used"] = now
+            best["hits"] = best.get("hits", 0) + 1
+            _dirty = True
+            result = best["question"], best["topic"], best_score
+        if _dirty and now - _last_save >= TOPIC_CACHE_SAVE_INTERVAL:
+            _save()
+    _save_stats()
+    return result
+
+def store(mode, topic, question_data):
+    if not normalize_topic(topic):
+        return
+    now = time.time()
+    with _lock:
+        entries = _load()
+        _expire(now)
+        entries.append({"mode": mode, "topic": topic, "question": question_data, "created_at": now, "last_used": now, "hits": 0})
+        # 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+        if len(entries) > TOPIC_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda e: e["last_used"])
+            del entries[:len(entries) - TOPIC_CACHE_MAX_ENTRIES]
+            live = {normalize_topic(e["topic"]) for e in entries}
+            for key in [k for k in _vectors if k not in live]:
+                del _vectors[key]
+        _save()
+
+def stats():
+    with _lock:
+        entries = _load()
+        lookups = _stats["lookups"]
+        return {
+            "entries": len(entries),
+            "lookups": lookups,
+            "hits": _stats["hits"],
+            "hit_rate": _stats["hits"] / lookups if lookups else 0.0,
+        }
+
+if __name__ == "__main__":
+    import sys
+    # 사용법: python topic_cache.py "안락사" "안락사 허용 논란"  -> 두 주제의 유사도 출력
+    if len(sys.argv) == 3:
+        print(f"similarity={similarity(sys.argv[1], sys.argv[2]):.3f} (threshold={TOPIC_CACHE_THRESHOLD})")
+    else:
+        entries = _load()
+        s = stats()
+        print(f"{len(entries)} cached topics, hit rate {s['hit_rate']:.1%} ({s['hits']}/{s['lookups']} lookups)")
+        for e in sorted(entries, key=lambda e: -e.get("hits", 0)):
+            print(f"  [{e['mode']}] {e['topic']} (hits={e.get('hits', 0)})")
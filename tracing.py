@@ -0,0 +1,290 @@
+import collections
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 면접 턴 단계별 추적: llm_manager 진입 함수(STT, 면접관 답변, TTS, 평가 등) 호출마다 span 하나를 기록
+# span = {"session", "stage", "start", "ms", "ok", 토큰 수/주고받은 크기/오류 등 속성}
+# - 세션별 최근 TRACE_MAX_SPANS개를 메모리에 보관 (앱의 운영자용 디버그 패널)
+# - 단계별 누적 지표: prometheus_text(), TRACE_METRICS_PORT를 지정하면 http://host:port/metrics
+# - TRACE_PATH를 지정하면 span을 JSONL로 기록 (python tracing.py trace.jsonl 로 단계별 요약)
+# 세션 id는 contextvar로 전달: 스크립트 실행마다 set_session(), 백그라운드 스레드로 보내는 작업은 bind()로 감쌈
+
+TRACE_ENABLED = os.environ.get("TRACE_ENABLED", "1") != "0"
+TRACE_PATH = os.environ.get("TRACE_PATH")
+TRACE_METRICS_PORT = int(os.environ.get("TRACE_METRICS_PORT", "0"))
+TRACE_MAX_SPANS = int(os.environ.get("TRACE_MAX_SPANS", "200")) # 세션당 보관 개수
+TRACE_MAX_SESSIONS = int(os.environ.get("TRACE_MAX_SESSIONS", "500")) # 넘으면 가장 오래된 세션부터 제거
+TRACE_DEBUG_PANEL = os.environ.get("TRACE_DEBUG_PANEL", "0") == "1"
+
+# 지연 히스토그램 구간(초)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 단계별로 합계를 내는 숫자 속성 (bytes_in: 보낸 크기, bytes_out: 받은 크기)
+COUNTERS = ("prompt_tokens", "completion_tokens", "bytes_in", "bytes_out")
+
+_session = contextvars.ContextVar("trace_session", default="-")
+_current = contextvars.ContextVar("trace_span", default=None)
+
+_lock = threading.Lock()
+_sessions = collections.OrderedDict() # session id -> 최근 span deque
+_metrics = {} # stage -> {"count", "errors", "seconds", "buckets", COUNTERS...}
+_write_lock = threading.Lock()
+_server = None
+_server_lock = threading.Lock()
+
+def set_session(session_id):
+    _session.set(session_id)
+
+def current_session():
+    return _session.get()
+
+def bind(fn):
+    # ThreadPoolExecutor는 contextvar를 넘겨주지 않으므로 제출하는 시점의 세션 id를 함께 전달
+    session_id = _session.get()
+    def run(*args, **kwargs):
+        token = _session.set(session_id)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _session.reset(token)
+    return run
+
+def annotate(**attrs):
+    # 실행 중인 span에 속성 추가 (span 밖이거나 추적을 끈 경우 무시). error를 넣으면 실패로 기록
+    span = _current.get()
+    if span is not None:
+        span.update(attrs)
+
+def record_usage(usage):
+    # chat.completions 응답의 usage (스트리밍은 마지막 조각에만 있음)
+    if usage is not None:
+        annotate(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+
+def _begin(stage):
+    return {"session": _session.get(), "stage": stage, "start": round(time.time(), 3), "_t0": time.perf_counter()}
+
+def _finish(span, error=None):
+    span["ms"] = round((time.perf_counter() - span.pop("_t0")) * 1000, 1)
+    if error is not None:
+        span["error"] = error
+    if "error" in span:
+        error = span["error"]
+        span["error"] = (f"{type(error).__name__}: {error}" if isinstance(error, Exception) else str(error))[:300]
+    span["ok"] = "error" not in span
+    _store(span)
+
+def _store(span):
+    seconds = span["ms"] / 1000
+    with _lock:
+        spans = _sessions.get(span["session"])
+        if spans is None:
+            spans = _sessions[span["session"]] = collections.deque(maxlen=TRACE_MAX_SPANS)
+            while len(_sessions) > TRACE_MAX_SESSIONS:
+                _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(span["session"])
+        spans.append(span)
+
+        m = _metrics.get(span["stage"])
+        if m is None:
+            m = _metrics[span["stage"]] = {"count": 0, "errors": 0, "seconds": 0.0, "buckets": [0] * len(BUCKETS)}
+            m.update(dict.fromkeys(COUNTERS, 0))
+        m["count"] += 1
+        m["errors"] += not span["ok"]
+        m["seconds"] += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                m["buckets"][i] += 1
+                break
+        for key in COUNTERS:
+            m[key] += span.get(key) or 0
+
+    if TRACE_PATH:
+        line = json.dumps(span, ensure_ascii=False)
+        with _write_lock, open(TRACE_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+def _traced_call(stage, fn, args, kwargs):
+    span = _begin(stage)
+    token = _current.set(span)
+    error = None
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        _current.reset(token)
+        _finish(span, error)
+
+def _traced_generator(stage, fn, args, kwargs):
+    # 스트리밍: 첫 조각까지(first_ms)와 끝까지(ms)를 기록
+    # 생성기가 멈춰 있는 동안 호출한 쪽의 다른 호출이 이 span에 기록되지 않도록 next()를 부를 때만 span을 설정
+    span = _begin(stage)
+    gen = fn(*args, **kwargs)
+    error = None
+    try:
+        while True:
+            token = _current.set(span)
+            try:
+                item = next(gen)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            if "first_ms" not in span:
+                span["first_ms"] = round((time.perf_counter() - span["_t0"]) * 1000, 1)
+            yield item
+    except GeneratorExit:
+        # 끝까지 읽지 않고 버려진 스트림(사용자가 중단, 리런 등)은 성공으로 기록하지 않음
+        span["cancelled"] = True
+        error = "cancelled"
+        raise
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        gen.close()
+        _finish(span, error)
+
+def traced(stage):
+    # 사용법: @tracing.traced("stt") — 함수 호출(생성기는 끝까지 읽을 때까지)을 span 하나로 기록
+    def decorator(fn):
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                if not TRACE_ENABLED:
+                    return fn(*args, **kwargs)
+                return _traced_generator(stage, fn, args, kwargs)
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACE_ENABLED:
+                return fn(*args, **kwargs)
+            return _traced_call(stage, fn, args, kwargs)
+        return wrapper
+    return decorator
+
+def session_spans(session_id):
+    with _lock:
+        return list(_sessions.get(session_id, ()))
+
+def clear():
+    with _lock:
+        _sessions.clear()
+        _metrics.clear()
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+def summarize(spans):
+    # 단계별 호출 수, 오류 수, 지연 p50/p95(ms), 토큰/크기 합계 (디버그 패널, CLI 공용)
+    by_stage = {}
+    for span in spans:
+        by_stage.setdefault(span["stage"], []).append(span)
+    rows = []
+    for stage, items in by_stage.items():
+        latencies = [s["ms"] for s in items]
+        row = {
+            "stage": stage,
+            "count": len(items),
+            "errors": sum(not s["ok"] for s in items),
+            "p50_ms": round(_percentile(latencies, 50), 1),
+            "p95_ms": round(_percentile(latencies, 95), 1),
+        }
+        for key in COUNTERS:
+            row[key] = sum(s.get(key) or 0 for s in items)
+        rows.append(row)
+    return rows
+
+def prometheus_text():
+    # Prometheus 텍스트 형식 (프로세스 전체, 단계별)
+    with _lock:
+        metrics = {stage: dict(m, buckets=list(m["buckets"])) for stage, m in _metrics.items()}
+    lines = [
+        "# HELP interview_stage_seconds Latency of llm_manager calls by stage.",
+        "# TYPE interview_stage_seconds histogram",
+    ]
+    for stage, m in sorted(metrics.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS, m["buckets"]):
+            cumulative += count
+            lines.append(f'interview_stage_seconds_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+        lines.append(f'interview_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {m["count"]}')
+        lines.append(f'interview_stage_seconds_sum{{stage="{stage}"}} {m["seconds"]:.6f}')
+        lines.append(f'interview_stage_seconds_count{{stage="{stage}"}} {m["count"]}')
+    for key in ("errors",) + COUNTERS:
+        lines.append(f"# TYPE interview_stage_{key}_total counter")
+        for stage, m in sorted(metrics.items()):
+            lines.append(f'interview_stage_{key}_total{{stage="{stage}"}} {m[key]}')
+    with _lock:
+        lines.append("# TYPE interview_traced_sessions gauge")
+        lines.append(f"interview_traced_sessions {len(_sessions)}")
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_metrics_server(port=None, host="0.0.0.0"):
+    # /metrics 엔드포인트를 백그라운드 스레드로 실행 (프로세스당 한 번, port가 0이면 실행하지 않음)
+    global _server
+    port = TRACE_METRICS_PORT if port is None else port
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+if __name__ == "__main__":
+    import argparse
+    # 사용법: python tracing.py trace.jsonl [--session ID]  -> 단계별 지연/오류/토큰 요약
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="TRACE_PATH로 기록한 JSONL 파일")
+    parser.add_argument("--session", help="한 세션만 요약")
+    args = parser.parse_args()
+
+    spans = load(args.path)
+    if args.session:
+        spans = [s for s in spans if s["session"] == args.session]
+    print(f"{len(spans)} spans, {len({s['session'] for s in spans})} sessions")
+    print(f"{'stage':<22}{'count':>7}{'errors':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'tokens in/out':>16}{'bytes in/out':>20}")
+    for row in summarize(spans):
+        tokens = f"{row['prompt_tokens']}/{row['completion_tokens']}"
+        size = f"{row['bytes_in']}/{row['bytes_out']}"
+        print(f"{row['stage']:<22}{row['count']:>7}{row['errors']:>8}{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}{tokens:>16}{size:>20}")
+    errors = collections.Counter(s["error"] for s in spans if not s["ok"])
+    for error, count in errors.most_common(5):
+        print(f"  x{count} {error}")
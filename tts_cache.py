@@ -0,0 +1,130 @@
+import hashlib
+import os
+import threading
+from interview_phrases import welcome_message, next_question_message, INTERVIEWER_VOICES
+
+# TTS 오디오 디스크 캐시 (내용 주소 방식: text + voice + model 해시가 파일명)
+# 기출 문제의 고정 멘트(첫인사, "다음 질문")는 학생마다 동일하므로 한 번만 합성하면 됨
+TTS_CACHE_DIR = os.environ.get("TTS_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tts_cache"))
+TTS_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+
+_lock = threading.Lock()
+_total_bytes = None # 최초 접근 시 디렉터리를 스캔해서 계산
+
+def cache_key(text, voice, model):
+    raw = f"{model}\x00{voice}\x00{text}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+def _path(key):
+    return os.path.join(TTS_CACHE_DIR, key[:2], key + ".mp3")
+
+def _scan_entries():
+    entries = []
+    if not os.path.isdir(TTS_CACHE_DIR):
+        return entries
+    for root, _, files in os.walk(TTS_CACHE_DIR):
+        for name in files:
+            if name.endswith(".mp3"):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+def get(text, voice, model):
+    path = _path(cache_key(text, voice, model))
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    # LRU: 최근 사용 시각을 mtime으로 기록
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+def put(text, voice, model, audio_bytes):
+    global _total_bytes
+    path = _path(cache_key(text, voice, model))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체 (동시에 읽는 세션이 깨진 파일을 보지 않도록)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(audio_bytes)
+
+    with _lock:
+        if _total_bytes is None:
+            _total_bytes = sum(size for _, size, _ in _scan_entries())
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        _total_bytes += len(audio_bytes) - old_size
+        if _total_bytes > TTS_CACHE_MAX_BYTES:
+            _evict()
+
+def _evict():
+    # 오래 사용하지 않은 파일부터 삭제해서 최대 용량의 90%까지 줄임
+    global _total_bytes
+    entries = sorted(_scan_entries())
+    total = sum(size for _, size, _ in entries)
+    target = TTS_CACHE_MAX_BYTES * 0.9
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+    _total_bytes = total
+
+def stats():
+    entries = _scan_entries()
+    return {"entries": len(entries), "bytes": sum(size for _, size, _ in entries), "max_bytes": TTS_CACHE_MAX_BYTES}
+
+def interviewer_phrases(question_data):
+    # 기출 문제 하나에서 나오는 고정 멘트 목록 (app.py와 같은 문구)
+    questions = question_data.get("questions", [])
+    if not questions:
+        return []
+    phrases = [welcome_message(questions[0])]
+    phrases.extend(next_question_message(q) for q in questions[1:])
+    return phrases
+
+def prewarm(api_key, workers=4):
+    # 모든 기출 문제의 고정 멘트를 모든 면접관 목소리로 미리 합성
+    from concurrent.futures import ThreadPoolExecutor
+    from llm_manager import text_to_speech
+    import question_bank
+
+    jobs = []
+    for _, q_data in question_bank.iter_questions():
+        for text in interviewer_phrases(q_data):
+            for voice in INTERVIEWER_VOICES:
+                jobs.append((text, voice))
+
+    def render(job):
+        text, voice = job
+        text_to_speech(api_key, text, voice=voice, cache=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i, _ in enumerate(executor.map(render, jobs), 1):
+            print(f"\r[{i}/{len(jobs)}] rendered", end="", flush=True)
+    print()
+    return len(jobs)
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="TTS 오디오 캐시 관리")
+    parser.add_argument("--prewarm", action="store_true", help="모든 기출 문제 멘트를 모든 목소리로 미리 합성")
+    parser.add_argument("--api-key", default=os.environ.get("OPENAI_API_KEY"))
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.prewarm:
+        if not args.api_key:
+            print("Error: OPENAI_API_KEY가 필요합니다. (--api-key 또는 환경변수)")
+            raise SystemExit(1)
+        count = prewarm(args.api_key, workers=args.workers)
+        print(f"Pre-warmed {count} clips.")
+    print(stats())
@@ -1,141 +1,201 @@
 
+import hashlib
+import itertools
 import re
 import os
+from question_bank import stored_hashes, update_bank, write_bank
 
-def parse_markdown(file_path):
-    if not os.path.exists(file_path):
-        print(f"Error: {file_path} not found.")
-        return {}
-        
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+# Regex patterns
+year_pattern = re.compile(r'^##\s+(.*)')
+part_pattern = re.compile(r'^###\s+(.*)')
 
-    questions_db = {}
-    
+# Check for question line: * **질문 1**: or * **질문**:
+question_line_pattern = re.compile(r'^\*\s+\*\*질문(?:.*?)\*\*:\s*(.*)')
+
+def iter_problem_blocks(lines):
+    # 문제 하나(**[문제 N] ...** 부터 다음 문제/파트/연도 전까지)의 원본 줄을 묶어서 반환
+    # lines에 파일 핸들을 그대로 넘기면 파일 전체를 읽지 않고 문제 하나 분량만 메모리에 유지
     current_year = ""
     current_part = ""
-    current_problem_title = ""
-    current_context = []
-    current_questions = []
-    
-    # Regex patterns
-    year_pattern = re.compile(r'^##\s+(.*)')
-    part_pattern = re.compile(r'^###\s+(.*)')
-    
-    # Check for question line: * **질문 1**: or * **질문**:
-    question_line_pattern = re.compile(r'^\*\s+\*\*질문(?:.*?)\*\*:\s*(.*)')
-
-    def save_current_problem():
-        nonlocal current_problem_title, current_context, current_questions
-        if current_problem_title:
-            # Create a unique key
-            # Example: 2025 Part 1 - 문제 1 감염병...
-            # Simplify Part string
-            part_str = current_part.split(":")[0].replace("[", "").replace("]", "").strip()
-            if not part_str: part_str = "General"
-            
-            # Clean title
-            title_clean = current_problem_title.replace("**", "").strip()
-            # Extract number from title if possible like [문제 1]
-            # stored title usually is "[문제 1] Title"
-            
-            key = f"{current_year} {part_str} - {title_clean}"
-            
-            # context cleanup: remove > and spaces
-            cleaned_context = []
-            for line in current_context:
-                line_clean = line.strip()
-                if line_clean.startswith(">"):
-                    line_clean = line_clean.lstrip("> ").strip()
-                
-                # Convert **[제시문 X]** or **제시문** to ### Headers
-                if line_clean.startswith("**[제시문") or line_clean.startswith("**제시문"):
-                    # Remove trailing ** if present
-                    if line_clean.endswith("**"):
-                        line_clean = line_clean[:-2]
-                    # Remove leading **
-                    line_clean = line_clean.replace("**", "")
-                    # Add Header
-                    line_clean = f"### {line_clean}"
-
-                cleaned_context.append(line_clean)
-            
-            questions_db[key] = {
-                "title": f"{current_year} {current_part} - {title_clean}",
-                "context": "\n\n".join(cleaned_context).strip(),
-                "questions": list(current_questions),
-                "key_points": [
-                    "문제의 핵심 쟁점 파악 능력",
-                    "논리적 사고 및 근거 제시 능력",
-                    "윤리적 판단 및 가치관의 일관성",
-                    "의사소통 능력 및 태도"
-                ] 
-            }
+    block = None
 
     for line in lines:
-        line_stripped = line.strip()
-        
+        # 제시문 줄(>)이 대부분이므로 '#'으로 시작하는 줄만 정규식 검사
+        if not line.startswith("#"):
+            m_year = m_part = None
+        else:
+            m_year = year_pattern.match(line)
+            m_part = None if m_year else part_pattern.match(line)
+
         # Check Year
-        m_year = year_pattern.match(line)
         if m_year:
-            save_current_problem()
+            if block: yield block
             current_year = m_year.group(1).strip()
             current_part = ""
-            current_problem_title = ""
-            current_context = []
-            current_questions = []
+            block = None
             continue
 
         # Check Part
-        m_part = part_pattern.match(line)
         if m_part:
             # Usually part changes before problem, so save previous problem
-            save_current_problem()
+            if block: yield block
             current_part = m_part.group(1).strip()
-            current_problem_title = ""
-            current_context = []
-            current_questions = []
+            block = None
             continue
 
         # Check Problem Title
         # Format: **[문제 1] ...**
+        line_stripped = line.strip() if "**[문제" in line else ""
         if line_stripped.startswith("**[문제") and line_stripped.endswith("**"):
-            save_current_problem()
-            # Extract content
-            current_problem_title = line_stripped.strip("*")
-            current_context = []
-            current_questions = []
+            if block: yield block
+            block = {"year": current_year, "part": current_part, "title": line_stripped.strip("*"), "lines": []}
             continue
-            
+
+        if block is not None:
+            block["lines"].append(line)
+
+    # Save last
+    if block: yield block
+
+def problem_key(block):
+    # Create a unique key
+    # Example: 2025 Part 1 - 문제 1 감염병...
+    # Simplify Part string
+    part_str = block["part"].split(":")[0].replace("[", "").replace("]", "").strip()
+    if not part_str: part_str = "General"
+
+    # Clean title
+    title_clean = block["title"].replace("**", "").strip()
+    return f"{block['year']} {part_str} - {title_clean}"
+
+def block_hash(block):
+    # 원본 블록(연도·파트·제목·본문)의 해시 → 증분 갱신 시 바뀐 문제만 다시 파싱
+    raw = "\n".join([block["year"], block["part"], block["title"]] + block["lines"])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+def parse_block(block):
+    current_context = []
+    current_questions = []
+
+    for line in block["lines"]:
+        line_stripped = line.strip()
+
         # Check Questions
         m_q = question_line_pattern.match(line)
         if m_q:
             # Found a question
-            q_text = m_q.group(1).strip()
-            # In case the regex didn't capture full line if it's complex, mainly we want the text
-            # But wait, looking at file content: * **질문 1**: ...
-            # The regex ^\*\s+\*\*질문 should match.
             current_questions.append(line_stripped.replace("* **", "").replace("**:", ":").lstrip("* "))
             continue
-            
+
         # Context (lines starting with >)
         if line_stripped.startswith(">"):
             current_context.append(line) # keep line for now, clean later
-        elif current_problem_title:
-            # If we are in a problem block, non-empty lines might be context continuations 
-            # or spaces. If it's a list item not matched by question pattern?
-            # looking at file, questions are bullets.
-            pass
 
-    # Save last
-    save_current_problem()
+    title_clean = block["title"].replace("**", "").strip()
+
+    # context cleanup: remove > and spaces
+    cleaned_context = []
+    for line in current_context:
+        line_clean = line.strip()
+        if line_clean.startswith(">"):
+            line_clean = line_clean.lstrip("> ").strip()
+
+        # Convert **[제시문 X]** or **제시문** to ### Headers
+        if line_clean.startswith("**[제시문") or line_clean.startswith("**제시문"):
+            # Remove trailing ** if present
+            if line_clean.endswith("**"):
+                line_clean = line_clean[:-2]
+            # Remove leading **
+            line_clean = line_clean.replace("**", "")
+            # Add Header
+            line_clean = f"### {line_clean}"
 
-    return questions_db
+        cleaned_context.append(line_clean)
+
+    return {
+        "title": f"{block['year']} {block['part']} - {title_clean}",
+        "context": "\n\n".join(cleaned_context).strip(),
+        "questions": list(current_questions),
+        "key_points": [
+            "문제의 핵심 쟁점 파악 능력",
+            "논리적 사고 및 근거 제시 능력",
+            "윤리적 판단 및 가치관의 일관성",
+            "의사소통 능력 및 태도"
+        ]
+    }
+
+def iter_problems(lines):
+    # 문제 레코드를 하나씩 반환: (key, question_data)
+    for block in iter_problem_blocks(lines):
+        yield problem_key(block), parse_block(block)
+
+def _open_markdown(file_path):
+    if not os.path.exists(file_path):
+        print(f"Error: {file_path} not found.")
+        return None
+    return open(file_path, 'r', encoding='utf-8')
+
+def ingest(file_path, sink, *sink_args):
+    # problem.md를 스트리밍으로 파싱해서 sink로 전달
+    # sink: (key, question_data) 레코드 iterable을 받는 함수 (write_questions_py, question_bank.write_bank 등)
+    f = _open_markdown(file_path)
+    if f is None:
+        return None
+    with f:
+        return sink(iter_problems(f), *sink_args)
+
+def parse_markdown(file_path):
+    return ingest(file_path, dict) or {}
+
+def rebuild(file_path, bank_path):
+    # 전체 재작성 (블록 해시도 함께 저장해서 이후 증분 갱신에 사용)
+    f = _open_markdown(file_path)
+    if f is None:
+        return 0
+    hashes = {}
+    blocks = iter_problem_blocks(f)
+    first = next(blocks, None)
+    if first is None:
+        # 문제가 하나도 없으면 기존 저장소를 지우지 않음
+        f.close()
+        return 0
+
+    def records():
+        for block in itertools.chain([first], blocks):
+            key = problem_key(block)
+            hashes[key] = block_hash(block)
+            yield key, parse_block(block)
+
+    with f:
+        return write_bank(records(), bank_path, hashes)
+
+def update_incremental(file_path, bank_path):
+    # 저장된 블록 해시와 비교해서 추가·변경된 문제만 파싱하고 저장소에 반영
+    f = _open_markdown(file_path)
+    if f is None:
+        return None
+
+    known = stored_hashes(bank_path)
+    db, hashes = {}, {}
+    with f:
+        for block in iter_problem_blocks(f):
+            key = problem_key(block)
+            hashes[key] = block_hash(block)
+            # 변경 없는 문제는 None → 저장소의 기존 항목을 그대로 사용
+            db[key] = None if known.get(key) == hashes[key] else parse_block(block)
+    if not db:
+        # 문제가 하나도 없으면(빈 파일, 저장 도중의 잘린 파일 등) 기존 저장소를 지우지 않음
+        return None
+    return update_bank(db, bank_path, hashes)
 
 def write_questions_py(db, output_path):
+    # db: {key: question_data} 또는 (key, question_data) 레코드 iterable (iter_problems 결과를 바로 기록 가능)
+    records = db.items() if isinstance(db, dict) else db
+    count = 0
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write("QUESTIONS = {\n")
-        for key, data in db.items():
+        for key, data in records:
+            count += 1
             # Use repr for safe string encoding/escaping
             f.write(f'    "{key}": {{\n')
             f.write(f'        "title": {repr(data["title"])},\n')
@@ -150,15 +210,35 @@ def write_questions_py(db, output_path):
             f.write(f'        ]\n')
             f.write(f'    }},\n')
         f.write("}\n")
+    return count
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    # 기본은 증분 갱신 (추가·변경된 문제만 반영), --full이면 저장소 전체를 다시 씀
+    parser.add_argument("--full", action="store_true", help="저장소 전체 재작성")
+    parser.add_argument("--questions-py", metavar="PATH", help="예전 형식(questions.py)으로도 기록")
+    args = parser.parse_args()
+
     base_dir = r"c:\Users\hyoun\Projects\med_interview_bot"
     md_path = os.path.join(base_dir, "problem.md")
-    py_path = os.path.join(base_dir, "questions.py")
+    bank_path = os.path.join(base_dir, "questions.jsonl")
     
-    db = parse_markdown(md_path)
-    if db:
-        write_questions_py(db, py_path)
-        print(f"Successfully updated questions.py with {len(db)} problems.")
+    # 앱은 questions.jsonl + questions.index.json 저장소를 사용 (write_questions_py는 예전 형식)
+    if args.full:
+        count = rebuild(md_path, bank_path)
+        if count:
+            print(f"Successfully updated questions.jsonl with {count} problems.")
+        else:
+            print("No questions found or error parsing.")
     else:
-        print("No questions found or error parsing.")
+        changes = update_incremental(md_path, bank_path)
+        if changes is None and os.path.exists(md_path):
+            print("No questions found or error parsing. The bank was not changed.")
+        elif changes:
+            print(f"Updated questions.jsonl: {changes['added']} added, {changes['changed']} changed, "
+                  f"{changes['removed']} removed, {changes['unchanged']} unchanged.")
+
+    if args.questions_py:
+        count = ingest(md_path, write_questions_py, args.questions_py)
+        print(f"Wrote {count or 0} problems to {args.questions_py}.")
@@ -2,8 +2,15 @@
 import os
 import sys
 
-# Try to find API Key from environment or secrets
-api_key = os.environ.get("OPENAI_API_KEY")
+# --mock: 로컬 대역 서버(mock_openai_server)로 API 키 없이 실행 (python verify_gen.py --mock)
+if "--mock" in sys.argv:
+    from mock_openai_server import start_server
+    server, base_url = start_server()
+    os.environ["OPENAI_BASE_URL"] = base_url
+    api_key = "sk-mock"
+else:
+    # Try to find API Key from environment or secrets
+    api_key = os.environ.get("OPENAI_API_KEY")
 if not api_key:
     # Try loading from secrets.toml
     try:
@@ -25,6 +32,7 @@ if not api_key:
 if not api_key:
     print("Error: OPENAI_API_KEY not found in environment or .streamlit/secrets.toml")
     print("Please set the environment variable or ensure secrets.toml exists.")
+    print("(Or run offline against the local mock server: python verify_gen.py --mock)")
     sys.exit(1)
 
 from llm_manager import generate_dynamic_question